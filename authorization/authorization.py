@@ -6,6 +6,193 @@ MULTIPLIER = 1000000000000000000
 U_SECONDS_DAY = 86400000000  # Microseconds in a day.
 
 
+def pack_ints(values: list) -> bytes:
+    """
+    Packs a list of ints into bytes. Each int is stored as its length in
+    bytes followed by its signed big-endian representation.
+    """
+    data = b''
+    for value in values:
+        length = (value.bit_length() + 8) // 8
+        data += bytes([length]) + value.to_bytes(length, 'big', signed=True)
+    return data
+
+
+def unpack_ints(data: bytes, count: int) -> list:
+    """
+    Unpacks ints packed with pack_ints. Missing trailing values are returned
+    as 0, so fields can be appended to a packed layout later on.
+    """
+    values = []
+    offset = 0
+    while offset < len(data):
+        length = data[offset]
+        values.append(int.from_bytes(data[offset + 1:offset + 1 + length], 'big', signed=True))
+        offset += 1 + length
+    return values + [0] * (count - len(values))
+
+
+def pack_excess_entry(game: Address, excess: int) -> bytes:
+    """
+    Packs the excess of a game for an excess snapshot as the length of the
+    address in bytes, the address and the excess packed with pack_ints.
+    """
+    address = game.to_bytes()
+    return bytes([len(address)]) + address + pack_ints([excess])
+
+
+def unpack_excess_snapshot(data: bytes) -> tuple:
+    """
+    Unpacks an excess snapshot, which is the game developers amount packed
+    with pack_ints followed by the entries packed with pack_excess_entry.
+    Returns the amount and the list of (game, excess) tuples.
+    """
+    offset = 1 + data[0]
+    amount = unpack_ints(data[:offset], 1)[0]
+    entries = []
+    while offset < len(data):
+        length = data[offset]
+        game = Address.from_bytes(data[offset + 1:offset + 1 + length])
+        offset += 1 + length
+        excess_end = offset + 1 + data[offset]
+        entries.append((game, unpack_ints(data[offset:excess_end], 1)[0]))
+        offset = excess_end
+    return amount, entries
+
+
+def parse_bet(value) -> int:
+    """
+    Returns a bet limit of the proposal data as an int, or None if it is not
+    a number. Proposals may give the limits as floats or numeric strings.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                value = float(value)
+        if isinstance(value, float):
+            return int(value)
+    except (ValueError, OverflowError):
+        pass
+    return None
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Returns the index of a date counted in days since 1970-01-01.
+    """
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days: int) -> tuple:
+    """
+    Returns the (year, month, day) of a day index counted since 1970-01-01.
+    """
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + (3 if shifted_month < 10 else -9)
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+class GameLedger:
+    """
+    Wagers and payouts of a game on the last day it was played, together
+    with its running excess, the last day its excess was recorded for, the
+    loss it can still take on the day and the generation of the maximum
+    losses it was computed from, its cumulative wagers and payouts and
+    whether it is approved, stored as a single packed value.
+    """
+
+    def __init__(self, day: int = 0, wagers: int = 0, payouts: int = 0, excess: int = 0,
+                 settled_day: int = 0, headroom: int = 0, total_wagers: int = 0, total_payouts: int = 0,
+                 approved: bool = False, loss_generation: int = 0):
+        self.day = day
+        self.wagers = wagers
+        self.payouts = payouts
+        self.excess = excess
+        self.settled_day = settled_day
+        # Maximum loss of the game minus its payouts plus its wagers of the
+        # day. A payout reaching it would reach the maximum loss.
+        self.headroom = headroom
+        # Only differences of the totals are meaningful, they don't
+        # necessarily start from the game's first day.
+        self.total_wagers = total_wagers
+        self.total_payouts = total_payouts
+        # Copy of the game's status being gameApproved, so the accumulations
+        # don't read the status.
+        self.approved = approved
+        # The headroom is stale once the loss generation of the settings has
+        # moved past it, see Authorization._get_loss_headroom.
+        self.loss_generation = loss_generation
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'GameLedger':
+        if data is None:
+            return GameLedger()
+        values = unpack_ints(data, 10)
+        return GameLedger(*values[:8], values[8] != 0, values[9])
+
+    def to_bytes(self) -> bytes:
+        return pack_ints([self.day, self.wagers, self.payouts, self.excess, self.settled_day, self.headroom,
+                          self.total_wagers, self.total_payouts, int(self.approved), self.loss_generation])
+
+
+class Settings:
+    """
+    Settings read by the accumulations and settlements, stored together as
+    a single packed value so a call reads them at once: the roulette score,
+    the dividend changing time, whether the watch dog and the perf counters
+    are on, the schema version of the storage, the day being settled and
+    the generation of the maximum losses. Each of them is also kept in its own VarDB, which the packed value is
+    rebuilt from whenever one of them changes.
+    """
+
+    def __init__(self, roulette_score: Address = None, new_div_changing_time: int = 0,
+                 apply_watch_dog: bool = False, perf_counters_enabled: bool = False, schema_version: int = 0,
+                 settlement_day: int = 0, loss_generation: int = 0):
+        self.roulette_score = roulette_score
+        self.new_div_changing_time = new_div_changing_time
+        self.apply_watch_dog = apply_watch_dog
+        self.perf_counters_enabled = perf_counters_enabled
+        self.schema_version = schema_version
+        # 0 if no settlement is in progress.
+        self.settlement_day = settlement_day
+        # Incremented whenever the maximum loss of all the games changes.
+        self.loss_generation = loss_generation
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Settings':
+        if data is None:
+            return Settings()
+        offset = 1 + data[0]
+        roulette_score = Address.from_bytes(data[1:offset]) if offset > 1 else None
+        new_div_changing_time, apply_watch_dog, perf_counters_enabled, schema_version, settlement_day, \
+            loss_generation = unpack_ints(data[offset:], 6)
+        return Settings(roulette_score, new_div_changing_time, apply_watch_dog != 0, perf_counters_enabled != 0,
+                        schema_version, settlement_day, loss_generation)
+
+    def to_bytes(self) -> bytes:
+        address = self.roulette_score.to_bytes() if self.roulette_score is not None else b''
+        return bytes([len(address)]) + address + pack_ints(
+            [self.new_div_changing_time, int(self.apply_watch_dog), int(self.perf_counters_enabled),
+             self.schema_version, self.settlement_day, self.loss_generation])
+
+
 # An interface to get owner of the game's score
 class ScoreOwnerInterface(InterfaceScore):
     @interface
@@ -20,12 +207,47 @@ class Authorization(IconScoreBase):
     GAME_TYPE = ['Per wager settlement', 'Game defined interval settlement']
     STATUS_TYPE = ['waiting', 'proposalApproved', 'proposalRejected', 'gameReady',
                    'gameApproved', 'gameRejected', 'gameSuspended', 'gameDeleted']
+    # Maximum number of days a range query can cover.
+    MAX_DAY_RANGE = 31
+    # Maximum number of games a page can hold.
+    MAX_PAGE_SIZE = 100
+    # Periods the daily history can be compacted into.
+    ROLLUP_PERIODS = ['week', 'month']
+    # Minimum number of recent days kept when compacting the daily history.
+    MIN_RETENTION_DAYS = 31
+    # Number of days each game keeps its totals for. Rolling windows can be
+    # up to one day shorter.
+    ROLLING_SLOTS = 32
+    # Methods whose calls are counted while the perf counters are enabled.
+    # Readonly methods cannot write state, so they are not counted.
+    PERF_METHODS = ['accumulate_daily_wagers', 'accumulate_daily_payouts', 'accumulate_daily_batch',
+                    'record_excess', 'settle_excess', 'submit_game_proposal', 'set_game_ready',
+                    'set_game_status', 'set_games_status', 'set_maximum_payout', 'set_maximum_payouts',
+                    'set_maximum_loss', 'set_game_maximum_loss', 'set_new_div_changing_time',
+                    'toggle_apply_watch_dog_method', 'compact_history', 'migrate']
+    # Version of the storage layout written by this code, see _get_migrations.
+    SCHEMA_VERSION = 2
+    # Games migrated by on_update, the rest is left to the migrate method.
+    # Migrating a game played on each of the last ROLLING_SLOTS days takes
+    # about 85 reads and 46 writes, one with a single day of history about
+    # 85 reads and 15 writes, which keeps on_update within 4,300 reads and
+    # 2,400 writes.
+    MIGRATION_CHUNK = 50
     _ADMIN_LIST = 'admin_list'
+    _ADMIN_INDEX = 'admin_index'
     _SUPER_ADMIN = 'super_admin'
     _PROPOSAL_DATA = 'proposal_data'
     _PROPOSAL_LIST = 'proposal_list'
+    _PROPOSAL_REGISTRY = 'proposal_registry'
     _STATUS_DATA = 'status_data'
+    _STATUS_GAMES = 'status_games'
+    _STATUS_GAMES_INDEX = 'status_games_index'
     _OWNER_DATA = 'owner_data'
+    _GAME_NAMES = 'game_names'
+    _GAME_TYPES = 'game_types'
+    _MIN_BETS = 'min_bets'
+    _MAX_BETS = 'max_bets'
+    _REVSHARE_WALLETS = 'revshare_wallets'
     _ROULETTE_SCORE = 'roulette_score'
     _DAY = 'day'
     _PAYOUTS = 'payouts'
@@ -34,12 +256,46 @@ class Authorization(IconScoreBase):
     _GAME_DEVELOPERS_SHARE = "game_developers_share"
 
     _TODAYS_GAMES_EXCESS = "todays_games_excess"
+    _GAME_LEDGER = "game_ledger"
+    _POSITIVE_EXCESS = "positive_excess"
+    _DAILY_WAGERS_TOTAL = "daily_wagers_total"
+    _DAILY_PAYOUTS_TOTAL = "daily_payouts_total"
+    _TOTAL_SHARDS = "total_shards"
+    _SOURCE_LEDGERS = "source_ledgers"
+    _SHARD_SOURCES = "shard_sources"
+    _SHARD_SOURCE_INDEX = "shard_source_index"
+    _ACCUMULATORS = "accumulators"
+    _TOTALS_START_DAY = "totals_start_day"
     # dividends paid according to this excess
     _GAMES_EXCESS_HISTORY = "games_excess_history"
+    _SETTLEMENT_DAY = "settlement_day"
+    _SETTLEMENT_CURSOR = "settlement_cursor"
+    _SETTLEMENT_EXCESS = "settlement_excess"
+    _SETTLEMENT_CHUNKS = "settlement_chunks"
+    _SETTLEMENT_CHUNK_COUNT = "settlement_chunk_count"
+    _EXCESS_SNAPSHOTS = "excess_snapshots"
+    _RETENTION_DAYS = "retention_days"
+    _ROLLUP_PERIOD = "rollup_period"
+    _COMPACTION_START_DAY = "compaction_start_day"
+    _COMPACTED_UNTIL = "compacted_until"
+    _COMPACTION_CURSOR = "compaction_cursor"
+    _ROLLUPS = "rollups"
+    _ROLLING_SLOTS = "rolling_slots"
+    _ROLLING_START_DAY = "rolling_start_day"
 
     _APPLY_WATCH_DOG_METHOD = "apply_watch_dog_method"
     _MAXIMUM_PAYOUTS = "maximum_payouts"
     _MAXIMUM_LOSS = "maximum_loss"
+    _GAME_MAXIMUM_LOSSES = "game_maximum_losses"
+    _LOSS_GENERATION = "loss_generation"
+
+    _SCHEMA_VERSION = "schema_version"
+    _MIGRATION_DAY = "migration_day"
+    _MIGRATION_CURSOR = "migration_cursor"
+
+    _PERF_COUNTERS_ENABLED = "perf_counters_enabled"
+    _PERF_COUNTERS = "perf_counters"
+    _SETTINGS = "settings"
 
     def __init__(self, db: IconScoreDatabase) -> None:
         super().__init__(db)
@@ -49,24 +305,120 @@ class Authorization(IconScoreBase):
         self._roulette_score = VarDB(self._ROULETTE_SCORE, db, value_type=Address)
 
         self._admin_list = ArrayDB(self._ADMIN_LIST, db, value_type=Address)
+        # 1-based position of each admin in _admin_list, 0 if not an admin.
+        self._admin_index = DictDB(self._ADMIN_INDEX, db, value_type=int)
         self._super_admin = VarDB(self._SUPER_ADMIN, db, value_type=Address)
         self._proposal_data = DictDB(self._PROPOSAL_DATA, db, value_type=str)
         self._status_data = DictDB(self._STATUS_DATA, db, value_type=str)
+        # Games partitioned by status. A game's position in the ArrayDB of its
+        # current status is stored 1-based, so 0 means not indexed.
+        self._status_games = {}
+        self._status_games_index = DictDB(self._STATUS_GAMES_INDEX, db, value_type=int)
         self._owner_data = DictDB(self._OWNER_DATA, db, value_type=Address)
+        # Fields of the proposal data parsed at submission time.
+        self._game_names = DictDB(self._GAME_NAMES, db, value_type=str)
+        self._game_types = DictDB(self._GAME_TYPES, db, value_type=str)
+        self._min_bets = DictDB(self._MIN_BETS, db, value_type=int)
+        self._max_bets = DictDB(self._MAX_BETS, db, value_type=int)
+        self._revshare_wallets = DictDB(self._REVSHARE_WALLETS, db, value_type=Address)
         self._proposal_list = ArrayDB(self._PROPOSAL_LIST, db, value_type=Address)
+        # 1-based position of each game in _proposal_list and the time it was
+        # submitted at, packed. Games submitted before it was kept have 0 as
+        # submission time.
+        self._proposal_registry = DictDB(self._PROPOSAL_REGISTRY, db, value_type=bytes)
         self._day = VarDB(self._DAY, db, value_type=int)
         self._wagers = DictDB(self._WAGERS, db, value_type=int, depth=2)
         self._payouts = DictDB(self._PAYOUTS, db, value_type=int, depth=2)
 
         self._game_developers_share = VarDB(self._GAME_DEVELOPERS_SHARE, db, value_type=int)
         self._todays_games_excess = DictDB(self._TODAYS_GAMES_EXCESS, db, value_type=int)
+        # Latest day of each game. Earlier days are moved to _wagers and
+        # _payouts when the game is first played on a new day.
+        self._game_ledger = DictDB(self._GAME_LEDGER, db, value_type=bytes)
+        # Sum of the positive excess of the approved games, kept up to date on
+        # every change of a game's excess or of its approval. The changes made
+        # by the accumulations are kept in the ledgers of their sources
+        # instead, see _get_positive_excess.
+        self._positive_excess = VarDB(self._POSITIVE_EXCESS, db, value_type=int)
+        # Wagers and payouts of all games per day, tracked since _totals_start_day.
+        # They are the sum of these totals, written before the shards were
+        # kept, and of the shards of every source.
+        self._daily_wagers_total = DictDB(self._DAILY_WAGERS_TOTAL, db, value_type=int)
+        self._daily_payouts_total = DictDB(self._DAILY_PAYOUTS_TOTAL, db, value_type=int)
+        self._totals_start_day = VarDB(self._TOTALS_START_DAY, db, value_type=int)
+        # Wagers and payouts accumulated by each source per day, packed.
+        self._total_shards = DictDB(self._TOTAL_SHARDS, db, value_type=bytes, depth=2)
+        # Last day each source accumulated on, its wagers and payouts of that
+        # day and the change it has made to the positive excess, packed.
+        # Earlier days are moved to _total_shards when the source first
+        # accumulates on a new day.
+        self._source_ledgers = DictDB(self._SOURCE_LEDGERS, db, value_type=bytes)
+        # Every address which has been allowed to accumulate, so which may
+        # have shards, with its 1-based position in the ArrayDB returned by
+        # _get_shard_sources.
+        self._shard_sources = None
+        self._shard_source_index = DictDB(self._SHARD_SOURCE_INDEX, db, value_type=int)
+        # Scores allowed to accumulate besides the roulette score.
+        self._accumulators = DictDB(self._ACCUMULATORS, db, value_type=bool)
 
         self._new_div_changing_time = VarDB(self._NEW_DIV_CHANGING_TIME, db, value_type=int)
         self._games_excess_history = DictDB(self._GAMES_EXCESS_HISTORY, db, value_type=int, depth=2)
+        # Day whose excess is being recorded by a settlement in progress, 0 if
+        # none. The approved games are settled from the last one down, the
+        # ones below _settlement_cursor are still to be settled.
+        self._settlement_day = VarDB(self._SETTLEMENT_DAY, db, value_type=int)
+        self._settlement_cursor = VarDB(self._SETTLEMENT_CURSOR, db, value_type=int)
+        # Positive excess of the games settled so far.
+        self._settlement_excess = VarDB(self._SETTLEMENT_EXCESS, db, value_type=int)
+        # Entries of the games settled so far, packed with pack_excess_entry,
+        # one chunk for each call which settled games, indexed from 0.
+        self._settlement_chunks = DictDB(self._SETTLEMENT_CHUNKS, db, value_type=bytes)
+        self._settlement_chunk_count = VarDB(self._SETTLEMENT_CHUNK_COUNT, db, value_type=int)
+        # Excess of every game settled for the day and the game developers
+        # amount paid for it, packed, written once the settlement completes.
+        self._excess_snapshots = DictDB(self._EXCESS_SNAPSHOTS, db, value_type=bytes)
+        # Days older than _retention_days are folded into rollups per
+        # _rollup_period and game. Every day from _compaction_start_day to
+        # _compacted_until is compacted, and so are the games of the next
+        # period below _compaction_cursor in _proposal_list.
+        self._retention_days = VarDB(self._RETENTION_DAYS, db, value_type=int)
+        self._rollup_period = VarDB(self._ROLLUP_PERIOD, db, value_type=str)
+        self._compaction_start_day = VarDB(self._COMPACTION_START_DAY, db, value_type=int)
+        self._compacted_until = VarDB(self._COMPACTED_UNTIL, db, value_type=int)
+        self._compaction_cursor = VarDB(self._COMPACTION_CURSOR, db, value_type=int)
+        # Wagers, payouts, excess and positive excess of each game in each
+        # period, packed and keyed by the first day of the period.
+        self._rollups = DictDB(self._ROLLUPS, db, value_type=bytes, depth=2)
+        # Ring of the game's total wagers and payouts at the end of each of
+        # the last ROLLING_SLOTS days before its ledger's day, packed with
+        # the day and indexed by the day modulo ROLLING_SLOTS.
+        self._rolling_slots = DictDB(self._ROLLING_SLOTS, db, value_type=bytes, depth=2)
+        self._rolling_start_day = VarDB(self._ROLLING_START_DAY, db, value_type=int)
 
         self._apply_watch_dog_method = VarDB(self._APPLY_WATCH_DOG_METHOD, db, value_type=bool)
         self._maximum_payouts = DictDB(self._MAXIMUM_PAYOUTS, db, value_type=int)
         self._maximum_loss = VarDB(self._MAXIMUM_LOSS, db, value_type=int)
+        # Maximum loss of the games which don't use _maximum_loss.
+        self._game_maximum_losses = DictDB(self._GAME_MAXIMUM_LOSSES, db, value_type=int)
+        # Incremented by set_maximum_loss, so the loss headroom of every game
+        # is computed again when next needed.
+        self._loss_generation = VarDB(self._LOSS_GENERATION, db, value_type=int)
+
+        # Schema version of the stored data. The games of _proposal_list
+        # below _migration_cursor have been migrated to the next version by
+        # the migration started on _migration_day, 0 if none is started.
+        self._schema_version = VarDB(self._SCHEMA_VERSION, db, value_type=int)
+        self._migration_day = VarDB(self._MIGRATION_DAY, db, value_type=int)
+        self._migration_cursor = VarDB(self._MIGRATION_CURSOR, db, value_type=int)
+
+        self._perf_counters_enabled = VarDB(self._PERF_COUNTERS_ENABLED, db, value_type=bool)
+        # Calls and games iterated over of each method in PERF_METHODS, packed.
+        self._perf_counters = DictDB(self._PERF_COUNTERS, db, value_type=bytes)
+        # Copy of the settings read by the accumulations and settlements, see
+        # Settings. It is read at most once per call and cached meanwhile.
+        self._settings = VarDB(self._SETTINGS, db, value_type=bytes)
+        self._cached_settings = None
+        self._db = db
 
     @eventlog(indexed=2)
     def FundTransfer(self, recipient: Address, amount: int, note: str):
@@ -80,14 +432,382 @@ class Authorization(IconScoreBase):
     def GameSuspended(self, scoreAddress: Address, note: str):
         pass
 
+    @eventlog(indexed=2)
+    def WagersAccumulated(self, scoreAddress: Address, day: int, wagers: int, excess: int):
+        pass
+
+    @eventlog(indexed=2)
+    def PayoutAccumulated(self, scoreAddress: Address, day: int, payouts: int, excess: int):
+        pass
+
+    @eventlog(indexed=2)
+    def ExcessRecorded(self, scoreAddress: Address, day: int, excess: int):
+        pass
+
+    @eventlog(indexed=2)
+    def GameStatusChanged(self, scoreAddress: Address, status: str, oldStatus: str):
+        pass
+
+    @eventlog(indexed=1)
+    def WatchdogLimitsChanged(self, scoreAddress: Address, maximumPayout: int, maximumLoss: int,
+                              applied: bool):
+        pass
+
+    @eventlog(indexed=1)
+    def ExcessReset(self, day: int, newDivChangingTime: int):
+        pass
+
     def on_install(self) -> None:
         super().on_install()
         self._day.set(self.now() // U_SECONDS_DAY)
+        self._totals_start_day.set(self.now() // U_SECONDS_DAY)
+        self._rolling_start_day.set(self.now() // U_SECONDS_DAY)
+        self._schema_version.set(self.SCHEMA_VERSION)
+        self._store_settings()
 
     def on_update(self) -> None:
         super().on_update()
         self._day.set(self.now() // U_SECONDS_DAY)
         self._game_developers_share.set(20)
+        self._migrate(self.MIGRATION_CHUNK)
+        self._store_settings()
+
+    def _get_settings(self) -> Settings:
+        if self._cached_settings is None:
+            self._cached_settings = Settings.from_bytes(self._settings.get())
+        return self._cached_settings
+
+    def _store_settings(self) -> None:
+        """
+        Rebuilds the packed settings from their VarDBs. Every change of one
+        of them has to be followed by a call to this method.
+        :return:
+        """
+        settings = Settings(self._roulette_score.get(), self._new_div_changing_time.get(),
+                            self._apply_watch_dog_method.get(), self._perf_counters_enabled.get(),
+                            self._schema_version.get(), self._settlement_day.get(), self._loss_generation.get())
+        self._settings.set(settings.to_bytes())
+        self._cached_settings = settings
+
+    def _get_migrations(self) -> list:
+        """
+        Returns the migration to each schema version, the one at index i
+        bringing the storage from version i to version i + 1. A migration is
+        a tuple of a method run once before the games, one run for each game
+        in the proposal list with its 1-based position and one run once after
+        the games, or None if the games need no migration. The per game
+        method must leave a game it already migrated as it is, and gets 0 as
+        position when migrating a game ahead of the cursor, see _migrate_game.
+        :return: List of migrations
+        :rtype: list
+        """
+        return [(self._start_migration_v1, self._migrate_game_v1, self._finish_migration_v1),
+                (self._start_migration_v2, None, self._finish_migration_v2)]
+
+    def _migrate(self, _count: int) -> int:
+        """
+        Migrates up to _count games of the pending migrations, continuing
+        where the previous call stopped.
+        :param _count: Maximum number of games to migrate, None for all
+        :type _count: int
+        :return: Number of games migrated
+        :rtype: int
+        """
+        migrations = self._get_migrations()
+        migrated = 0
+        while self._schema_version.get() < self.SCHEMA_VERSION:
+            start, migrate_game, finish = migrations[self._schema_version.get()]
+            day = self._migration_day.get()
+            if day == 0:
+                day = self.now() // U_SECONDS_DAY
+                self._migration_day.set(day)
+                start(day)
+            position = self._migration_cursor.get()
+            games = len(self._proposal_list) if migrate_game is not None else 0
+            while position < games and (_count is None or migrated < _count):
+                position += 1
+                migrate_game(self._proposal_list[position - 1], position, day)
+                migrated += 1
+            self._migration_cursor.set(position)
+            if position < games:
+                break
+            finish(day)
+            self._migration_day.remove()
+            self._migration_cursor.remove()
+            self._schema_version.set(self._schema_version.get() + 1)
+            self._store_settings()
+        return migrated
+
+    def _is_migrating(self) -> bool:
+        return self._get_settings().schema_version != self.SCHEMA_VERSION
+
+    def _require_migrated(self) -> None:
+        if self._is_migrating():
+            revert('Storage migration in progress.')
+
+    def _migrate_game(self, _scoreAddress: Address) -> None:
+        """
+        Migrates a game ahead of the cursor of the pending migration, so the
+        accumulations can use the current storage layout for it. The cursor
+        completes the game when it reaches it.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :return:
+        """
+        migrate_game = self._get_migrations()[self._schema_version.get()][1]
+        # Addresses which were never submitted have nothing to migrate.
+        if migrate_game is not None and self._status_data[_scoreAddress] != '':
+            migrate_game(_scoreAddress, 0, self._migration_day.get())
+
+    @external
+    def migrate(self, _count: int) -> bool:
+        """
+        Migrates up to _count games of the storage left behind by an update
+        which could not migrate all of them. Until the migration is complete
+        the accumulations migrate the games they touch first, the settlements
+        migrate the games left in chunks before settling any, the getters of
+        the approved games, their excess, wagers and payouts read the games
+        not migrated yet as stored before the update, and the admin methods
+        and the other getters which need every game migrated revert.
+        :param _count: Maximum number of games to migrate
+        :type _count: int
+        :return: True if the storage is at the current schema version
+        :rtype: bool
+        """
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        if _count < 1:
+            revert('Count must be positive.')
+        migrated = self._migrate(_count)
+        self._record_perf('migrate', migrated)
+        return self._schema_version.get() == self.SCHEMA_VERSION
+
+    @external(readonly=True)
+    def get_migration_status(self) -> dict:
+        """
+        Returns the progress of the storage migration.
+        :return: Dictionary with the schema version of the storage, the
+                 current schema version, and the games of the proposal list
+                 and how many of them the pending migration has done
+        :rtype: dict
+        """
+        return {
+            'schemaVersion': self._schema_version.get(),
+            'targetVersion': self.SCHEMA_VERSION,
+            'migratedGames': self._migration_cursor.get(),
+            'games': len(self._proposal_list),
+        }
+
+    def _start_migration_v1(self, _day: int) -> None:
+        """
+        Deduplicates the admin list and stores the position of every admin in
+        the admin index, and starts tracking the daily totals and the
+        positive excess of the approved games unless already tracked.
+        :param _day: Day the migration started on
+        :type _day: int
+        :return:
+        """
+        admins = []
+        for address in self._admin_list:
+            if address not in admins:
+                admins.append(address)
+        if len(admins) != len(self._admin_list):
+            while len(self._admin_list) > 0:
+                self._admin_list.pop()
+            for address in admins:
+                self._admin_list.put(address)
+        for position, address in enumerate(admins, 1):
+            if self._admin_index[address] != position:
+                self._admin_index[address] = position
+
+        if self._totals_start_day.get() == 0:
+            self._daily_wagers_total[_day] = 0
+            self._daily_payouts_total[_day] = 0
+            self._positive_excess.set(0)
+
+    def _migrate_game_v1(self, _scoreAddress: Address, _position: int, _day: int) -> None:
+        """
+        Adds the game to the proposal registry and the status index, moves
+        its wagers, payouts and running excess of the day into its ledger,
+        parses its proposal data, adds it to the daily totals and the
+        positive excess, sets its loss headroom and fills its rolling slots
+        from its daily wagers and payouts of the last ROLLING_SLOTS days.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :param _position: 1-based position of the game in the proposal list
+        :type _position: int
+        :param _day: Day the migration started on
+        :type _day: int
+        :return:
+        """
+        entry = self._proposal_registry[_scoreAddress]
+        if entry is not None:
+            # A game migrated ahead of the cursor only lacks its position.
+            if _position != 0 and unpack_ints(entry, 2)[0] == 0:
+                self._proposal_registry[_scoreAddress] = pack_ints([_position, 0])
+            return
+        self._proposal_registry[_scoreAddress] = pack_ints([_position, 0])
+
+        status = self._status_data[_scoreAddress]
+        if status in self.STATUS_TYPE and self._status_games_index[_scoreAddress] == 0:
+            self._add_to_status_index(_scoreAddress, status)
+
+        if _scoreAddress not in self._game_ledger:
+            ledger = GameLedger(_day, self._wagers[_day][_scoreAddress], self._payouts[_day][_scoreAddress],
+                                self._todays_games_excess[_scoreAddress], approved=status == 'gameApproved')
+            if ledger.wagers != 0 or ledger.payouts != 0 or ledger.excess != 0 or ledger.approved:
+                self._game_ledger[_scoreAddress] = ledger.to_bytes()
+                self._todays_games_excess.remove(_scoreAddress)
+
+        if self._revshare_wallets[_scoreAddress] is None:
+            metadata = json_loads(self._proposal_data[_scoreAddress])
+            self._store_game_metadata(_scoreAddress, metadata,
+                                      Address.from_string(metadata['revShareWalletAddress']))
+
+        ledger = self._get_game_ledger(_scoreAddress)
+        if self._totals_start_day.get() == 0:
+            if ledger.day == _day:
+                self._daily_wagers_total[_day] += ledger.wagers
+                self._daily_payouts_total[_day] += ledger.payouts
+            if status == 'gameApproved' and ledger.excess > 0:
+                self._positive_excess.set(self._positive_excess.get() + ledger.excess)
+
+        if self._rolling_start_day.get() == 0:
+            self._seed_rolling_slots(_scoreAddress, _day)
+
+        self._refresh_loss_headroom(_scoreAddress)
+
+    def _seed_rolling_slots(self, _scoreAddress: Address, _day: int) -> None:
+        """
+        Fills the rolling slots of the game from its daily wagers and payouts
+        of the last ROLLING_SLOTS days before the day of its ledger, or before
+        _day if it has no ledger, and sets the totals of its ledger. The days
+        before its first wager or payout in that window get no slot, like the
+        days before a new game is first played. A game which has no ledger
+        but played in the window gets one for _day.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :param _day: Day the migration started on
+        :type _day: int
+        :return:
+        """
+        ledger = self._get_game_ledger(_scoreAddress)
+        has_ledger = ledger.day != 0
+        if not has_ledger:
+            ledger.day = _day
+        total_wagers = 0
+        total_payouts = 0
+        slots = self._rolling_slots[_scoreAddress]
+        for day in range(ledger.day - self.ROLLING_SLOTS, ledger.day):
+            total_wagers += self._wagers[day][_scoreAddress]
+            total_payouts += self._payouts[day][_scoreAddress]
+            if total_wagers != 0 or total_payouts != 0:
+                slots[day % self.ROLLING_SLOTS] = pack_ints([day, total_wagers, total_payouts])
+        if total_wagers == 0 and total_payouts == 0 and not has_ledger:
+            return
+        ledger.total_wagers = total_wagers + ledger.wagers
+        ledger.total_payouts = total_payouts + ledger.payouts
+        self._game_ledger[_scoreAddress] = ledger.to_bytes()
+
+    def _finish_migration_v1(self, _day: int) -> None:
+        """
+        Marks the daily totals and the rolling slots as tracked from the day
+        the migration started on.
+        :param _day: Day the migration started on
+        :type _day: int
+        :return:
+        """
+        if self._totals_start_day.get() == 0:
+            self._totals_start_day.set(_day)
+        if self._rolling_start_day.get() == 0:
+            self._rolling_start_day.set(_day)
+
+    def _start_migration_v2(self, _day: int) -> None:
+        """
+        Adds the roulette score to the sources of the daily totals shards.
+        :param _day: Day the migration started on
+        :type _day: int
+        :return:
+        """
+        roulette_score = self._roulette_score.get()
+        if roulette_score is not None:
+            self._add_shard_source(roulette_score)
+
+    def _finish_migration_v2(self, _day: int) -> None:
+        pass
+
+    def _is_submitted(self, _scoreAddress: Address) -> bool:
+        if _scoreAddress in self._proposal_registry:
+            return True
+        # Games the pending migration has not reached yet are not in the
+        # registry, but have had a status since their submission.
+        return self._is_migrating() and self._status_data[_scoreAddress] != ''
+
+    def _get_game_excess(self, _scoreAddress: Address) -> int:
+        """
+        Returns the running excess of the game, read from where the code
+        before the registry kept it for a game the pending migration has not
+        reached yet.
+        """
+        if self._is_migrating() and _scoreAddress not in self._proposal_registry:
+            return self._todays_games_excess[_scoreAddress]
+        return self._get_game_ledger(_scoreAddress).excess
+
+    def _get_status_games(self, _status: str) -> ArrayDB:
+        """
+        Returns the ArrayDB holding the games with the given status. The
+        ArrayDBs are cached since each of them keeps its own size.
+        :param _status: Status of the games
+        :type _status: str
+        :return: ArrayDB of games' Address
+        """
+        if _status not in self._status_games:
+            self._status_games[_status] = ArrayDB(f'{self._STATUS_GAMES}_{_status}', self._db,
+                                                  value_type=Address)
+        return self._status_games[_status]
+
+    def _add_to_status_index(self, _scoreAddress: Address, _status: str) -> None:
+        games = self._get_status_games(_status)
+        games.put(_scoreAddress)
+        self._status_games_index[_scoreAddress] = len(games)
+
+    def _remove_from_status_index(self, _scoreAddress: Address, _status: str) -> None:
+        position = self._status_games_index[_scoreAddress]
+        if position == 0:
+            return
+        games = self._get_status_games(_status)
+        top = games.pop()
+        if top != _scoreAddress:
+            games[position - 1] = top
+            self._status_games_index[top] = position
+        self._status_games_index.remove(_scoreAddress)
+
+    def _update_game_status(self, _scoreAddress: Address, _status: str, _old_status: str) -> None:
+        """
+        Sets the status of the game and moves it between the status indexes.
+        Every status transition has to go through this method.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :param _status: New status of the game
+        :type _status: str
+        :param _old_status: Current status of the game
+        :type _old_status: str
+        :return:
+        """
+        if _status != _old_status:
+            self.GameStatusChanged(_scoreAddress, _status, _old_status)
+            self._remove_from_status_index(_scoreAddress, _old_status)
+            self._add_to_status_index(_scoreAddress, _status)
+            if _status == 'gameApproved' or _old_status == 'gameApproved':
+                ledger = self._get_game_ledger(_scoreAddress)
+                ledger.approved = _status == 'gameApproved'
+                self._game_ledger[_scoreAddress] = ledger.to_bytes()
+                excess = ledger.excess
+                if excess > 0:
+                    if _status != 'gameApproved':
+                        excess = -excess
+                    self._positive_excess.set(self._positive_excess.get() + excess)
+        self._status_data[_scoreAddress] = _status
 
     @external
     def untether(self) -> None:
@@ -105,16 +825,26 @@ class Authorization(IconScoreBase):
     def set_new_div_changing_time(self, _timestamp: int) -> None:
         """
         Sets the equivalent time of 00:00 UTC of dividend structure changing
-        date in microseconds timestamp.
+        date in microseconds timestamp. The excess of every approved game is
+        reset to 0, which an ExcessReset eventlog records.
         :param _timestamp: Timestamp of 00:00 UTC of dividend structure changing
                            date in microseconds timestamp
         :type _timestamp: int
         :return:
         """
         if self.msg.sender == self.owner:
+            self._require_migrated()
             self._new_div_changing_time.set(_timestamp)
-            for game in self.get_approved_games():
-                self._todays_games_excess.remove(game)
+            self._store_settings()
+            approved_games = self.get_approved_games()
+            for game in approved_games:
+                ledger = self._get_game_ledger(game)
+                if ledger.excess != 0:
+                    ledger.excess = 0
+                    self._game_ledger[game] = ledger.to_bytes()
+            self._reset_positive_excess()
+            self.ExcessReset(self.now() // U_SECONDS_DAY, _timestamp)
+            self._record_perf('set_new_div_changing_time', len(approved_games))
 
     @external(readonly=True)
     def get_new_div_changing_time(self) -> int:
@@ -136,6 +866,8 @@ class Authorization(IconScoreBase):
         if self.msg.sender != self.owner:
             revert(f'This function can only be called from the GAS owner.')
         self._roulette_score.set(_scoreAddress)
+        self._store_settings()
+        self._add_shard_source(_scoreAddress)
 
     @external(readonly=True)
     def get_roulette_score(self) -> Address:
@@ -146,6 +878,126 @@ class Authorization(IconScoreBase):
         """
         return self._roulette_score.get()
 
+    @external
+    def add_accumulator(self, _scoreAddress: Address) -> None:
+        """
+        Allows a score to accumulate wagers and payouts besides the roulette
+        score, into its own shard of the daily totals.
+        :param _scoreAddress: Address of the accumulator score
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :return:
+        """
+        if self.msg.sender != self.owner:
+            revert(f'This function can only be called from the GAS owner.')
+        if self._accumulators[_scoreAddress]:
+            revert(f'{_scoreAddress} is already an accumulator.')
+        self._accumulators[_scoreAddress] = True
+        self._add_shard_source(_scoreAddress)
+
+    @external
+    def remove_accumulator(self, _scoreAddress: Address) -> None:
+        """
+        Stops a score from accumulating. Its shards still count towards the
+        daily totals.
+        :param _scoreAddress: Address of the accumulator score
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :return:
+        """
+        if self.msg.sender != self.owner:
+            revert(f'This function can only be called from the GAS owner.')
+        if not self._accumulators[_scoreAddress]:
+            revert(f'{_scoreAddress} is not an accumulator.')
+        self._accumulators.remove(_scoreAddress)
+
+    @external(readonly=True)
+    def get_accumulators(self) -> list:
+        """
+        Returns the scores allowed to accumulate besides the roulette score.
+        :return: List of accumulator scores' address
+        :rtype: list
+        """
+        accumulators = []
+        for source in self._get_shard_sources():
+            if self._accumulators[source]:
+                accumulators.append(source)
+        return accumulators
+
+    def _get_shard_sources(self) -> ArrayDB:
+        """
+        Returns the ArrayDB of the shard sources. It is only created when
+        needed, since an ArrayDB reads its size when created and the
+        accumulations don't use it.
+        :return: ArrayDB of sources' Address
+        """
+        if self._shard_sources is None:
+            self._shard_sources = ArrayDB(self._SHARD_SOURCES, self._db, value_type=Address)
+        return self._shard_sources
+
+    def _add_shard_source(self, _source: Address) -> None:
+        if self._shard_source_index[_source] == 0:
+            sources = self._get_shard_sources()
+            sources.put(_source)
+            self._shard_source_index[_source] = len(sources)
+
+    def _accumulate_source(self, _source: Address, _day: int, _wagers: int, _payouts: int,
+                           _positive_excess_change: int) -> None:
+        """
+        Adds the amounts of an accumulation to the ledger of its source. The
+        wagers and payouts of an earlier day in the ledger are moved to the
+        source's shard of that day first.
+        :param _source: Address of the score which accumulated
+        :type _source: :class:`iconservice.base.address.Address`
+        :param _day: Index of the current day
+        :type _day: int
+        :param _positive_excess_change: Change of the positive excess of the
+                                        approved games made by the accumulation
+        :type _positive_excess_change: int
+        :return:
+        """
+        day, wagers, payouts, positive_excess = unpack_ints(self._source_ledgers[_source] or b'', 4)
+        if day != _day:
+            if wagers != 0 or payouts != 0:
+                self._total_shards[_source][day] = pack_ints([wagers, payouts])
+            day, wagers, payouts = _day, 0, 0
+        self._source_ledgers[_source] = pack_ints([day, wagers + _wagers, payouts + _payouts,
+                                                   positive_excess + _positive_excess_change])
+
+    def _get_source_totals(self, _source: Address, _day: int) -> list:
+        """
+        Returns the wagers and payouts the source accumulated on the day, or
+        None if it accumulated nothing on it.
+        """
+        day, wagers, payouts, _ = unpack_ints(self._source_ledgers[_source] or b'', 4)
+        if day == _day:
+            return [wagers, payouts]
+        shard = self._total_shards[_source][_day]
+        return unpack_ints(shard, 2) if shard is not None else None
+
+    def _get_positive_excess(self) -> int:
+        """
+        Returns the sum of the positive excess of the approved games, which is
+        _positive_excess plus the changes made by the accumulations of every
+        source.
+        """
+        positive_excess = self._positive_excess.get()
+        for source in self._get_shard_sources():
+            positive_excess += unpack_ints(self._source_ledgers[source] or b'', 4)[3]
+        return positive_excess
+
+    def _reset_positive_excess(self) -> None:
+        for source in self._get_shard_sources():
+            source_ledger = self._source_ledgers[source]
+            if source_ledger is not None:
+                day, wagers, payouts, positive_excess = unpack_ints(source_ledger, 4)
+                if positive_excess != 0:
+                    self._source_ledgers[source] = pack_ints([day, wagers, payouts, 0])
+        self._positive_excess.set(0)
+
+    def _require_accumulator(self) -> None:
+        sender = self.msg.sender
+        if sender != self._get_settings().roulette_score and not self._accumulators[sender]:
+            revert(f'Only roulette score or an accumulator can invoke this method.')
+
     @external
     def set_game_developers_share(self, _share: int) -> None:
         """
@@ -178,7 +1030,7 @@ class Authorization(IconScoreBase):
         """
         if self.msg.sender == self.owner:
             self._super_admin.set(_super_admin)
-            self._admin_list.put(_super_admin)
+            self._add_admin(_super_admin)
 
     @external(readonly=True)
     def get_super_admin(self) -> Address:
@@ -200,7 +1052,15 @@ class Authorization(IconScoreBase):
         :return:
         """
         if self.msg.sender == self._super_admin.get():
+            self._add_admin(_admin)
+
+    def _add_admin(self, _admin: Address) -> None:
+        if self._admin_index[_admin] == 0:
             self._admin_list.put(_admin)
+            self._admin_index[_admin] = len(self._admin_list)
+
+    def _is_admin(self, _address: Address) -> bool:
+        return self._admin_index[_address] != 0
 
     @external(readonly=True)
     def get_admin(self) -> list:
@@ -225,13 +1085,14 @@ class Authorization(IconScoreBase):
         :return:
         """
         if self.msg.sender == self.get_super_admin():
-            if _admin not in self._admin_list:
+            position = self._admin_index[_admin]
+            if position == 0:
                 revert('Invalid address: not in list')
             top = self._admin_list.pop()
             if top != _admin:
-                for i in range(len(self._admin_list)):
-                    if self._admin_list[i] == _admin:
-                        self._admin_list[i] = top
+                self._admin_list[position - 1] = top
+                self._admin_index[top] = position
+            self._admin_index.remove(_admin)
             if DEBUG is True:
                 Logger.debug(f'{_admin} has been removed from admin list', TAG)
 
@@ -267,24 +1128,51 @@ class Authorization(IconScoreBase):
         """
         if self.msg.value != 50 * MULTIPLIER:
             revert(f'50 ICX is required for submitting game proposal')
+        self._require_migrated()
         metadata = json_loads(_gamedata)
-        self._check_game_metadata(metadata)
-        score_at_address = self.create_interface_score(Address.from_string(metadata['scoreAddress']),
-                                                       ScoreOwnerInterface)
+        score_address, revshare_wallet = self._check_game_metadata(metadata)
+        if self._is_submitted(score_address):
+            revert(f'Already listed scoreAddress in the proposal list.')
+        score_at_address = self.create_interface_score(score_address, ScoreOwnerInterface)
 
         if self.msg.sender != score_at_address.get_score_owner():
             revert('Owner not matched')
-        self.ProposalSubmitted(self.msg.sender, Address.from_string(metadata['scoreAddress']))
-        if Address.from_string(metadata['scoreAddress']) in self._proposal_list:
-            revert(f'Already listed scoreAddress in the proposal list.')
-        self._proposal_list.put(Address.from_string(metadata['scoreAddress']))
-        self._owner_data[Address.from_string(metadata['scoreAddress'])] = self.msg.sender
+        self.ProposalSubmitted(self.msg.sender, score_address)
+        self._proposal_list.put(score_address)
+        self._proposal_registry[score_address] = pack_ints([len(self._proposal_list), self.now()])
+        self._owner_data[score_address] = self.msg.sender
+
+        self._update_game_status(score_address, 'waiting', '')
+        self._proposal_data[score_address] = _gamedata
+        self._store_game_metadata(score_address, metadata, revshare_wallet)
 
-        self._status_data[Address.from_string(metadata['scoreAddress'])] = 'waiting'
-        self._proposal_data[Address.from_string(metadata['scoreAddress'])] = _gamedata
+        if self._get_settings().apply_watch_dog:
+            self._maximum_payouts[score_address] = metadata['maxPayout']
+            self.WatchdogLimitsChanged(score_address, metadata['maxPayout'], self._maximum_loss.get(), True)
+        self._record_perf('submit_game_proposal', 0)
 
-        if self._apply_watch_dog_method.get():
-            self._maximum_payouts[Address.from_string(metadata['scoreAddress'])] = metadata['maxPayout']
+    def _store_game_metadata(self, _scoreAddress: Address, _metadata: dict, _revshare_wallet: Address) -> None:
+        """
+        Stores the fields of the proposal data which are read by other methods,
+        so they don't need to parse the proposal data again. Bet limits which
+        are not numbers are left unset.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :param _metadata: Parsed proposal data of the game
+        :type _metadata: dict
+        :param _revshare_wallet: Parsed revenue share wallet address
+        :type _revshare_wallet: :class:`iconservice.base.address.Address`
+        :return:
+        """
+        self._game_names[_scoreAddress] = _metadata['name']
+        self._game_types[_scoreAddress] = _metadata['gameType']
+        min_bet = parse_bet(_metadata['minBet'])
+        if min_bet is not None:
+            self._min_bets[_scoreAddress] = min_bet
+        max_bet = parse_bet(_metadata['maxBet'])
+        if max_bet is not None:
+            self._max_bets[_scoreAddress] = max_bet
+        self._revshare_wallets[_scoreAddress] = _revshare_wallet
 
     @external
     def set_game_status(self, _status: str, _scoreAddress: Address) -> None:
@@ -296,21 +1184,87 @@ class Authorization(IconScoreBase):
         :type _scoreAddress: :class:`iconservice.base.address.Address`
         :return:
         """
-        if self.msg.sender not in self.get_admin():
+        if not self._is_admin(self.msg.sender):
             revert('Sender not an admin')
+        self._require_migrated()
+        old_status = self._status_data[_scoreAddress]
+        error = self._check_status_change(_status, old_status)
+        if error:
+            revert(error)
+
+        self._update_game_status(_scoreAddress, _status, old_status)
+        self._record_perf('set_game_status', 1)
+
+    def _check_status_change(self, _status: str, _old_status: str) -> str:
+        """
+        Checks if an admin may change the status of a game from its current
+        status.
+        :param _status: New status of the game
+        :type _status: str
+        :param _old_status: Current status of the game
+        :type _old_status: str
+        :return: Reason the change is not allowed, empty if it is allowed
+        :rtype: str
+        """
         if _status not in self.STATUS_TYPE:
-            revert('Invalid status')
-        if _status == 'gameRejected' and self._status_data[_scoreAddress] != 'gameReady':
-            revert(f'This game cannot be rejected from state {self._status_data[_scoreAddress]}')
-        if _status == 'gameApproved' and not (self._status_data[_scoreAddress] == 'gameReady'
-                                              or self._status_data[_scoreAddress] == 'gameSuspended'):
-            revert(f'This game cannot be approved from state {self._status_data[_scoreAddress]}')
-        if _status == 'gameSuspended' and self._status_data[_scoreAddress] != 'gameApproved':
-            revert('Only approved games may be suspended.')
-        if _status == 'gameDeleted' and self._status_data[_scoreAddress] != 'gameSuspended':
-            revert('Only suspended games may be deleted.')
+            return 'Invalid status'
+        if _status == 'gameRejected' and _old_status != 'gameReady':
+            return f'This game cannot be rejected from state {_old_status}'
+        if _status == 'gameApproved' and not (_old_status == 'gameReady'
+                                              or _old_status == 'gameSuspended'):
+            return f'This game cannot be approved from state {_old_status}'
+        if _status == 'gameSuspended' and _old_status != 'gameApproved':
+            return 'Only approved games may be suspended.'
+        if _status == 'gameDeleted' and _old_status != 'gameSuspended':
+            return 'Only suspended games may be deleted.'
+        return ''
+
+    def _parse_admin_batch(self, _entries: str) -> list:
+        """
+        Parses a JSON list of [game, value] pairs of a bulk admin operation.
+        :param _entries: JSON list of [game, value] pairs, where game is the
+                         score address as a string
+        :type _entries: str
+        :return: List of (game, value) tuples
+        :rtype: list
+        """
+        entries = json_loads(_entries)
+        if not isinstance(entries, list):
+            revert('Entries must be a list.')
+        parsed_entries = []
+        for entry in entries:
+            if not isinstance(entry, list) or len(entry) != 2 or not isinstance(entry[0], str):
+                revert(f'Invalid entry: {entry}')
+            parsed_entries.append((Address.from_string(entry[0]), entry[1]))
+        return parsed_entries
 
-        self._status_data[_scoreAddress] = _status
+    @external
+    def set_games_status(self, _changes: str) -> list:
+        """
+        Admin can change the status of several games in one call. Every
+        change is checked like in set_game_status against the status the
+        game has at that point of the batch, so a game may appear more than
+        once. A change which is not allowed is skipped and does not revert
+        the rest of the batch.
+        :param _changes: JSON list of [game, status] pairs, where game is the
+                         score address as a string
+        :type _changes: str
+        :return: Result of each change, empty if it was applied and the
+                 reason it was not allowed otherwise
+        :rtype: list
+        """
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        self._require_migrated()
+        results = []
+        for game, status in self._parse_admin_batch(_changes):
+            old_status = self._status_data[game]
+            error = self._check_status_change(status, old_status)
+            if not error:
+                self._update_game_status(game, status, old_status)
+            results.append(error)
+        self._record_perf('set_games_status', len(results))
+        return results
 
     @external
     def set_game_ready(self, _scoreAddress: Address) -> None:
@@ -323,21 +1277,24 @@ class Authorization(IconScoreBase):
         """
         if self.msg.sender != self._owner_data[_scoreAddress]:
             revert('Sender not the owner of SCORE ')
-        self._status_data[_scoreAddress] = 'gameReady'
+        self._require_migrated()
+        self._update_game_status(_scoreAddress, 'gameReady', self._status_data[_scoreAddress])
+        self._record_perf('set_game_ready', 1)
 
-    def _check_game_metadata(self, _metadata: dict):
+    def _check_game_metadata(self, _metadata: dict) -> tuple:
         """
         Sanity checks for the game metadata
         :param _metadata: JSON metadata of the game
         :type _metadata: dict
-        :return:
+        :return: Score address and revenue share wallet address of the game
+        :rtype: tuple
         """
         # All fields should be provided
         for field in self.METADATA_FIELDS:
             if field not in _metadata:
                 revert(f'There is no {field} for the game')
 
-        if self._apply_watch_dog_method.get():
+        if self._get_settings().apply_watch_dog:
             if 'maxPayout' not in _metadata:
                 revert(f'There is no maxPayout for the game')
 
@@ -349,10 +1306,9 @@ class Authorization(IconScoreBase):
             revert('Game name cant be empty')
 
         # check if scoreAddress is a valid contract address
-        if _metadata['scoreAddress'] != '':
-            _scoreAddress = Address.from_string(_metadata['scoreAddress'])
-            if not _scoreAddress.is_contract:
-                revert(f'{_scoreAddress} is not a valid contract address')
+        _scoreAddress = Address.from_string(_metadata['scoreAddress'])
+        if not _scoreAddress.is_contract:
+            revert(f'{_scoreAddress} is not a valid contract address')
 
         # Check if minbet is within defined limit of 0.1 ICX
         if _metadata['minBet'] < 100000000000000000:  # 0.1 ICX = 10^18 * 0.1
@@ -372,25 +1328,118 @@ class Authorization(IconScoreBase):
         except BaseException as e:
             Logger.debug(f'Failed. Exception: {e}', TAG)
             revert('Invalid address')
+        return _scoreAddress, revWalletAddress
 
     @external
     def accumulate_daily_wagers(self, game: Address, wager: int) -> None:
         """
         Accumulates daily wagers of the game. Updates the excess of the game.
-        Only roulette score can call this function.
+        Only roulette score and the accumulators can call this function.
         :param game: Address of the game
         :type game: :class:`iconservice.base.address.Address`
         :param wager: Wager amount of the game
         :type wager: int
         :return:
         """
-        if self.msg.sender != self._roulette_score.get():
-            revert(f'Only roulette score can invoke this method.')
-        day = (self.now() // U_SECONDS_DAY)
-        self._wagers[day][game] += wager
-        if (self._new_div_changing_time.get() is not None
-            and self.now() >= self._new_div_changing_time.get()):
-            self._todays_games_excess[game] += wager
+        self._require_accumulator()
+        self._accumulate([(game, wager, None)], False)
+        self._record_perf('accumulate_daily_wagers', 1)
+
+    def _is_excess_tracked(self) -> bool:
+        """
+        Returns True if the excess of the games is being tracked, i.e. the new
+        dividend structure has come into effect.
+        :return: Whether wagers and payouts update the games' excess
+        :rtype: bool
+        """
+        return self.now() >= self._get_settings().new_div_changing_time
+
+    def _get_game_ledger(self, game: Address) -> GameLedger:
+        return GameLedger.from_bytes(self._game_ledger[game])
+
+    def _get_days_game_ledger(self, game: Address, day: int) -> GameLedger:
+        """
+        Returns the ledger of the game for the given day. If the ledger still
+        holds an earlier day, its wagers and payouts are written to the
+        day-indexed history and a ledger for the day is started, carrying over
+        the excess. The caller stores the returned ledger.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :param day: Index of the current day
+        :type day: int
+        :return: Ledger of the game for the day
+        :rtype: GameLedger
+        """
+        ledger = self._get_game_ledger(game)
+        if ledger.day != day:
+            if ledger.wagers != 0:
+                self._wagers[ledger.day][game] = ledger.wagers
+            if ledger.payouts != 0:
+                self._payouts[ledger.day][game] = ledger.payouts
+            # Until its first wager or payout a game has nothing to roll.
+            if ledger.total_wagers != 0 or ledger.total_payouts != 0:
+                slots = self._rolling_slots[game]
+                for slot_day in range(max(ledger.day, day - self.ROLLING_SLOTS), day):
+                    slots[slot_day % self.ROLLING_SLOTS] = pack_ints(
+                        [slot_day, ledger.total_wagers, ledger.total_payouts])
+            ledger = GameLedger(day, 0, 0, ledger.excess, ledger.settled_day, self._get_maximum_loss(game),
+                                ledger.total_wagers, ledger.total_payouts, ledger.approved,
+                                self._get_settings().loss_generation)
+        return ledger
+
+    def _get_maximum_loss(self, game: Address) -> int:
+        maximum_loss = self._game_maximum_losses[game]
+        if maximum_loss == 0:
+            maximum_loss = self._maximum_loss.get()
+        return maximum_loss
+
+    def _refresh_loss_headroom(self, game: Address) -> None:
+        """
+        Recomputes today's loss headroom of the game after its maximum loss
+        has changed. Ledgers of earlier days get theirs when next played.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :return:
+        """
+        ledger = self._get_game_ledger(game)
+        if ledger.day != self.now() // U_SECONDS_DAY:
+            return
+        headroom = self._get_maximum_loss(game) - ledger.payouts + ledger.wagers
+        loss_generation = self._get_settings().loss_generation
+        if ledger.headroom != headroom or ledger.loss_generation != loss_generation:
+            ledger.headroom = headroom
+            ledger.loss_generation = loss_generation
+            self._game_ledger[game] = ledger.to_bytes()
+
+    def _get_loss_headroom(self, game: Address, ledger: GameLedger) -> int:
+        """
+        Returns the loss headroom of today's ledger of the game, computing it
+        again from the maximum loss of the game if the maximum loss of all the
+        games has changed since. The caller stores the ledger.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :param ledger: Ledger of the game for today
+        :type ledger: GameLedger
+        :return: Loss the game can still take today
+        :rtype: int
+        """
+        loss_generation = self._get_settings().loss_generation
+        if ledger.loss_generation != loss_generation:
+            ledger.headroom = self._get_maximum_loss(game) - ledger.payouts + ledger.wagers
+            ledger.loss_generation = loss_generation
+        return ledger.headroom
+
+    def _get_daily_wager(self, game: Address, day: int) -> int:
+        ledger = self._get_game_ledger(game)
+        if ledger.day == day:
+            return ledger.wagers
+        return self._wagers[day][game]
+
+    def _get_daily_payout(self, game: Address, day: int) -> int:
+        ledger = self._get_game_ledger(game)
+        if ledger.day == day:
+            return ledger.payouts
+        return self._payouts[day][game]
 
     @external(readonly=True)
     def get_daily_wagers(self, day: int = 0) -> dict:
@@ -404,46 +1453,184 @@ class Authorization(IconScoreBase):
         """
         if day < 1:
             day += (self.now() // U_SECONDS_DAY)
+        rollup_start = self._get_compacted_rollup(day)
+        if rollup_start != -1:
+            return {'compacted': f'{rollup_start}'}
         wagers = {}
         for game in self.get_approved_games():
-            wagers[str(game)] = f'{self._wagers[day][game]}'
+            wagers[str(game)] = f'{self._get_daily_wager(game, day)}'
         return wagers
 
     @external
     def accumulate_daily_payouts(self, game: Address, payout: int) -> bool:
         """
         Accumulates daily payouts of the game. Updates the excess of the game.
-        Only roulette score can call this function.
+        Only roulette score and the accumulators can call this function.
         :param game: Address of the game
         :type game: :class:`iconservice.base.address.Address`
         :param payout: Payout amount of the game
         :type payout: int
         :return:
         """
-        if self.msg.sender != self._roulette_score.get():
-            revert(f'Only roulette score can invoke this method.')
+        self._require_accumulator()
+        result = self._accumulate([(game, 0, payout)], self._get_settings().apply_watch_dog)[0]
+        self._record_perf('accumulate_daily_payouts', 1)
+        return result
+
+    def _accumulate(self, _entries: list, _watch_dog: bool) -> list:
+        """
+        Applies (game, wager, payout) entries to the ledgers of the games, the
+        daily totals and the positive excess of the approved games. A payout
+        of None means the entry has no payout. Each ledger and aggregate is
+        written once, however many entries touch it. While a storage migration
+        is pending, the games are migrated before their first entry.
+        :param _entries: List of (game, wager, payout) tuples
+        :type _entries: list
+        :param _watch_dog: Whether the watch dog limits are applied
+        :type _watch_dog: bool
+        :return: Result of each entry, False if its payout was refused
+        :rtype: list
+        """
         day = (self.now() // U_SECONDS_DAY)
-
-        if self._apply_watch_dog_method.get():
-            try:
-                if payout > self._maximum_payouts[game]:
-                    revert(f'Preventing Overpayment. Requested payout: {payout}. MaxPayout for this game: '
-                           f'{self._maximum_payouts[game]}. {TAG}')
-
-                if self._payouts[day][game] + payout - self._wagers[day][game] >= self._maximum_loss.get():
-                    revert(f'Limit loss. MaxLoss: {self._maximum_loss.get()}. Loss Incurred if payout: '
-                           f'{self._payouts[day][game] + payout - self._wagers[day][game]}, {TAG}')
-            except BaseException as e:
-                self._status_data[game] = 'gameSuspended'
-                self.GameSuspended(game, str(e))
+        track_excess = self._is_excess_tracked()
+        settlement_day = self._get_settings().settlement_day
+        if settlement_day != 0:
+            settlement_cursor = self._settlement_cursor.get()
+        migrating = self._is_migrating()
+        ledgers = {}
+        # Wagers and payouts of each game for the day before the entries.
+        initial = {}
+        wagers = 0
+        payouts = 0
+        positive_excess_change = 0
+        settled_excess = 0
+        snapshot = []
+        results = []
+        for game, wager, payout in _entries:
+            if game not in ledgers:
+                if migrating:
+                    self._migrate_game(game)
+                ledger = self._get_days_game_ledger(game, day)
+                # A game still to be settled is settled before today's
+                # amounts change its excess.
+                if (settlement_day != 0 and ledger.settled_day != settlement_day
+                        and ledger.approved
+                        and self._status_games_index[game] <= settlement_cursor):
+                    settled_excess += self._settle_game(game, ledger, settlement_day, snapshot)
+                ledgers[game] = ledger
+                initial[game] = (ledger.wagers, ledger.payouts)
+            ledger = ledgers[game]
+            positive_excess = max(ledger.excess, 0)
+            ledger.wagers += wager
+            ledger.total_wagers += wager
+            ledger.headroom += wager
+            if track_excess:
+                ledger.excess += wager
+            wagers += wager
+            result = True
+            if payout is not None:
+                positive_excess_change += self._get_positive_excess_change(ledger, positive_excess)
+                positive_excess = max(ledger.excess, 0)
+                result = self._accumulate_payout(game, ledger, payout, track_excess, _watch_dog)
+                if result:
+                    payouts += payout
+            positive_excess_change += self._get_positive_excess_change(ledger, positive_excess)
+            results.append(result)
+
+        for game, ledger in ledgers.items():
+            self._game_ledger[game] = ledger.to_bytes()
+            initial_wagers, initial_payouts = initial[game]
+            if ledger.wagers != initial_wagers:
+                self.WagersAccumulated(game, day, ledger.wagers, ledger.excess)
+            if ledger.payouts != initial_payouts:
+                self.PayoutAccumulated(game, day, ledger.payouts, ledger.excess)
+        if settled_excess != 0:
+            self._settlement_excess.set(self._settlement_excess.get() + settled_excess)
+            positive_excess_change -= settled_excess
+        if snapshot:
+            self._add_settlement_chunk(self._pack_excess_entries(snapshot))
+        if wagers != 0 or payouts != 0 or positive_excess_change != 0:
+            self._accumulate_source(self.msg.sender, day, wagers, payouts, positive_excess_change)
+        return results
+
+    def _get_positive_excess_change(self, ledger: GameLedger, positive_excess: int) -> int:
+        """
+        Returns how much the positive part of the game's excess has changed
+        since it was positive_excess, or 0 if the game is not approved.
+        """
+        if not ledger.approved:
+            return 0
+        return max(ledger.excess, 0) - positive_excess
+
+    def _accumulate_payout(self, game: Address, ledger: GameLedger, payout: int, track_excess: bool,
+                           watch_dog: bool) -> bool:
+        """
+        Accumulates the payout into the ledger of the game after checking it
+        against the watch dog limits if they are applied. A payout that breaks
+        a limit is not accumulated and the game gets suspended.
+        :return: True if the payout was accumulated
+        :rtype: bool
+        """
+        if watch_dog:
+            note = None
+            maximum_payout = self._maximum_payouts[game]
+            if payout > maximum_payout:
+                note = (f'Preventing Overpayment. Requested payout: {payout}. MaxPayout for this game: '
+                        f'{maximum_payout}. {TAG}')
+            elif payout >= self._get_loss_headroom(game, ledger):
+                loss = ledger.payouts + payout - ledger.wagers
+                note = (f'Limit loss. MaxLoss: {ledger.headroom + ledger.payouts - ledger.wagers}. '
+                        f'Loss Incurred if payout: {loss}, {TAG}')
+            if note is not None:
+                # The status change reads the stored ledger to update the
+                # positive excess, so it has to be up to date.
+                self._game_ledger[game] = ledger.to_bytes()
+                self._update_game_status(game, 'gameSuspended', self._status_data[game])
+                ledger.approved = False
+                self.GameSuspended(game, note)
                 return False
 
-        self._payouts[day][game] += payout
-        if (self._new_div_changing_time.get() is not None
-            and self.now() >= self._new_div_changing_time.get()):
-            self._todays_games_excess[game] -= payout
+        ledger.payouts += payout
+        ledger.total_payouts += payout
+        ledger.headroom -= payout
+        if track_excess:
+            ledger.excess -= payout
         return True
 
+    @external
+    def accumulate_daily_batch(self, _entries: str) -> list:
+        """
+        Accumulates the wagers and payouts of several bets in one call. The
+        entries are applied in order, the wager of an entry before its payout.
+        A payout refused by the watch dog suspends the game like in
+        accumulate_daily_payouts but does not revert the rest of the batch.
+        Only roulette score and the accumulators can call this function.
+        :param _entries: JSON list of [game, wager, payout] entries, where game
+                         is the score address as a string and wager and payout
+                         are ints. A payout of 0 means the entry has no payout.
+        :type _entries: str
+        :return: Result of each entry, False if its payout was refused
+        :rtype: list
+        """
+        self._require_accumulator()
+        entries = json_loads(_entries)
+        if not isinstance(entries, list):
+            revert('Entries must be a list.')
+        games = {}
+        parsed_entries = []
+        for entry in entries:
+            if not isinstance(entry, list) or len(entry) != 3:
+                revert(f'Invalid entry: {entry}')
+            game_string, wager, payout = entry
+            if not isinstance(wager, int) or not isinstance(payout, int) or wager < 0 or payout < 0:
+                revert(f'Invalid amounts in entry: {entry}')
+            if game_string not in games:
+                games[game_string] = Address.from_string(game_string)
+            parsed_entries.append((games[game_string], wager, payout if payout > 0 else None))
+        results = self._accumulate(parsed_entries, self._get_settings().apply_watch_dog)
+        self._record_perf('accumulate_daily_batch', len(parsed_entries))
+        return results
+
     @external(readonly=True)
     def get_daily_payouts(self, day: int = 0) -> dict:
         """
@@ -455,9 +1642,12 @@ class Authorization(IconScoreBase):
         """
         if day < 1:
             day += (self.now() // U_SECONDS_DAY)
+        rollup_start = self._get_compacted_rollup(day)
+        if rollup_start != -1:
+            return {'compacted': f'{rollup_start}'}
         payouts = {}
         for game in self.get_approved_games():
-            payouts[str(game)] = f'{self._payouts[day][game]}'
+            payouts[str(game)] = f'{self._get_daily_payout(game, day)}'
         return payouts
 
     @external(readonly=True)
@@ -481,6 +1671,25 @@ class Authorization(IconScoreBase):
         """
         return self._proposal_data[_scoreAddress]
 
+    @external(readonly=True)
+    def get_proposal_submission(self, _scoreAddress: Address) -> dict:
+        """
+        Returns the position of the game in the score list and the time its
+        proposal was submitted at.
+        :param _scoreAddress: Address of the game
+        :type _scoreAddress: :class:`iconservice.base.address.Address`
+        :return: Dictionary with the 0-based index of the game in the score
+                 list and the submission timestamp in microseconds, 0 for
+                 games submitted before it was recorded
+        :rtype: dict
+        """
+        self._require_migrated()
+        entry = self._proposal_registry[_scoreAddress]
+        if entry is None:
+            revert('Game has not been submitted.')
+        position, timestamp = unpack_ints(entry, 2)
+        return {'index': position - 1, 'timestamp': timestamp}
+
     @external(readonly=True)
     def get_score_list(self) -> list:
         """
@@ -501,11 +1710,138 @@ class Authorization(IconScoreBase):
         :rtype: list
         """
         proposal_list = []
-        for scoreAddress in self._proposal_list:
-            if self._status_data[scoreAddress] == "gameApproved":
-                proposal_list.append(scoreAddress)
+        if self._is_migrating():
+            # The status index is complete only once the migration is done.
+            for scoreAddress in self._proposal_list:
+                if self._status_data[scoreAddress] == 'gameApproved':
+                    proposal_list.append(scoreAddress)
+            return proposal_list
+        for scoreAddress in self._get_status_games('gameApproved'):
+            proposal_list.append(scoreAddress)
         return proposal_list
 
+    @external(readonly=True)
+    def get_score_list_page(self, _offset: int = 0, _limit: int = MAX_PAGE_SIZE, _status: str = '') -> dict:
+        """
+        Returns a page of the games with their status and owner. Without a
+        status the games are listed in order of submission, otherwise only the
+        games with that status are listed. Changing the status of a game moves
+        the last game of its old status into its place, so the pages of a
+        status are only consistent with each other when read in one block.
+        :param _offset: Index of the first game of the page
+        :type _offset: int
+        :param _limit: Number of games in the page, at most MAX_PAGE_SIZE
+        :type _limit: int
+        :param _status: Status of the games to list, all games if empty
+        :type _status: str
+        :return: Dictionary with the total number of games matching and the
+                 list of games in the page
+        :rtype: dict
+        """
+        self._require_migrated()
+        if _offset < 0 or _limit < 1 or _limit > self.MAX_PAGE_SIZE:
+            revert(f'Offset must not be negative and limit must be between 1 and {self.MAX_PAGE_SIZE}')
+        if _status == '':
+            games = self._proposal_list
+        elif _status in self.STATUS_TYPE:
+            games = self._get_status_games(_status)
+        else:
+            revert('Invalid status')
+        total = len(games)
+        page = []
+        for index in range(_offset, min(_offset + _limit, total)):
+            scoreAddress = games[index]
+            page.append({
+                'scoreAddress': scoreAddress,
+                'status': _status if _status != '' else self._status_data[scoreAddress],
+                'owner': self._owner_data[scoreAddress]
+            })
+        return {'total': total, 'games': page}
+
+    @external(readonly=True)
+    def get_approved_games_page(self, _offset: int = 0, _limit: int = MAX_PAGE_SIZE) -> dict:
+        """
+        Returns a page of the approved games with their status and owner. Like
+        for get_score_list_page with a status, the pages are only consistent
+        with each other when read in one block.
+        :param _offset: Index of the first game of the page
+        :type _offset: int
+        :param _limit: Number of games in the page, at most MAX_PAGE_SIZE
+        :type _limit: int
+        :return: Dictionary with the total number of approved games and the
+                 list of games in the page
+        :rtype: dict
+        """
+        return self.get_score_list_page(_offset, _limit, 'gameApproved')
+
+    @external(readonly=True)
+    def get_games_dashboard(self, day: int = 0, _offset: int = 0, _limit: int = MAX_PAGE_SIZE,
+                            _status: str = 'gameApproved') -> dict:
+        """
+        Returns a page of the games with everything a front-end shows about
+        them, reading each game's data once. The games are paged like in
+        get_score_list_page, so the pages of a status are only consistent with
+        each other when read in one block.
+        :param day: Index of the day of the wagers and payouts, days less than
+                    1 are relative to today
+        :type day: int
+        :param _offset: Index of the first game of the page
+        :type _offset: int
+        :param _limit: Number of games in the page, at most MAX_PAGE_SIZE
+        :type _limit: int
+        :param _status: Status of the games to list, all games if empty
+        :type _status: str
+        :return: Dictionary with the total number of games matching, the day,
+                 the first day of its rollup if it has been compacted and for
+                 each game of the page its name, status, wagers and payouts
+                 of the day, today's excess, maximum payout, loss headroom
+                 left today and revenue share wallet
+        :rtype: dict
+        """
+        self._require_migrated()
+        if _offset < 0 or _limit < 1 or _limit > self.MAX_PAGE_SIZE:
+            revert(f'Offset must not be negative and limit must be between 1 and {self.MAX_PAGE_SIZE}')
+        if _status == '':
+            games = self._proposal_list
+        elif _status in self.STATUS_TYPE:
+            games = self._get_status_games(_status)
+        else:
+            revert('Invalid status')
+        today = self.now() // U_SECONDS_DAY
+        if day < 1:
+            day += today
+        rollup_start = self._get_compacted_rollup(day)
+        total = len(games)
+        page = []
+        for index in range(_offset, min(_offset + _limit, total)):
+            game = games[index]
+            ledger = self._get_game_ledger(game)
+            if rollup_start != -1:
+                wagers = 0
+                payouts = 0
+            elif ledger.day == day:
+                wagers = ledger.wagers
+                payouts = ledger.payouts
+            else:
+                wagers = self._wagers[day][game]
+                payouts = self._payouts[day][game]
+            headroom = self._get_loss_headroom(game, ledger) if ledger.day == today else self._get_maximum_loss(game)
+            page.append({
+                'scoreAddress': game,
+                'name': self._game_names[game],
+                'status': _status if _status != '' else self._status_data[game],
+                'wagers': f'{wagers}',
+                'payouts': f'{payouts}',
+                'excess': f'{ledger.excess}',
+                'maxPayout': f'{self._maximum_payouts[game]}',
+                'lossHeadroom': f'{headroom}',
+                'revShareWalletAddress': self._revshare_wallets[game]
+            })
+        dashboard = {'total': total, 'day': day, 'maxPageSize': self.MAX_PAGE_SIZE, 'games': page}
+        if rollup_start != -1:
+            dashboard['compacted'] = f'{rollup_start}'
+        return dashboard
+
     @external(readonly=True)
     def get_revshare_wallet_address(self, _scoreAddress: Address) -> Address:
         """
@@ -516,9 +1852,14 @@ class Authorization(IconScoreBase):
         :return: Revenue share wallet address of the game
         :rtype: :class:`iconservice.base.address.Address`
         """
-        gamedata = self._proposal_data[_scoreAddress]
-        metadata = json_loads(gamedata)
-        return Address.from_string(metadata['revShareWalletAddress'])
+        revshare_wallet = self._revshare_wallets[_scoreAddress]
+        if revshare_wallet is None:
+            if not self._is_submitted(_scoreAddress):
+                revert('Game has not been submitted.')
+            # A game the pending migration has not reached yet.
+            metadata = json_loads(self._proposal_data[_scoreAddress])
+            revshare_wallet = Address.from_string(metadata['revShareWalletAddress'])
+        return revshare_wallet
 
     @external(readonly=True)
     def get_game_type(self) -> list:
@@ -547,42 +1888,262 @@ class Authorization(IconScoreBase):
         :return: Game developers share
         :rtype: int
         """
-        positive_excess: int = 0
-        for game in self.get_approved_games():
-            game_excess = self._todays_games_excess[game]
-            if game_excess >= 0:
-                positive_excess += game_excess
+        if self._is_migrating():
+            positive_excess = 0
+            for game in self.get_approved_games():
+                positive_excess += max(self._get_game_excess(game), 0)
+        else:
+            positive_excess = self._get_positive_excess()
         game_developers_amount = (self._game_developers_share.get()
                                   * positive_excess) // 100
         return game_developers_amount
 
+    @external(readonly=True)
+    def get_daily_totals_by_source(self, day: int = 0) -> dict:
+        """
+        Returns the wagers and payouts accumulated by each source in a
+        particular day. Amounts accumulated before the totals were sharded
+        are not included.
+        :param day: Index of the day, days less than 1 are relative to today
+        :type day: int
+        :return: Dictionary of sources' address to dictionaries with their
+                 wagers and payouts of the day
+        :rtype: dict
+        """
+        self._require_migrated()
+        if day < 1:
+            day += (self.now() // U_SECONDS_DAY)
+        totals = {}
+        for source in self._get_shard_sources():
+            source_totals = self._get_source_totals(source, day)
+            if source_totals is not None:
+                wagers, payouts = source_totals
+                totals[str(source)] = {'wagers': f'{wagers}', 'payouts': f'{payouts}'}
+        return totals
+
+    @external(readonly=True)
+    def get_daily_totals(self, day: int = 0) -> dict:
+        """
+        Returns the sum of the wagers and of the payouts of all the games in a
+        particular day. Days before the totals were first tracked are summed
+        up from the games' daily values, unless they have been compacted.
+        :param day: Index of the day, days less than 1 are relative to today
+        :type day: int
+        :return: Dictionary with the total wagers and payouts of the day, or
+                 with the first day of its rollup under 'compacted'
+        :rtype: dict
+        """
+        self._require_migrated()
+        if day < 1:
+            day += (self.now() // U_SECONDS_DAY)
+        if day >= self._totals_start_day.get():
+            wagers = self._daily_wagers_total[day]
+            payouts = self._daily_payouts_total[day]
+            for source in self._get_shard_sources():
+                source_totals = self._get_source_totals(source, day)
+                if source_totals is not None:
+                    wagers += source_totals[0]
+                    payouts += source_totals[1]
+        elif self._get_compacted_rollup(day) != -1:
+            return {'compacted': f'{self._get_compacted_rollup(day)}'}
+        else:
+            wagers = 0
+            payouts = 0
+            for game in self._proposal_list:
+                wagers += self._get_daily_wager(game, day)
+                payouts += self._get_daily_payout(game, day)
+        return {'wagers': f'{wagers}', 'payouts': f'{payouts}'}
+
     @external
     def record_excess(self) -> int:
         """
         Roulette score calls this function if the day has been advanced. This
         function takes the snapshot of the excess made by the game till the
-        advancement of day.
-        :return: Sum of game developers amount
+        advancement of day. If a settlement started by settle_excess is in
+        progress, it is finished instead. While a storage migration is pending
+        each call migrates up to MIGRATION_CHUNK games first, and returns -1
+        until the migration is done.
+        :return: Sum of game developers amount, -1 while games remain to be
+                 migrated
         :rtype: int
         """
-        if self.msg.sender != self._roulette_score.get():
+        if self.msg.sender != self._get_settings().roulette_score:
             revert("This method can only be called by Roulette score")
-        positive_excess: int = 0
-        day = (self.now() // U_SECONDS_DAY)
-        for game in self.get_approved_games():
-            game_excess = self._todays_games_excess[game]
-            self._games_excess_history[day - 1][game] = game_excess
-            if game_excess >= 0:
-                positive_excess += game_excess
-                self._todays_games_excess[game] = 0
+        return self._settle_excess(None, 'record_excess')
+
+    @external
+    def settle_excess(self, _count: int) -> int:
+        """
+        Takes the snapshot of the excess made by the games like record_excess,
+        settling at most _count approved games per call. Roulette score calls
+        it repeatedly once the day has been advanced, until it returns the
+        game developers amount. Wagers and payouts accumulated meanwhile count
+        towards the new day.
+        :param _count: Maximum number of games to settle in this call
+        :type _count: int
+        :return: Sum of game developers amount once every game is settled,
+                 -1 while games remain to be settled
+        :rtype: int
+        """
+        if self.msg.sender != self._get_settings().roulette_score:
+            revert("This method can only be called by Roulette score")
+        if _count < 1:
+            revert('Count must be positive')
+        return self._settle_excess(_count, 'settle_excess')
+
+    def _settle_excess(self, _count: int, _method: str) -> int:
+        """
+        Settles the approved games from the cursor down, starting a settlement
+        of yesterday's excess if none is in progress. A pending storage
+        migration is completed first, each game migrated counting as settled,
+        and up to MIGRATION_CHUNK games per call if _count is None.
+        :param _count: Maximum number of games to settle, None for all
+        :type _count: int
+        :param _method: External method the perf counters are recorded for
+        :type _method: str
+        :return: Sum of game developers amount once every game is settled,
+                 -1 while games remain to be settled
+        :rtype: int
+        """
+        if self._is_migrating():
+            migrated = self._migrate(self.MIGRATION_CHUNK if _count is None else _count)
+            if self._is_migrating():
+                return -1
+            if _count is not None:
+                _count -= migrated
+                if _count < 1:
+                    return -1
+        games = self._get_status_games('gameApproved')
+        settlement_day = self._get_settings().settlement_day
+        if settlement_day == 0:
+            settlement_day = (self.now() // U_SECONDS_DAY) - 1
+            cursor = len(games)
+            positive_excess = 0
+        else:
+            # Games removed from the approved games meanwhile may have made
+            # the list shorter than the cursor.
+            cursor = min(self._settlement_cursor.get(), len(games))
+            positive_excess = self._settlement_excess.get()
+        end = 0 if _count is None else max(cursor - _count, 0)
+        self._record_perf(_method, cursor - end)
+        settled_excess = 0
+        snapshot = []
+        while cursor > end:
+            cursor -= 1
+            game = games[cursor]
+            ledger = self._get_game_ledger(game)
+            if ledger.settled_day != settlement_day:
+                settled_excess += self._settle_game(game, ledger, settlement_day, snapshot)
+                self._game_ledger[game] = ledger.to_bytes()
+        if settled_excess != 0:
+            self._positive_excess.set(self._positive_excess.get() - settled_excess)
+        positive_excess += settled_excess
+        entries = self._pack_excess_entries(snapshot)
+
+        if cursor > 0:
+            if self._get_settings().settlement_day == 0:
+                self._settlement_day.set(settlement_day)
+                self._store_settings()
+            self._settlement_cursor.set(cursor)
+            self._settlement_excess.set(positive_excess)
+            if entries:
+                self._add_settlement_chunk(entries)
+            return -1
+        if self._get_settings().settlement_day != 0:
+            entries = self._pop_settlement_chunks() + entries
+            self._settlement_day.remove()
+            self._store_settings()
+            self._settlement_cursor.remove()
+            self._settlement_excess.remove()
         game_developers_amount = (self._game_developers_share.get() * positive_excess) // 100
+        self._store_excess_snapshot(settlement_day, game_developers_amount, entries)
         return game_developers_amount
 
+    def _add_settlement_chunk(self, _entries: bytes) -> None:
+        count = self._settlement_chunk_count.get()
+        self._settlement_chunks[count] = _entries
+        self._settlement_chunk_count.set(count + 1)
+
+    def _pop_settlement_chunks(self) -> bytes:
+        """
+        Removes the chunks of the settlement in progress.
+        :return: Entries of the chunks in the order they were added
+        :rtype: bytes
+        """
+        chunks = []
+        for index in range(self._settlement_chunk_count.get()):
+            chunks.append(self._settlement_chunks[index])
+            self._settlement_chunks.remove(index)
+        self._settlement_chunk_count.remove()
+        return b''.join(chunks)
+
+    def _pack_excess_entries(self, snapshot: list) -> bytes:
+        return b''.join(pack_excess_entry(game, excess) for game, excess in snapshot)
+
+    def _store_excess_snapshot(self, day: int, amount: int, entries: bytes) -> None:
+        """
+        Stores the snapshot of a settled day. A day settled again, for games
+        approved after its settlement, gets their entries and amount added.
+        :param day: Index of the settled day
+        :type day: int
+        :param amount: Game developers amount of the settlement
+        :type amount: int
+        :param entries: Entries of the settled games, packed with
+                        pack_excess_entry
+        :type entries: bytes
+        :return:
+        """
+        previous = self._excess_snapshots[day]
+        if previous is not None:
+            if amount == 0 and not entries:
+                return
+            offset = 1 + previous[0]
+            amount += unpack_ints(previous[:offset], 1)[0]
+            entries = previous[offset:] + entries
+        self._excess_snapshots[day] = pack_ints([amount]) + entries
+
+    def _settle_game(self, game: Address, ledger: GameLedger, settlement_day: int, snapshot: list) -> int:
+        """
+        Records the excess of the game for the settlement day and resets it if
+        it is positive. The caller stores the ledger.
+        :param snapshot: List the (game, excess) of the game is appended to
+        :type snapshot: list
+        :return: Positive excess of the game which has been settled
+        :rtype: int
+        """
+        if ledger.excess != 0:
+            self._games_excess_history[settlement_day][game] = ledger.excess
+        snapshot.append((game, ledger.excess))
+        self.ExcessRecorded(game, settlement_day, ledger.excess)
+        ledger.settled_day = settlement_day
+        if ledger.excess <= 0:
+            return 0
+        positive_excess = ledger.excess
+        ledger.excess = 0
+        return positive_excess
+
+    @external(readonly=True)
+    def get_excess_settlement(self) -> dict:
+        """
+        Returns the progress of the settlement started by settle_excess.
+        :return: Dictionary with the day being settled, 0 if no settlement is
+                 in progress, the number of games left to settle and the
+                 positive excess of the games settled so far
+        :rtype: dict
+        """
+        self._require_migrated()
+        settlement_day = self._settlement_day.get()
+        if settlement_day == 0:
+            return {'day': 0, 'remaining': 0, 'excess': '0'}
+        remaining = min(self._settlement_cursor.get(), len(self._get_status_games('gameApproved')))
+        return {'day': settlement_day, 'remaining': remaining, 'excess': f'{self._settlement_excess.get()}'}
+
     @external(readonly=True)
     def get_games_excess(self, day: int = 0) -> dict:
         """
         Returns a dictionary with game addresses as keys and the excess as the
-        values for the specified day.
+        values for the specified day. For a settled day these are the games
+        settled for it, whatever their status since.
         :return: Dictionary of games' address and excess of the games
         :rtype: dict
         """
@@ -590,11 +2151,41 @@ class Authorization(IconScoreBase):
             return self.get_todays_games_excess()
         if day < 0:
             day += (self.now() // U_SECONDS_DAY)
+        rollup_start = self._get_compacted_rollup(day)
+        if rollup_start != -1:
+            return {'compacted': f'{rollup_start}'}
         games_excess = {}
+        snapshot = self._excess_snapshots[day]
+        if snapshot is not None:
+            for game, excess in unpack_excess_snapshot(snapshot)[1]:
+                games_excess[str(game)] = f'{excess}'
+            return games_excess
+        # Days settled before the snapshots were kept.
         for game in self.get_approved_games():
             games_excess[str(game)] = f'{self._games_excess_history[day][game]}'
         return games_excess
 
+    @external(readonly=True)
+    def get_excess_snapshot(self, day: int) -> dict:
+        """
+        Returns the snapshot of a settled day.
+        :param day: Index of the day, days less than 1 are relative to today
+        :type day: int
+        :return: Dictionary with the game developers amount paid for the day
+                 and the excess of every game settled for it
+        :rtype: dict
+        """
+        if day < 1:
+            day += (self.now() // U_SECONDS_DAY)
+        snapshot = self._excess_snapshots[day]
+        if snapshot is None:
+            revert(f'No excess snapshot for day {day}.')
+        amount, entries = unpack_excess_snapshot(snapshot)
+        games_excess = {}
+        for game, excess in entries:
+            games_excess[str(game)] = f'{excess}'
+        return {'gameDevelopersAmount': f'{amount}', 'games': games_excess}
+
     @external(readonly=True)
     def get_yesterdays_games_excess(self) -> dict:
         """
@@ -614,9 +2205,381 @@ class Authorization(IconScoreBase):
         """
         games_excess = {}
         for game in self.get_approved_games():
-            games_excess[str(game)] = f'{self._todays_games_excess[game]}'
+            games_excess[str(game)] = f'{self._get_game_excess(game)}'
         return games_excess
 
+    @external(readonly=True)
+    def get_daily_wagers_range(self, start_day: int, end_day: int, games: str = '') -> dict:
+        """
+        Returns the daily wagers of the games for every day of a range of at
+        most MAX_DAY_RANGE days.
+        :param start_day: Index of the first day, days less than 1 are relative
+                          to today like in get_daily_wagers
+        :type start_day: int
+        :param end_day: Index of the last day, included in the range
+        :type end_day: int
+        :param games: JSON list of at most MAX_PAGE_SIZE games' address to
+                      return, all the approved games if empty
+        :type games: str
+        :return: Dictionary of days to dictionaries of games' address and wagers
+        :rtype: dict
+        """
+        return self._get_range('wagers', start_day, end_day, games)
+
+    @external(readonly=True)
+    def get_daily_payouts_range(self, start_day: int, end_day: int, games: str = '') -> dict:
+        """
+        Returns the daily payouts of the games for every day of a range of at
+        most MAX_DAY_RANGE days.
+        :param start_day: Index of the first day, days less than 1 are relative
+                          to today like in get_daily_payouts
+        :type start_day: int
+        :param end_day: Index of the last day, included in the range
+        :type end_day: int
+        :param games: JSON list of at most MAX_PAGE_SIZE games' address to
+                      return, all the approved games if empty
+        :type games: str
+        :return: Dictionary of days to dictionaries of games' address and payouts
+        :rtype: dict
+        """
+        return self._get_range('payouts', start_day, end_day, games)
+
+    @external(readonly=True)
+    def get_games_excess_range(self, start_day: int, end_day: int, games: str = '') -> dict:
+        """
+        Returns the recorded excess of the games for every day of a range of at
+        most MAX_DAY_RANGE days. Settled days are read from their snapshot like
+        in get_excess_snapshot, and for today the current excess is returned
+        like in get_todays_games_excess.
+        :param start_day: Index of the first day, days less than 1 are relative
+                          to today
+        :type start_day: int
+        :param end_day: Index of the last day, included in the range
+        :type end_day: int
+        :param games: JSON list of at most MAX_PAGE_SIZE games' address to
+                      return, all the approved games if empty
+        :type games: str
+        :return: Dictionary of days to dictionaries of games' address and excess
+        :rtype: dict
+        """
+        return self._get_range('excess', start_day, end_day, games)
+
+    def _get_range(self, _metric: str, _start_day: int, _end_day: int, _games: str) -> dict:
+        """
+        Builds the day by game matrix of a metric for the range queries. The
+        ledger of each game and the excess snapshot of each day are read once
+        for the whole range.
+        :param _metric: One of 'wagers', 'payouts' and 'excess'
+        :type _metric: str
+        :return: Dictionary of days to dictionaries of games' address and values
+        :rtype: dict
+        """
+        self._require_migrated()
+        today = self.now() // U_SECONDS_DAY
+        if _start_day < 1:
+            _start_day += today
+        if _end_day < 1:
+            _end_day += today
+        if _end_day < _start_day:
+            revert('end_day must not be before start_day')
+        if _end_day - _start_day + 1 > self.MAX_DAY_RANGE:
+            revert(f'At most {self.MAX_DAY_RANGE} days can be queried at once')
+        if _games == '':
+            games = self.get_approved_games()
+        else:
+            games = [Address.from_string(game) for game in json_loads(_games)]
+        if len(games) > self.MAX_PAGE_SIZE:
+            revert(f'At most {self.MAX_PAGE_SIZE} games can be queried at once')
+
+        matrix = {}
+        days = []
+        # Excess of the games of each settled day, by game.
+        snapshots = {}
+        for day in range(_start_day, _end_day + 1):
+            rollup_start = self._get_compacted_rollup(day)
+            if rollup_start != -1:
+                matrix[str(day)] = {'compacted': f'{rollup_start}'}
+            else:
+                matrix[str(day)] = {}
+                days.append(day)
+                if _metric == 'excess' and day != today:
+                    snapshot = self._excess_snapshots[day]
+                    if snapshot is not None:
+                        snapshots[day] = dict(unpack_excess_snapshot(snapshot)[1])
+        for game in games:
+            ledger = self._get_game_ledger(game)
+            for day in days:
+                if _metric == 'excess':
+                    if day == today:
+                        value = ledger.excess
+                    elif day in snapshots:
+                        value = snapshots[day].get(game, 0)
+                    else:
+                        # Days settled before the snapshots were kept.
+                        value = self._games_excess_history[day][game]
+                elif ledger.day == day:
+                    value = ledger.wagers if _metric == 'wagers' else ledger.payouts
+                elif _metric == 'wagers':
+                    value = self._wagers[day][game]
+                else:
+                    value = self._payouts[day][game]
+                matrix[str(day)][str(game)] = f'{value}'
+        return matrix
+
+    @external
+    def set_history_retention(self, _days: int, _period: str, _start_day: int = 0) -> None:
+        """
+        Sets how many recent days of the daily history are kept and the
+        period older days are compacted into by compact_history. Only admins
+        can call this function.
+        :param _days: Number of recent days kept, at least MIN_RETENTION_DAYS
+        :type _days: int
+        :param _period: 'week' or 'month', can't change once days have been
+                        compacted
+        :type _period: str
+        :param _start_day: Index of the first day to compact, required the
+                           first time and ignored once days have been compacted
+        :type _start_day: int
+        :return:
+        """
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        if _days < self.MIN_RETENTION_DAYS:
+            revert(f'At least {self.MIN_RETENTION_DAYS} days must be kept')
+        if _period not in self.ROLLUP_PERIODS:
+            revert('Invalid rollup period')
+        compacted = (self._compacted_until.get() != self._compaction_start_day.get()
+                     or self._compaction_cursor.get() != 0)
+        if compacted:
+            if _period != self._rollup_period.get():
+                revert('The rollup period cannot change once days have been compacted')
+        else:
+            if _start_day < 1 and self._compaction_start_day.get() == 0:
+                revert('The first day to compact is required')
+            self._rollup_period.set(_period)
+            if _start_day > 0:
+                start_day = self._get_rollup_period(_start_day)[0]
+                self._compaction_start_day.set(start_day)
+                self._compacted_until.set(start_day)
+        self._retention_days.set(_days)
+
+    @external(readonly=True)
+    def get_history_retention(self) -> dict:
+        """
+        Returns the settings and the progress of the history compaction.
+        :return: Dictionary with the days kept, the rollup period, the first
+                 day compacted and the first day not compacted yet
+        :rtype: dict
+        """
+        return {
+            'days': self._retention_days.get(),
+            'period': self._rollup_period.get(),
+            'startDay': self._compaction_start_day.get(),
+            'compactedUntil': self._compacted_until.get()
+        }
+
+    @external
+    def compact_history(self, _count: int) -> int:
+        """
+        Folds the daily wagers, payouts and excess of the days older than the
+        retention into per game rollups and deletes the daily values. Each
+        call compacts at most _count (period, game) pairs, so it is called
+        repeatedly until it returns 0. Only admins can call this function.
+        :param _count: Maximum number of (period, game) pairs to compact
+        :type _count: int
+        :return: Number of (period, game) pairs compacted
+        :rtype: int
+        """
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        self._require_migrated()
+        if _count < 1:
+            revert('Count must be positive')
+        retention_days = self._retention_days.get()
+        if retention_days == 0:
+            revert('History retention is not set')
+        horizon = (self.now() // U_SECONDS_DAY) - retention_days
+        compacted_until = self._compacted_until.get()
+        cursor = self._compaction_cursor.get()
+        games = len(self._proposal_list)
+        compacted = 0
+        while compacted < _count:
+            period_start, period_end = self._get_rollup_period(compacted_until)
+            if period_end > horizon:
+                break
+            while cursor < games and compacted < _count:
+                self._compact_game(self._proposal_list[cursor], period_start, period_end)
+                cursor += 1
+                compacted += 1
+            if cursor < games:
+                break
+            for day in range(period_start, period_end):
+                if day in self._excess_snapshots:
+                    self._excess_snapshots.remove(day)
+            compacted_until = period_end
+            cursor = 0
+        if compacted != 0:
+            self._compacted_until.set(compacted_until)
+            self._compaction_cursor.set(cursor)
+        self._record_perf('compact_history', compacted)
+        return compacted
+
+    def _compact_game(self, game: Address, period_start: int, period_end: int) -> None:
+        """
+        Folds the daily values of the game in the period into its rollup. The
+        ledger gives up the wagers and payouts of its day if it is in the
+        period, so they are not written to the daily values later on.
+        """
+        ledger = self._get_game_ledger(game)
+        wagers = 0
+        payouts = 0
+        excess = 0
+        positive_excess = 0
+        for day in range(period_start, period_end):
+            if ledger.day == day:
+                wagers += ledger.wagers
+                payouts += ledger.payouts
+                if ledger.wagers != 0 or ledger.payouts != 0:
+                    ledger.wagers = 0
+                    ledger.payouts = 0
+                    self._game_ledger[game] = ledger.to_bytes()
+            else:
+                day_wagers = self._wagers[day][game]
+                if day_wagers != 0:
+                    wagers += day_wagers
+                    self._wagers[day].remove(game)
+                day_payouts = self._payouts[day][game]
+                if day_payouts != 0:
+                    payouts += day_payouts
+                    self._payouts[day].remove(game)
+            day_excess = self._games_excess_history[day][game]
+            if day_excess != 0:
+                excess += day_excess
+                positive_excess += max(day_excess, 0)
+                self._games_excess_history[day].remove(game)
+        if wagers != 0 or payouts != 0 or excess != 0:
+            self._rollups[period_start][game] = pack_ints([wagers, payouts, excess, positive_excess])
+
+    def _get_rollup_period(self, day: int) -> tuple:
+        """
+        Returns the first day of the rollup period containing the day and the
+        first day of the next one. Weeks start on Mondays.
+        """
+        if self._rollup_period.get() == 'week':
+            start = day - (day + 3) % 7
+            return start, start + 7
+        year, month, _ = civil_from_days(day)
+        start = days_from_civil(year, month, 1)
+        if month == 12:
+            return start, days_from_civil(year + 1, 1, 1)
+        return start, days_from_civil(year, month + 1, 1)
+
+    def _get_compacted_rollup(self, day: int) -> int:
+        """
+        Returns the first day of the rollup period the day has been compacted
+        into, or -1 if its daily values are still kept.
+        """
+        compacted_until = self._compacted_until.get()
+        if compacted_until == 0 or day < self._compaction_start_day.get():
+            return -1
+        if day < compacted_until:
+            return self._get_rollup_period(day)[0]
+        # Part of the games of the period being compacted are already folded.
+        if self._compaction_cursor.get() != 0:
+            period_start, period_end = self._get_rollup_period(compacted_until)
+            if day < period_end:
+                return period_start
+        return -1
+
+    @external(readonly=True)
+    def get_rollup(self, _day: int, _games: str = '') -> dict:
+        """
+        Returns the wagers, payouts, sum of the recorded excess and sum of the
+        positive recorded excess of the games in the rollup period containing
+        the day.
+        :param _day: Index of any day of the period
+        :type _day: int
+        :param _games: JSON list of games' address to return, all the approved
+                       games if empty
+        :type _games: str
+        :return: Dictionary with the first and last day of the period, whether
+                 it is fully compacted and the rollup of each game
+        :rtype: dict
+        """
+        if self._compacted_until.get() == 0:
+            revert('History retention is not set')
+        period_start, period_end = self._get_rollup_period(_day)
+        if _games == '':
+            games = self.get_approved_games()
+        else:
+            games = [Address.from_string(game) for game in json_loads(_games)]
+        rollups = {}
+        for game in games:
+            wagers, payouts, excess, positive_excess = unpack_ints(self._rollups[period_start][game] or b'', 4)
+            rollups[str(game)] = {'wagers': f'{wagers}', 'payouts': f'{payouts}', 'excess': f'{excess}',
+                                  'positiveExcess': f'{positive_excess}'}
+        return {
+            'startDay': period_start,
+            'endDay': period_end - 1,
+            'compacted': period_end <= self._compacted_until.get(),
+            'games': rollups
+        }
+
+    @external(readonly=True)
+    def get_rolling_stats(self, game: Address, window: int = 7) -> dict:
+        """
+        Returns the wagers, payouts and excess, i.e. wagers minus payouts, of
+        the game over the last days up to today.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :param window: Number of days, today included, less than ROLLING_SLOTS
+        :type window: int
+        :return: Dictionary with the wagers, payouts and excess of the window
+        :rtype: dict
+        """
+        self._require_migrated()
+        if window < 1 or window >= self.ROLLING_SLOTS:
+            revert(f'Window must be between 1 and {self.ROLLING_SLOTS - 1} days')
+        return self._get_rolling_stats(game, window, self.now() // U_SECONDS_DAY)
+
+    @external(readonly=True)
+    def get_games_rolling_stats(self, window: int = 7) -> dict:
+        """
+        Returns the rolling stats of get_rolling_stats for every approved game.
+        :param window: Number of days, today included, less than ROLLING_SLOTS
+        :type window: int
+        :return: Dictionary of games' address and their rolling stats
+        :rtype: dict
+        """
+        self._require_migrated()
+        if window < 1 or window >= self.ROLLING_SLOTS:
+            revert(f'Window must be between 1 and {self.ROLLING_SLOTS - 1} days')
+        today = self.now() // U_SECONDS_DAY
+        stats = {}
+        for game in self.get_approved_games():
+            stats[str(game)] = self._get_rolling_stats(game, window, today)
+        return stats
+
+    def _get_rolling_stats(self, game: Address, window: int, today: int) -> dict:
+        """
+        Subtracts the game's totals at the end of the day before the window
+        from its current totals, reading the ledger and at most one slot.
+        """
+        ledger = self._get_game_ledger(game)
+        day_before = today - window
+        wagers = 0
+        payouts = 0
+        if day_before < ledger.day:
+            wagers = ledger.total_wagers
+            payouts = ledger.total_payouts
+            slot = self._rolling_slots[game][day_before % self.ROLLING_SLOTS]
+            slot_day, slot_wagers, slot_payouts = unpack_ints(slot or b'', 3)
+            # A game has no slot for the days before it was first played.
+            if slot is not None and slot_day == day_before:
+                wagers -= slot_wagers
+                payouts -= slot_payouts
+        return {'wagers': f'{wagers}', 'payouts': f'{payouts}', 'excess': f'{wagers - payouts}'}
+
     @payable
     def fallback(self):
         pass
@@ -626,50 +2589,190 @@ class Authorization(IconScoreBase):
         Logger.debug(f'Setting maxLoss of {maxLoss}')
         if maxLoss < 10 ** 17:  # 0.1 ICX = 10^18 * 0.1
             revert(f'maxLoss is set to a value less than 0.1 ICX')
-        if self.msg.sender not in self.get_admin():
+        if not self._is_admin(self.msg.sender):
             revert('Sender not an admin')
         self._maximum_loss.set(maxLoss)
+        # The games get their loss headroom from it when they next need it.
+        self._loss_generation.set(self._loss_generation.get() + 1)
+        self._store_settings()
+        self.WatchdogLimitsChanged(self.address, 0, maxLoss, self._apply_watch_dog_method.get())
+        self._record_perf('set_maximum_loss', 0)
 
     @external(readonly=True)
     def get_maximum_loss(self) -> int:
         return self._maximum_loss.get()
 
+    @external
+    def set_game_maximum_loss(self, game: Address, maxLoss: int) -> None:
+        """
+        Sets a maximum loss for the game which overrides the one set with
+        set_maximum_loss. Only admins can call this function.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :param maxLoss: Maximum loss of the game in a day, 0 to use the
+                        maximum loss of all the games again
+        :type maxLoss: int
+        :return:
+        """
+        self._require_migrated()
+        if maxLoss != 0 and maxLoss < 10 ** 17:  # 0.1 ICX = 10^18 * 0.1
+            revert(f'maxLoss is set to a value less than 0.1 ICX')
+        if not self._is_submitted(game):
+            revert('Game has not been submitted.')
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        self._game_maximum_losses[game] = maxLoss
+        self._refresh_loss_headroom(game)
+        self.WatchdogLimitsChanged(game, self._maximum_payouts[game], self._get_maximum_loss(game),
+                                   self._apply_watch_dog_method.get())
+        self._record_perf('set_game_maximum_loss', 1)
+
+    @external(readonly=True)
+    def get_game_maximum_loss(self, game: Address) -> int:
+        """
+        Returns the maximum loss applied to the game, its own if it has one
+        and the maximum loss of all the games otherwise.
+        :param game: Address of the game
+        :type game: :class:`iconservice.base.address.Address`
+        :return: Maximum loss of the game in a day
+        :rtype: int
+        """
+        return self._get_maximum_loss(game)
+
     @external
     def set_maximum_payout(self, game: Address, maxPayout: int) -> None:
+        self._require_migrated()
         if maxPayout < 100000000000000000:  # 0.1 ICX = 10^18 * 0.1
             revert(f'{maxPayout} is less than 0.1 ICX')
-        if game not in self._proposal_list:
+        if not self._is_submitted(game):
             revert('Game has not been submitted.')
-        if self.msg.sender not in self.get_admin():
+        if not self._is_admin(self.msg.sender):
             revert('Sender not an admin')
 
         self._maximum_payouts[game] = maxPayout
+        self.WatchdogLimitsChanged(game, maxPayout, self._get_maximum_loss(game), self._apply_watch_dog_method.get())
+        self._record_perf('set_maximum_payout', 1)
+
+    @external
+    def set_maximum_payouts(self, _limits: str) -> list:
+        """
+        Admin can set the maximum payout of several games in one call. A
+        limit which is not allowed is skipped and does not revert the rest of
+        the batch.
+        :param _limits: JSON list of [game, maxPayout] pairs, where game is
+                        the score address as a string and maxPayout an int
+        :type _limits: str
+        :return: Result of each limit, empty if it was set and the reason it
+                 was not allowed otherwise
+        :rtype: list
+        """
+        self._require_migrated()
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        apply_watch_dog = self._apply_watch_dog_method.get()
+        results = []
+        for game, maxPayout in self._parse_admin_batch(_limits):
+            if not isinstance(maxPayout, int):
+                results.append(f'{maxPayout} is not an int')
+            elif maxPayout < 100000000000000000:  # 0.1 ICX = 10^18 * 0.1
+                results.append(f'{maxPayout} is less than 0.1 ICX')
+            elif not self._is_submitted(game):
+                results.append('Game has not been submitted.')
+            else:
+                self._maximum_payouts[game] = maxPayout
+                self.WatchdogLimitsChanged(game, maxPayout, self._get_maximum_loss(game), apply_watch_dog)
+                results.append('')
+        self._record_perf('set_maximum_payouts', len(results))
+        return results
 
     @external(readonly=True)
     def get_maximum_payout(self, game: Address) -> int:
-        if game not in self._proposal_list:
+        if not self._is_submitted(game):
             revert('Game has not been submitted.')
         return self._maximum_payouts[game]
 
     @external
     def toggle_apply_watch_dog_method(self):
-        if self.msg.sender not in self.get_admin():
+        if not self._is_admin(self.msg.sender):
             revert('Sender not an admin')
+        self._require_migrated()
         old_watch_dog_status = self._apply_watch_dog_method.get()
 
+        iterations = 0
         if not old_watch_dog_status:
             # All approved games must have minimum_payouts set before applying watch dog methods.
-            for scoreAddress in self._proposal_list:
-                if self._status_data[scoreAddress] == "gameApproved":
-                    if self._maximum_payouts[scoreAddress] < 100000000000000000:
-                        revert(f'maxPayout of {scoreAddress} is less than 0.1 ICX')
+            for scoreAddress in self.get_approved_games():
+                iterations += 1
+                if self._maximum_payouts[scoreAddress] < 100000000000000000:
+                    revert(f'maxPayout of {scoreAddress} is less than 0.1 ICX')
 
             if self._maximum_loss.get() < 100000000000000000:
                 revert(f'maxLoss is set to a value less than 0.1 ICX')
 
-        self._apply_watch_dog_method.set(
-            not self._apply_watch_dog_method.get())
+        self._apply_watch_dog_method.set(not old_watch_dog_status)
+        self._store_settings()
+        self.WatchdogLimitsChanged(self.address, 0, self._maximum_loss.get(), not old_watch_dog_status)
+        self._record_perf('toggle_apply_watch_dog_method', iterations)
 
     @external(readonly=True)
     def get_apply_watch_dog_method(self) -> bool:
         return self._apply_watch_dog_method.get()
+
+    @external
+    def toggle_perf_counters(self) -> None:
+        """
+        Turns the perf counters on or off. Only admins can call this function.
+        :return:
+        """
+        self._require_migrated()
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        self._perf_counters_enabled.set(not self._perf_counters_enabled.get())
+        self._store_settings()
+
+    @external(readonly=True)
+    def get_perf_counters_enabled(self) -> bool:
+        return self._perf_counters_enabled.get()
+
+    @external
+    def reset_perf_counters(self) -> None:
+        """
+        Clears the perf counters of every method. Only admins can call this
+        function.
+        :return:
+        """
+        if not self._is_admin(self.msg.sender):
+            revert('Sender not an admin')
+        for method in self.PERF_METHODS:
+            if method in self._perf_counters:
+                self._perf_counters.remove(method)
+
+    @external(readonly=True)
+    def get_perf_counters(self) -> dict:
+        """
+        Returns the number of calls and the number of games iterated over of
+        each counted method since the counters were last reset. Storage reads
+        and writes are not visible to a SCORE, the local harness reports them.
+        :return: Dictionary of method names to their calls and iterations
+        :rtype: dict
+        """
+        counters = {}
+        for method in self.PERF_METHODS:
+            calls, iterations = unpack_ints(self._perf_counters[method] or b'', 2)
+            counters[method] = {'calls': calls, 'iterations': iterations}
+        return counters
+
+    def _record_perf(self, _method: str, _iterations: int) -> None:
+        """
+        Adds a call and its iterations to the perf counters of the method if
+        the counters are enabled.
+        :param _method: Name of the external method
+        :type _method: str
+        :param _iterations: Number of games the call iterated over
+        :type _iterations: int
+        :return:
+        """
+        if not self._get_settings().perf_counters_enabled:
+            return
+        calls, iterations = unpack_ints(self._perf_counters[_method] or b'', 2)
+        self._perf_counters[_method] = pack_ints([calls + 1, iterations + _iterations])
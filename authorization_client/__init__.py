@@ -0,0 +1,11 @@
+"""
+Asynchronous readonly client of the Authorization SCORE::
+
+    async with AuthorizationClient('https://ctz.solidwallet.io/api/v3', score) as client:
+        wagers = await client.get_days('get_daily_wagers', range(first_day, last_day + 1))
+"""
+from .cache import Cache
+from .client import AuthorizationClient
+from .transport import BatchingTransport, HttpPool, JsonRpcError
+
+__all__ = ['AuthorizationClient', 'BatchingTransport', 'Cache', 'HttpPool', 'JsonRpcError']
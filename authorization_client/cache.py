@@ -0,0 +1,73 @@
+"""
+LRU cache of readonly call results, optionally backed by an SQLite file for
+the entries which never change.
+"""
+import json
+import sqlite3
+from collections import OrderedDict
+
+
+class Cache:
+    """
+    Keeps at most ``size`` entries in memory. Immutable entries are also
+    written to the SQLite database at ``path`` if given, so they survive
+    restarts. Mutable entries are kept in memory only, since the events
+    which would invalidate them may be missed while the client is down.
+    """
+    # Entries written to the database per commit.
+    COMMIT_EVERY = 100
+
+    def __init__(self, size: int = 10000, path: str = None):
+        self._size = size
+        self._entries = OrderedDict()
+        self._db = None
+        self._uncommitted = 0
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default=None):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self._db is not None:
+            row = self._db.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self.hits += 1
+                value = json.loads(row[0])
+                self._remember(key, value)
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value, immutable: bool = False) -> None:
+        self._remember(key, value)
+        if immutable and self._db is not None:
+            self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?)', (key, json.dumps(value)))
+            self._uncommitted += 1
+            if self._uncommitted >= self.COMMIT_EVERY:
+                self.flush()
+
+    def flush(self) -> None:
+        if self._db is not None and self._uncommitted:
+            self._db.commit()
+            self._uncommitted = 0
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def _remember(self, key: str, value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
@@ -0,0 +1,181 @@
+import asyncio
+import time
+
+from .cache import Cache
+from .transport import BatchingTransport, HttpPool, JsonRpcError
+
+U_SECONDS_DAY = 86400000000
+
+
+class AuthorizationClient:
+    """
+    Readonly client of the Authorization SCORE on the JSON-RPC endpoint at
+    ``url``. Concurrent calls are sent in JSON-RPC batches over a pool of
+    ``pool_size`` connections, so many reads are best made with
+    ``asyncio.gather``.
+
+    Results which can no longer change are cached: the excess of a day once
+    no settlement can add to its snapshot, and the proposal data of a
+    submitted game. The status of a game is cached until
+    :meth:`handle_eventlog` sees it change, so the client expects to be fed
+    the eventlogs of the SCORE when it caches the statuses, which it does
+    with ``cache_status``. The wagers and payouts of a day once it is over
+    are then cached too, in memory only, until a game is approved or stops
+    being approved, since they are listed for the approved games.
+    """
+    # Microseconds after its end a day is still treated as mutable, to allow
+    # for the skew between the clock and the timestamps of the blocks.
+    DAY_END_MARGIN = 10 * 60 * 1000000
+
+    def __init__(self, url: str, score: str, pool_size: int = 8, batch_size: int = 50,
+                 batch_delay: float = 0.002, cache: Cache = None, cache_status: bool = False, clock=None):
+        """
+        :param clock: Callable returning the current timestamp in microseconds,
+                      the system clock by default
+        """
+        self.score = score
+        self.cache = cache or Cache()
+        self._transport = BatchingTransport(HttpPool(url, pool_size), batch_size, batch_delay)
+        self._cache_status = cache_status
+        self._clock = clock or (lambda: int(time.time() * 1000000))
+        # Changes seen by handle_eventlog per game, so a status read while
+        # the status changed is not cached.
+        self._status_changes = {}
+        # Changes of the approved games seen by handle_eventlog, part of the
+        # keys of the cached days so the ones cached before are not used.
+        self._approval_changes = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self) -> None:
+        await self._transport.close()
+        self.cache.close()
+
+    @property
+    def batches(self) -> int:
+        return self._transport.batches
+
+    @property
+    def requests(self) -> int:
+        return self._transport.requests
+
+    async def call(self, method: str, params: dict = None):
+        """Calls a readonly method of the SCORE, without caching."""
+        data = {'method': method}
+        if params:
+            data['params'] = params
+        future = self._transport.request('icx_call', {'to': self.score, 'dataType': 'call', 'data': data})
+        # The future may be shared with identical calls, which must not be
+        # cancelled along with this one.
+        return await asyncio.shield(future)
+
+    def today(self) -> int:
+        return self._clock() // U_SECONDS_DAY
+
+    def _is_over(self, day: int) -> bool:
+        return (day + 1) * U_SECONDS_DAY + self.DAY_END_MARGIN <= self._clock()
+
+    async def _get_day(self, method: str, day: int) -> dict:
+        if day is None:
+            return await self.call(method)
+        if day < 1:
+            raise ValueError('day must be an absolute day index')
+        if not self._cache_status or not self._is_over(day):
+            return await self.call(method, {'day': hex(day)})
+        changes = self._approval_changes
+        key = f'{method}:{day}:{changes}'
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.call(method, {'day': hex(day)})
+            if self._approval_changes == changes:
+                self.cache.put(key, result)
+        return result
+
+    async def get_daily_wagers(self, day: int = None) -> dict:
+        """Returns the wagers of the games on the day, today by default."""
+        return await self._get_day('get_daily_wagers', day)
+
+    async def get_daily_payouts(self, day: int = None) -> dict:
+        """Returns the payouts of the games on the day, today by default."""
+        return await self._get_day('get_daily_payouts', day)
+
+    async def get_games_excess(self, day: int = None) -> dict:
+        """
+        Returns the excess of the games on the day, today by default. Past
+        days are read from their excess snapshot, and only cached once it
+        exists and the day after is over, since games approved after the
+        settlement are added to it by a settlement on that day.
+        """
+        if day is None:
+            return await self.call('get_games_excess')
+        if day < 1:
+            raise ValueError('day must be an absolute day index')
+        key = f'get_games_excess:{day}'
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        if self._is_over(day + 1):
+            try:
+                result = (await self.call('get_excess_snapshot', {'day': hex(day)}))['games']
+            except JsonRpcError:
+                pass
+            else:
+                self.cache.put(key, result, immutable=True)
+                return result
+        return await self.call('get_games_excess', {'day': hex(day)})
+
+    async def get_proposal_data(self, game: str) -> str:
+        """Returns the proposal data of the game, empty if it was not submitted."""
+        key = f'get_proposal_data:{game}'
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.call('get_proposal_data', {'_scoreAddress': game})
+            if result:
+                self.cache.put(key, result, immutable=True)
+        return result
+
+    async def get_game_status(self, game: str) -> str:
+        """Returns the status of the game."""
+        if not self._cache_status:
+            return await self.call('get_game_status', {'_scoreAddress': game})
+        key = f'get_game_status:{game}'
+        result = self.cache.get(key)
+        if result is None:
+            changes = self._status_changes.get(game, 0)
+            result = await self.call('get_game_status', {'_scoreAddress': game})
+            if self._status_changes.get(game, 0) == changes:
+                self.cache.put(key, result)
+        return result
+
+    def handle_eventlog(self, eventlog: dict) -> None:
+        """
+        Updates the cached status of a game from a GameStatusChanged
+        eventlog of the SCORE, given as in the eventLogs of a transaction
+        result, and drops the cached days if the game was or is approved.
+        Other eventlogs are ignored.
+        """
+        indexed = eventlog.get('indexed') or []
+        if eventlog.get('scoreAddress') != self.score or not indexed:
+            return
+        if indexed[0].split('(', 1)[0] == 'GameStatusChanged':
+            game = indexed[1]
+            self._status_changes[game] = self._status_changes.get(game, 0) + 1
+            self.cache.put(f'get_game_status:{game}', indexed[2])
+            if 'gameApproved' in (indexed[2], (eventlog.get('data') or [None])[0]):
+                self._approval_changes += 1
+
+    async def get_days(self, method: str, days) -> dict:
+        """
+        Calls get_daily_wagers, get_daily_payouts or get_games_excess for
+        every day at once.
+        :return: Dictionary of day to result
+        """
+        if method not in ('get_daily_wagers', 'get_daily_payouts', 'get_games_excess'):
+            raise ValueError(f'{method} is not a per day method')
+        days = list(days)
+        results = await asyncio.gather(*(getattr(self, method)(day) for day in days))
+        return dict(zip(days, results))
@@ -0,0 +1,172 @@
+"""
+JSON-RPC over a bounded pool of keep-alive HTTP/1.1 connections.
+
+:class:`BatchingTransport` coalesces the requests made while a batch is
+being gathered into one JSON-RPC batch, and shares the result of a request
+with every identical request made while it is in flight.
+"""
+import asyncio
+import json
+import ssl
+from urllib.parse import urlsplit
+
+
+class JsonRpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(f'{message} ({code})')
+        self.code = code
+        self.message = message
+
+
+class HttpPool:
+    """At most ``size`` connections to the host of ``url``, reused between requests."""
+
+    def __init__(self, url: str, size: int = 8, timeout: float = 30.0):
+        parts = urlsplit(url)
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self._ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self._path = parts.path or '/'
+        self._timeout = timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def post(self, body: bytes) -> bytes:
+        """Posts the body and returns the response body, retrying once on a stale connection."""
+        async with self._slots:
+            for attempt in range(2):
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await asyncio.wait_for(
+                    asyncio.open_connection(self._host, self._port, ssl=self._ssl), self._timeout)
+                try:
+                    response, keep_alive = await asyncio.wait_for(self._exchange(reader, writer, body),
+                                                                  self._timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    async def _exchange(self, reader, writer, body: bytes) -> tuple:
+        writer.write((f'POST {self._path} HTTP/1.1\r\nHost: {self._host}\r\n'
+                      f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+                      f'Connection: keep-alive\r\n\r\n').encode() + body)
+        await writer.drain()
+        status = (await reader.readuntil(b'\r\n')).decode().split(' ', 2)
+        headers = {}
+        while True:
+            line = (await reader.readuntil(b'\r\n')).decode().strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                length = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                if length == 0:
+                    while await reader.readuntil(b'\r\n') != b'\r\n':
+                        pass
+                    break
+                chunks.append(await reader.readexactly(length))
+                await reader.readexactly(2)
+            response = b''.join(chunks)
+        else:
+            response = await reader.readexactly(int(headers.get('content-length', 0)))
+        keep_alive = status[0] == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        return response, keep_alive
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class BatchingTransport:
+    """
+    Sends JSON-RPC requests in batches of at most ``batch_size``. A batch is
+    sent once it is full or ``batch_delay`` seconds after its first request.
+    """
+
+    def __init__(self, pool: HttpPool, batch_size: int = 50, batch_delay: float = 0.002):
+        self._pool = pool
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+        self._pending = []
+        self._flush_handle = None
+        self._in_flight = {}
+        self._next_id = 1
+        self._tasks = set()
+        # Batches and requests sent, for the callers measuring them.
+        self.batches = 0
+        self.requests = 0
+
+    def request(self, method: str, params: dict) -> asyncio.Future:
+        key = json.dumps([method, params], sort_keys=True)
+        future = self._in_flight.get(key)
+        if future is not None:
+            return future
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        self._pending.append((method, params, future))
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._batch_delay, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list) -> None:
+        futures = {}
+        requests = []
+        for method, params, future in batch:
+            futures[self._next_id] = future
+            requests.append({'jsonrpc': '2.0', 'method': method, 'id': self._next_id, 'params': params})
+            self._next_id += 1
+        self.batches += 1
+        self.requests += len(requests)
+        try:
+            responses = json.loads(await self._pool.post(json.dumps(requests).encode()))
+            if isinstance(responses, dict):
+                error = responses.get('error', {})
+                raise JsonRpcError(error.get('code', 0), error.get('message', 'Invalid batch response'))
+            for response in responses:
+                future = futures.pop(response.get('id'), None)
+                if future is None or future.done():
+                    continue
+                if 'error' in response:
+                    future.set_exception(JsonRpcError(response['error'].get('code', 0),
+                                                      response['error'].get('message', '')))
+                else:
+                    future.set_result(response.get('result'))
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(JsonRpcError(0, 'Missing response in batch'))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def close(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._pool.close()
@@ -0,0 +1,121 @@
+"""
+Benchmarks the hot paths of the Authorization SCORE on a :class:`LocalChain`.
+
+For every catalog size the chain is populated with that many approved
+games, then each scenario is run a few times and the mean wall time and
+the storage reads, writes and deletes of one call are reported::
+
+    python -m harness.benchmark
+    python -m harness.benchmark --sizes 10 100 --repeat 5
+"""
+import argparse
+import json
+
+from .chain import OWNER, LocalChain, address
+
+MULTIPLIER = 10 ** 18
+ROULETTE = address('hx', 0xbeef)
+GAME_PREFIX = 0x1000
+SIZES = (10, 100, 1000)
+
+
+def game_data(game, owner) -> str:
+    return json.dumps({
+        'name': f'game {game}', 'scoreAddress': str(game), 'minBet': MULTIPLIER // 10,
+        'maxBet': 100 * MULTIPLIER, 'houseEdge': '1.5', 'gameType': 'Per wager settlement',
+        'revShareMetadata': '', 'revShareWalletAddress': str(owner), 'linkProofPage': '',
+        'gameUrlMainnet': '', 'gameUrlTestnet': '', 'maxPayout': 100 * MULTIPLIER,
+    })
+
+
+def expect(result):
+    if result.error is not None:
+        raise result.error
+    return result
+
+
+def submit_game(chain: LocalChain, number: int):
+    game = address('cx', GAME_PREFIX + number)
+    owner = address('hx', GAME_PREFIX + number)
+    chain.register_game(game, owner)
+    result = expect(chain.call('submit_game_proposal', game_data(game, owner), sender=owner,
+                               value=50 * MULTIPLIER))
+    return game, owner, result
+
+
+def approve_game(chain: LocalChain, game, owner) -> None:
+    expect(chain.call('set_game_status', 'proposalApproved', game))
+    expect(chain.call('set_game_ready', game, sender=owner))
+    expect(chain.call('set_game_status', 'gameApproved', game))
+    expect(chain.call('set_maximum_payout', game, 100 * MULTIPLIER))
+
+
+def populate(size: int) -> tuple:
+    """Returns a chain with ``size`` approved games that all played today."""
+    chain = LocalChain()
+    expect(chain.call('set_roulette_score', ROULETTE))
+    expect(chain.call('set_super_admin', OWNER))
+    expect(chain.call('set_game_developers_share', 20))
+    expect(chain.call('set_maximum_loss', 1000 * MULTIPLIER))
+    expect(chain.call('set_new_div_changing_time', chain.timestamp))
+    games = []
+    for number in range(size):
+        game, owner, _ = submit_game(chain, number)
+        approve_game(chain, game, owner)
+        expect(chain.call('accumulate_daily_wagers', game, 10 * MULTIPLIER, sender=ROULETTE))
+        games.append(game)
+    return chain, games
+
+
+def measure(chain: LocalChain, repeat: int, call) -> dict:
+    """Runs ``call(chain, iteration)`` and returns the mean time and last ops."""
+    elapsed = 0.0
+    result = None
+    for iteration in range(repeat):
+        result = expect(call(chain, iteration))
+        elapsed += result.elapsed
+    return dict(result.ops, ms=elapsed / repeat * 1000)
+
+
+def run_size(size: int, repeat: int) -> list:
+    chain, games = populate(size)
+    game = games[size // 2]
+    rows = []
+
+    def row(name, call):
+        rows.append(dict(measure(chain, repeat, call), size=size, method=name))
+
+    row('accumulate_daily_wagers',
+        lambda c, i: c.call('accumulate_daily_wagers', game, MULTIPLIER, sender=ROULETTE))
+    row('accumulate_daily_payouts',
+        lambda c, i: c.call('accumulate_daily_payouts', game, MULTIPLIER // 2, sender=ROULETTE))
+    expect(chain.call('toggle_apply_watch_dog_method'))
+    row('accumulate_daily_payouts (watchdog)',
+        lambda c, i: c.call('accumulate_daily_payouts', game, MULTIPLIER // 2, sender=ROULETTE))
+    expect(chain.call('toggle_apply_watch_dog_method'))
+    row('get_approved_games', lambda c, i: c.call('get_approved_games'))
+    row('get_excess', lambda c, i: c.call('get_excess'))
+
+    def record_excess(c, i):
+        c.advance_days()
+        return c.call('record_excess', sender=ROULETTE)
+    row('record_excess', record_excess)
+    row('submit_game_proposal', lambda c, i: submit_game(c, size + i)[2])
+    return rows
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of approved games')
+    parser.add_argument('--repeat', type=int, default=3, help='calls measured per scenario')
+    args = parser.parse_args(argv)
+
+    print(f'{"games":>6}  {"method":<36} {"ms":>9} {"reads":>7} {"writes":>7} {"deletes":>7}')
+    for size in args.sizes:
+        for row in run_size(size, args.repeat):
+            print(f'{row["size"]:>6}  {row["method"]:<36} {row["ms"]:>9.3f} {row["reads"]:>7} '
+                  f'{row["writes"]:>7} {row["deletes"]:>7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+A single-SCORE local chain on top of :mod:`harness.standin`.
+
+:class:`LocalChain` deploys the Authorization SCORE into a
+:class:`~harness.standin.MemoryDatabase` and runs calls as transactions:
+state and eventlogs are rolled back when a call reverts, and the storage
+operations of every call are reported.
+"""
+import importlib
+import sys
+import time
+
+from . import standin
+from .standin import Address, IconScoreException, MemoryDatabase, ScoreContext
+
+U_SECONDS_DAY = 86400000000
+SCORE_ADDRESS = Address.from_string('cx' + '0' * 39 + '1')
+OWNER = Address.from_string('hx' + '0' * 39 + '1')
+
+
+def address(prefix: str, number: int) -> Address:
+    return Address.from_string(f'{prefix}{number:040x}')
+
+
+def load_score_class(module: str = 'authorization.authorization', attribute: str = 'Authorization'):
+    """Imports a SCORE module against the stand-in and returns its main class."""
+    standin.install()
+    if module in sys.modules:
+        return getattr(sys.modules[module], attribute)
+    return getattr(importlib.import_module(module), attribute)
+
+
+class CallResult:
+    def __init__(self, value, ops: dict, events: list, error: IconScoreException = None,
+                 elapsed: float = 0.0):
+        self.value = value
+        self.ops = ops
+        self.events = events
+        self.error = error
+        # Wall time of the SCORE method alone, in seconds.
+        self.elapsed = elapsed
+
+
+class GameScore:
+    """Minimal game SCORE answering ``get_score_owner``."""
+
+    def __init__(self, owner: Address):
+        self._owner = owner
+
+    def get_score_owner(self) -> Address:
+        return self._owner
+
+
+class LocalChain:
+    def __init__(self, score_class=None, timestamp: int = 100 * U_SECONDS_DAY, owner: Address = OWNER):
+        self.db = MemoryDatabase()
+        self.context = ScoreContext(owner, SCORE_ADDRESS, timestamp)
+        self.db.context = self.context
+        self.score_class = score_class or load_score_class()
+        self.score = self.score_class(self.db)
+        self._run(self.score.on_install, owner, 0, (), {})
+
+    @property
+    def counter(self):
+        return self.db.counter
+
+    @property
+    def timestamp(self) -> int:
+        return self.context.timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: int) -> None:
+        self.context.timestamp = value
+
+    @property
+    def day(self) -> int:
+        return self.context.timestamp // U_SECONDS_DAY
+
+    def advance_days(self, days: int = 1) -> None:
+        self.context.timestamp += days * U_SECONDS_DAY
+
+    def register_game(self, game: Address, owner: Address) -> None:
+        self.context.scores[game] = GameScore(owner)
+
+    def update(self, score_class=None) -> CallResult:
+        """Redeploys the SCORE on the same storage and runs ``on_update``."""
+        if score_class is not None:
+            self.score_class = score_class
+        self.score = self.score_class(self.db)
+        return self._run(self.score.on_update, self.context.owner, 0, (), {})
+
+    def call(self, method: str, *args, sender: Address = None, value: int = 0, **kwargs) -> CallResult:
+        """Runs one transaction. Reverts roll back storage and eventlogs."""
+        sender = sender or self.context.owner
+        return self._run(lambda *a, **k: getattr(self.score, method)(*a, **k), sender, value, args, kwargs)
+
+    def query(self, method: str, *args, **kwargs):
+        """Runs a readonly call and returns its value, re-raising reverts."""
+        result = self.call(method, *args, **kwargs)
+        if result.error is not None:
+            raise result.error
+        return result.value
+
+    def _run(self, func, sender: Address, value: int, args, kwargs) -> CallResult:
+        self.context.msg = standin.Message(sender, value)
+        self.context.tx = standin.Transaction(sender)
+        self.context.events = []
+        store = dict(self.db.store)
+        self.db.counter.reset()
+        # Containers are rebuilt per transaction on a node, so the ArrayDB
+        # size reads in ``__init__`` are part of every call.
+        if func.__name__ not in ('on_install', 'on_update'):
+            self.score = self.score_class(self.db)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            error = None
+        except IconScoreException as e:
+            self.db.store = store
+            self.context.events = []
+            result, error = None, e
+        elapsed = time.perf_counter() - start
+        return CallResult(result, self.db.counter.snapshot(), list(self.context.events), error, elapsed)
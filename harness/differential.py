@@ -0,0 +1,442 @@
+"""
+Differential testing of two implementations of the Authorization SCORE.
+
+Randomized traces of proposals, status transitions, wagers, payouts,
+watchdog changes, day rollovers and settlements are run through a
+reference and a candidate implementation, each on its own
+:class:`LocalChain`. After every step the return values, reverts, eventlogs
+and the outputs of the getters of both are compared, and the first
+divergence is reported with a shrunk trace reproducing it. Only the
+methods and eventlogs both implementations define are used. Like the
+roulette, a trace records the excess at most once a day.
+
+Intended changes are declared so they don't stop the traces: ``--ignore``
+leaves a method, getter or eventlog out of the comparison, and ``--allow``
+lets the divergences whose description matches a pattern through, counting
+them. The reverts reworded since the baseline and the order of the
+approved games are already known. ``--upgrade N`` runs the reference on
+both chains for the first N steps of every trace, then runs on_update on
+both, updating the candidate chain to the candidate and completing its
+storage migration, so the candidate continues on the storage the reference
+left.
+
+The storage operations of both are summed per method, so a change to the
+hot paths is shown equivalent and measured in one run::
+
+    python -m harness.differential --reference HEAD --traces 20 --steps 300
+    python -m harness.differential --reference 26a5515 --unordered
+    python -m harness.differential --reference 26a5515 --upgrade 100 --ignore get_yesterdays_games_excess \\
+        --allow 'get_games_excess(*)'
+"""
+import argparse
+import fnmatch
+import os
+import random
+import subprocess
+import sys
+import types
+
+from . import standin
+from .benchmark import MULTIPLIER, ROULETTE, game_data
+from .chain import OWNER, U_SECONDS_DAY, LocalChain, address, load_score_class
+from .standin import Address
+
+SCORE_PATH = 'authorization/authorization.py'
+GAME_PREFIX = 0x2000
+STATUS_TYPE = ['waiting', 'proposalApproved', 'proposalRejected', 'gameReady',
+               'gameApproved', 'gameRejected', 'gameSuspended', 'gameDeleted']
+# Statuses an admin may move a game to from each status.
+NEXT_STATUSES = {
+    'waiting': ['proposalApproved', 'proposalRejected'],
+    'gameReady': ['gameApproved', 'gameRejected'],
+    'gameApproved': ['gameSuspended'],
+    'gameSuspended': ['gameApproved', 'gameDeleted'],
+}
+GETTERS = ['get_approved_games', 'get_score_list', 'get_excess', 'get_todays_games_excess',
+           'get_yesterdays_games_excess', 'get_daily_wagers', 'get_daily_payouts', 'get_admin',
+           'get_apply_watch_dog_method', 'get_maximum_loss', 'get_game_developers_share',
+           'get_new_div_changing_time']
+# Revert messages of the reference reworded by the candidate, compared as the
+# candidate's.
+REWORDED_REVERTS = {
+    'Only roulette score can invoke this method.': 'Only roulette score or an accumulator can invoke this method.',
+}
+# Getters whose lists are compared regardless of their order. The approved
+# games are listed in the order of the status index, which removals reorder.
+UNORDERED_GETTERS = ['get_approved_games']
+GAME_GETTERS = ['get_game_status', 'get_maximum_payout', 'get_proposal_data', 'get_revshare_wallet_address']
+
+
+def load_revision(revision: str, path: str = SCORE_PATH):
+    """Returns the SCORE class of ``path`` at a git revision of this repository."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    source = subprocess.check_output(['git', 'show', f'{revision}:{path}'], cwd=root)
+    return load_source(source.decode(), f'{path}@{revision}')
+
+
+def load_source(source: str, filename: str, attribute: str = 'Authorization'):
+    """Executes SCORE source code against the stand-in and returns its main class."""
+    standin.install()
+    module = types.ModuleType(f'authorization_{abs(hash(filename))}')
+    module.__file__ = filename
+    exec(compile(source, filename, 'exec'), module.__dict__)
+    sys.modules[module.__name__] = module
+    return getattr(module, attribute)
+
+
+def normalize(value, unordered: bool = False):
+    """Makes a value comparable across implementations and printable."""
+    if isinstance(value, Address):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, dict):
+        return {str(key): normalize(item, unordered) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [normalize(item, unordered) for item in value]
+        return sorted(items, key=repr) if unordered else items
+    return value
+
+
+def eventlog_names(score_class) -> set:
+    return {name for name in dir(score_class) if hasattr(getattr(score_class, name), '__eventlog__')}
+
+
+def readonly_methods(score_class) -> set:
+    return {name for name in dir(score_class) if getattr(getattr(score_class, name), '__readonly__', False)}
+
+
+def external_methods(score_class) -> set:
+    return {name for name in dir(score_class) if getattr(getattr(score_class, name), '__external__', False)}
+
+
+class Divergence(Exception):
+    def __init__(self, step: int, what: str, reference, candidate):
+        super().__init__(f'step {step}: {what} differs\n  reference: {reference}\n  candidate: {candidate}')
+        self.step = step
+        self.what = what
+        # Steps run up to and including the diverging one.
+        self.steps = []
+
+
+class Step:
+    """
+    One transaction of a trace, a clock advance if ``method`` is None, or
+    the update of the candidate chain to the candidate if ``upgrade`` is set.
+    """
+
+    def __init__(self, method: str = None, args: tuple = (), sender: Address = OWNER, value: int = 0,
+                 advance: int = 0, game: tuple = None, upgrade: bool = False):
+        self.method = method
+        self.args = args
+        self.sender = sender
+        self.value = value
+        self.advance = advance
+        # (game, owner) registered on the chains before the call.
+        self.game = game
+        self.upgrade = upgrade
+
+    def run(self, chain: LocalChain):
+        if self.game is not None:
+            chain.register_game(*self.game)
+        if self.method is None:
+            chain.timestamp += self.advance
+            return None
+        return chain.call(self.method, *self.args, sender=self.sender, value=self.value)
+
+    def __repr__(self):
+        if self.upgrade:
+            return 'update()'
+        if self.method is None:
+            return f'advance({self.advance})'
+        args = ', '.join(repr(normalize(arg)) for arg in self.args)
+        return f'{self.method}({args}) from {self.sender}'
+
+
+class Differential:
+    def __init__(self, reference, candidate, unordered: bool = False, ignore: list = (), allow: list = (),
+                 upgrade: int = None):
+        """
+        :param ignore: Names of the methods, getters and eventlogs left out of
+                       the comparison
+        :param allow: fnmatch patterns of the descriptions of the divergences
+                      let through, such as 'get_excess()' or 'revert of *'
+        :param upgrade: Number of steps of every trace run with the reference
+                        before the candidate chain is updated to the
+                        candidate, None to run the candidate from the start
+        """
+        self.reference = reference
+        self.candidate = candidate
+        self.unordered = unordered
+        self.ignore = set(ignore)
+        self.allow = list(allow)
+        self.upgrade = upgrade
+        self.methods = external_methods(reference) & external_methods(candidate)
+        self.getters = readonly_methods(reference) & readonly_methods(candidate)
+        self.eventlogs = (eventlog_names(reference) & eventlog_names(candidate)) - self.ignore
+        # Calls and storage operations per method of each implementation.
+        self.ops = {}
+        # Divergences let through per pattern of allow.
+        self.allowed = {pattern: 0 for pattern in self.allow}
+
+    def setup(self) -> list:
+        steps = [
+            Step('set_roulette_score', (ROULETTE,)),
+            Step('set_super_admin', (OWNER,)),
+            Step('set_game_developers_share', (20,)),
+            Step('set_maximum_loss', (1000 * MULTIPLIER,)),
+            Step('set_new_div_changing_time', (0,)),
+        ]
+        steps = [step for step in steps if step.method in self.methods]
+        if self.upgrade is not None and self.upgrade <= len(steps):
+            steps.insert(self.upgrade, Step(upgrade=True))
+        return steps
+
+    def generate(self, rng: random.Random, chain: LocalChain, games: list, recorded: set = frozenset()):
+        """
+        Returns the next step, picked with the reference chain's state. The
+        excess is not recorded again on a day in ``recorded``.
+        """
+        kinds = ['submit', 'status', 'ready', 'wager', 'wager', 'wager', 'payout', 'payout', 'payout',
+                 'advance', 'advance', 'record', 'max_payout', 'max_loss', 'watchdog', 'div_time', 'share']
+        while True:
+            kind = rng.choice(kinds if games else ['submit'])
+            game, owner = rng.choice(games) if games else (None, None)
+            status = chain.query('get_game_status', game) if game is not None else ''
+            if kind == 'submit':
+                number = len(games)
+                game, owner = address('cx', GAME_PREFIX + number), address('hx', GAME_PREFIX + number)
+                games.append((game, owner))
+                step = Step('submit_game_proposal', (game_data(game, owner),), owner, 50 * MULTIPLIER,
+                            game=(game, owner))
+            elif kind == 'status':
+                statuses = NEXT_STATUSES.get(status, [])
+                if not statuses or rng.random() < 0.1:
+                    statuses = STATUS_TYPE
+                step = Step('set_game_status', (rng.choice(statuses), game))
+            elif kind == 'ready':
+                step = Step('set_game_ready', (game,), owner if rng.random() < 0.9 else OWNER)
+            elif kind in ('wager', 'payout'):
+                approved = [pair for pair in games if chain.query('get_game_status', pair[0]) == 'gameApproved']
+                if approved and rng.random() < 0.9:
+                    game, _ = rng.choice(approved)
+                amount = rng.randint(1, 40) * MULTIPLIER // rng.choice([1, 4, 10])
+                method = 'accumulate_daily_wagers' if kind == 'wager' else 'accumulate_daily_payouts'
+                step = Step(method, (game, amount), ROULETTE if rng.random() < 0.95 else OWNER)
+            elif kind == 'advance':
+                hours = rng.choice([1, 3, 8, 24, 30])
+                step = Step(advance=hours * 3600 * 1000000)
+            elif kind == 'record':
+                if chain.day in recorded:
+                    continue
+                step = Step('record_excess', (), ROULETTE)
+            elif kind == 'max_payout':
+                step = Step('set_maximum_payout', (game, rng.choice([5, 20, 100]) * MULTIPLIER))
+            elif kind == 'max_loss':
+                step = Step('set_maximum_loss', (rng.choice([10, 50, 1000]) * MULTIPLIER,))
+            elif kind == 'watchdog':
+                step = Step('toggle_apply_watch_dog_method')
+            elif kind == 'div_time':
+                day = chain.timestamp // U_SECONDS_DAY + rng.choice([-2, 0, 1])
+                step = Step('set_new_div_changing_time', (day * U_SECONDS_DAY,))
+            else:
+                step = Step('set_game_developers_share', (rng.choice([10, 20, 30]),))
+            if step.method is None or step.method in self.methods:
+                return step
+
+    def run(self, steps: list, rng: random.Random = None, length: int = 0, record_ops: bool = False) -> list:
+        """
+        Runs the steps, then ``length`` generated ones if ``rng`` is given, on
+        both implementations, and returns the steps run. Raises Divergence.
+        """
+        reference = LocalChain(self.reference)
+        candidate = LocalChain(self.candidate if self.upgrade is None else self.reference)
+        upgraded = self.upgrade is None
+        recorded = set()
+        games = []
+        steps = list(steps)
+        number = 0
+        while number < len(steps) or (rng is not None and number < len(self.setup()) + length):
+            if number == len(steps):
+                if number == self.upgrade:
+                    steps.append(Step(upgrade=True))
+                else:
+                    steps.append(self.generate(rng, reference, games, recorded))
+            step = steps[number]
+            if step.game is not None and step.game not in games:
+                games.append(step.game)
+            try:
+                if step.upgrade:
+                    self._upgrade(number, reference, candidate)
+                    upgraded = True
+                elif step.method == 'record_excess' and reference.day in recorded:
+                    # The roulette records the excess once a day.
+                    pass
+                else:
+                    day = reference.day
+                    result = step.run(reference)
+                    self._compare_step(number, step, result, step.run(candidate), record_ops and upgraded,
+                                       upgraded)
+                    if step.method == 'record_excess' and result.error is None:
+                        recorded.add(day)
+                self._compare_getters(number, reference, candidate, games)
+            except Divergence as divergence:
+                divergence.steps = steps[:number + 1]
+                raise
+            number += 1
+        return steps
+
+    def _upgrade(self, number: int, reference: LocalChain, candidate: LocalChain) -> None:
+        """
+        Runs on_update of the reference on the reference chain and updates the
+        candidate chain to the candidate, then completes the migration of its
+        storage if the candidate has one.
+        """
+        for chain, score_class in ((reference, self.reference), (candidate, self.candidate)):
+            result = chain.update(score_class)
+            if result.error is not None:
+                raise Divergence(number, f'on_update of {score_class.__name__}', None, result.error.message)
+        if 'migrate' in external_methods(self.candidate):
+            done = False
+            while not done:
+                result = candidate.call('migrate', 100)
+                if result.error is not None:
+                    raise Divergence(number, 'migrate', None, result.error.message)
+                done = result.value
+
+    def _diverge(self, number: int, what: str, reference, candidate) -> None:
+        """Raises the divergence unless a pattern of allow matches it."""
+        for pattern in self.allow:
+            if fnmatch.fnmatchcase(what, pattern):
+                self.allowed[pattern] += 1
+                return
+        raise Divergence(number, what, reference, candidate)
+
+    def _compare_step(self, number: int, step: Step, reference, candidate, record_ops: bool,
+                      upgraded: bool = True) -> None:
+        if step.method is None:
+            return
+        if step.method not in self.ignore:
+            message = reference.error and reference.error.message
+            if upgraded:
+                message = REWORDED_REVERTS.get(message, message)
+            for what, left, right in (
+                    ('revert', message, candidate.error and candidate.error.message),
+                    ('return value', normalize(reference.value), normalize(candidate.value)),
+                    ('eventlogs', self._eventlogs(reference), self._eventlogs(candidate))):
+                if left != right:
+                    self._diverge(number, f'{what} of {step}', left, right)
+        if record_ops:
+            counts = self.ops.setdefault(step.method, [0, [0, 0, 0], [0, 0, 0]])
+            counts[0] += 1
+            for ops, result in ((counts[1], reference), (counts[2], candidate)):
+                ops[0] += result.ops['reads']
+                ops[1] += result.ops['writes']
+                ops[2] += result.ops['deletes']
+
+    def _eventlogs(self, result) -> list:
+        return [normalize([name, values]) for name, values in result.events if name in self.eventlogs]
+
+    def _compare_getters(self, number: int, reference: LocalChain, candidate: LocalChain, games: list) -> None:
+        getters = self.getters - self.ignore
+        calls = [(getter, ()) for getter in GETTERS if getter in getters]
+        calls += [(getter, (game,)) for getter in GAME_GETTERS if getter in getters for game, _ in games]
+        if 'get_games_excess' in getters:
+            calls.append(('get_games_excess', (-1,)))
+        for getter, args in calls:
+            left, right = reference.call(getter, *args), candidate.call(getter, *args)
+            unordered = self.unordered or getter in UNORDERED_GETTERS
+            left = (left.error and left.error.message, normalize(left.value, unordered))
+            right = (right.error and right.error.message, normalize(right.value, unordered))
+            if left != right:
+                args = ', '.join(repr(normalize(arg)) for arg in args)
+                self._diverge(number, f'{getter}({args})', left, right)
+
+    def shrink(self, divergence: Divergence) -> Divergence:
+        """
+        Removes steps from the trace of a divergence while the same call
+        keeps diverging, and returns the divergence of the shortest trace.
+        """
+        fixed = len(self.setup())
+        kind = divergence.what.split('(', 1)[0]
+        steps = divergence.steps
+
+        def diverges(trace):
+            nonlocal divergence
+            try:
+                self.run(trace)
+            except Divergence as shrunk:
+                if shrunk.what.split('(', 1)[0] == kind:
+                    divergence = shrunk
+                    return True
+            return False
+
+        chunk = max((len(steps) - fixed) // 2, 1)
+        while True:
+            index = fixed
+            while index < len(steps):
+                trace = steps[:index] + steps[index + chunk:]
+                if diverges(trace):
+                    steps = trace
+                else:
+                    index += chunk
+            if chunk == 1:
+                return divergence
+            chunk //= 2
+
+    def ops_report(self) -> str:
+        lines = [f'{"method":<36} {"calls":>6} {"reads":>15} {"writes":>15} {"deletes":>15}']
+        for method, (calls, reference, candidate) in sorted(self.ops.items()):
+            cells = [f'{left / calls:>6.1f}>{right / calls:<8.1f}'
+                     for left, right in ((reference[i], candidate[i]) for i in range(3))]
+            lines.append(f'{method:<36} {calls:>6} ' + ' '.join(f'{cell:>15}' for cell in cells))
+        return '\n'.join(lines)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reference', default='HEAD', help='git revision of the reference implementation')
+    parser.add_argument('--candidate', help=f'path of the candidate implementation, {SCORE_PATH} by default')
+    parser.add_argument('--traces', type=int, default=10, help='number of traces')
+    parser.add_argument('--steps', type=int, default=200, help='generated steps per trace')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first trace')
+    parser.add_argument('--unordered', action='store_true', help='compare lists regardless of their order')
+    parser.add_argument('--no-shrink', action='store_true', help='report diverging traces unshrunk')
+    parser.add_argument('--ignore', action='append', default=[], metavar='NAME',
+                        help='method, getter or eventlog left out of the comparison, repeatable')
+    parser.add_argument('--allow', action='append', default=[], metavar='PATTERN',
+                        help="fnmatch pattern of the divergences let through, such as 'get_excess()', "
+                             "repeatable")
+    parser.add_argument('--upgrade', type=int, metavar='N',
+                        help='run the reference for the first N steps of every trace, then update the '
+                             'candidate chain to the candidate')
+    args = parser.parse_args(argv)
+
+    reference = load_revision(args.reference)
+    if args.candidate is None:
+        candidate = load_score_class()
+    else:
+        with open(args.candidate) as file:
+            candidate = load_source(file.read(), args.candidate)
+    differential = Differential(reference, candidate, args.unordered, args.ignore, args.allow, args.upgrade)
+    for seed in range(args.seed, args.seed + args.traces):
+        steps = differential.setup()
+        try:
+            differential.run(steps, random.Random(seed), args.steps, record_ops=True)
+        except Divergence as divergence:
+            if not args.no_shrink:
+                divergence = differential.shrink(divergence)
+            print(f'trace {seed} diverges at {divergence}')
+            print('trace:')
+            for number, step in enumerate(divergence.steps):
+                print(f'  {number:>4} {step}')
+            sys.exit(1)
+    print(f'{args.traces} traces of {args.steps} steps equivalent, storage operations per call '
+          f'(reference>candidate):')
+    print(differential.ops_report())
+    for pattern, count in differential.allowed.items():
+        print(f'{count} divergences allowed by {pattern!r}')
+
+
+if __name__ == '__main__':
+    main()
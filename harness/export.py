@@ -0,0 +1,169 @@
+"""
+Columnar export of the daily wagers, payouts and excess of the games.
+
+The export is built from the eventlogs of the Authorization SCORE, one
+JSON-RPC eventlog object (``scoreAddress``, ``indexed``, ``data``) per line,
+as found in the ``eventLogs`` of the transaction results:
+
+* ``WagersAccumulated`` and ``PayoutAccumulated`` carry the wagers and
+  payouts of the game's day so far, so the largest one of a game and day
+  is what the SCORE stores for it in ``_wagers`` and ``_payouts``;
+* ``ExcessRecorded`` carries the excess stored for the game and day in
+  ``_games_excess_history``.
+
+It is written as a directory of ``.npy`` files holding one row per game and
+day with a value, sorted by day then game::
+
+    day.npy      int32, index of the day
+    game.npy     int32, index of the game in games.json
+    wagers.npy   payouts.npy   excess.npy
+    games.json   meta.json
+
+Amounts don't fit in 64 bits, so the value columns are exact 128-bit ints
+stored as a structured array of a signed high and an unsigned low half.
+:class:`LedgerExport` opens the columns memory-mapped::
+
+    python -m harness.export eventlogs.jsonl ledger/
+    export = LedgerExport('ledger/')
+    wagers = export.matrix('wagers')  # float64, days x games
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+FORMAT_VERSION = 1
+VALUE_COLUMNS = ('wagers', 'payouts', 'excess')
+VALUE_DTYPE = np.dtype([('hi', '<i8'), ('lo', '<u8')])
+
+
+def _event_name(signature: str) -> str:
+    return signature.split('(', 1)[0]
+
+
+def read_eventlogs(path: str) -> dict:
+    """
+    Reads the eventlogs of a JSONL file into the values of every game and
+    day, ignoring the events which carry none.
+    :return: Dictionary of (day, game) to a list of wagers, payouts, excess
+    """
+    cells = {}
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                add_eventlog(cells, json.loads(line))
+    return cells
+
+
+def add_eventlog(cells: dict, eventlog: dict) -> None:
+    indexed = eventlog['indexed']
+    name = _event_name(indexed[0])
+    if name not in ('WagersAccumulated', 'PayoutAccumulated', 'ExcessRecorded'):
+        return
+    game = indexed[1]
+    day = int(indexed[2], 16)
+    value = int(eventlog['data'][0], 16)
+    cell = cells.setdefault((day, game), [0, 0, 0])
+    if name == 'WagersAccumulated':
+        cell[0] = max(cell[0], value)
+    elif name == 'PayoutAccumulated':
+        cell[1] = max(cell[1], value)
+    else:
+        cell[2] = value
+
+
+def to_columns(values: list) -> np.ndarray:
+    """Splits ints into the high and low halves of VALUE_DTYPE."""
+    column = np.empty(len(values), dtype=VALUE_DTYPE)
+    column['hi'] = [value >> 64 for value in values]
+    column['lo'] = [value & (2 ** 64 - 1) for value in values]
+    return column
+
+
+def write_export(path: str, cells: dict) -> None:
+    """
+    Writes the values of every game and day to an export directory.
+    :param cells: Dictionary of (day, game) to a list of wagers, payouts, excess
+    """
+    os.makedirs(path, exist_ok=True)
+    games = sorted({game for _, game in cells})
+    index = {game: number for number, game in enumerate(games)}
+    keys = sorted(cells, key=lambda key: (key[0], index[key[1]]))
+    np.save(os.path.join(path, 'day.npy'), np.array([day for day, _ in keys], dtype=np.int32))
+    np.save(os.path.join(path, 'game.npy'), np.array([index[game] for _, game in keys], dtype=np.int32))
+    for number, column in enumerate(VALUE_COLUMNS):
+        np.save(os.path.join(path, f'{column}.npy'), to_columns([cells[key][number] for key in keys]))
+    with open(os.path.join(path, 'games.json'), 'w') as file:
+        json.dump(games, file)
+    meta = {'version': FORMAT_VERSION, 'rows': len(keys),
+            'first_day': keys[0][0] if keys else 0, 'last_day': keys[-1][0] if keys else -1}
+    with open(os.path.join(path, 'meta.json'), 'w') as file:
+        json.dump(meta, file)
+
+
+class LedgerExport:
+    """Export directory with its columns memory-mapped read-only."""
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, 'meta.json')) as file:
+            self.meta = json.load(file)
+        if self.meta['version'] != FORMAT_VERSION:
+            raise ValueError(f'Unsupported export version {self.meta["version"]}')
+        with open(os.path.join(path, 'games.json')) as file:
+            self.games = json.load(file)
+        self.day = np.load(os.path.join(path, 'day.npy'), mmap_mode='r')
+        self.game = np.load(os.path.join(path, 'game.npy'), mmap_mode='r')
+        self.columns = {column: np.load(os.path.join(path, f'{column}.npy'), mmap_mode='r')
+                        for column in VALUE_COLUMNS}
+        self.first_day = self.meta['first_day']
+        self.days = self.meta['last_day'] - self.first_day + 1
+
+    def __len__(self):
+        return self.meta['rows']
+
+    def rows(self, start_day: int, end_day: int) -> slice:
+        """Returns the rows of the days from start_day to end_day included."""
+        return slice(int(np.searchsorted(self.day, start_day, side='left')),
+                     int(np.searchsorted(self.day, end_day, side='right')))
+
+    def values(self, column: str, rows=slice(None)) -> np.ndarray:
+        """Returns the values of the rows as float64."""
+        values = self.columns[column][rows]
+        # The low half is added in two 32-bit parts, so the sum is only
+        # rounded once and small negative values stay exact.
+        low = values['lo']
+        high = values['hi'].astype(np.float64) * 2.0 ** 64 + (low >> np.uint64(32)).astype(np.float64) * 2.0 ** 32
+        return high + (low & np.uint64(0xffffffff)).astype(np.float64)
+
+    def value(self, column: str, row: int) -> int:
+        """Returns the exact value of a row."""
+        value = self.columns[column][row]
+        return (int(value['hi']) << 64) + int(value['lo'])
+
+    def matrix(self, column: str, start_day: int = None, end_day: int = None) -> np.ndarray:
+        """
+        Returns the days by games matrix of a column as float64, the days
+        from start_day to end_day included, all of them by default.
+        """
+        start_day = self.first_day if start_day is None else start_day
+        end_day = self.first_day + self.days - 1 if end_day is None else end_day
+        rows = self.rows(start_day, end_day)
+        matrix = np.zeros((max(end_day - start_day + 1, 0), len(self.games)))
+        matrix[self.day[rows] - start_day, self.game[rows]] = self.values(column, rows)
+        return matrix
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('eventlogs', help='JSONL file of eventlogs of the SCORE')
+    parser.add_argument('output', help='directory the export is written to')
+    args = parser.parse_args(argv)
+
+    write_export(args.output, read_eventlogs(args.eventlogs))
+    export = LedgerExport(args.output)
+    print(f'{len(export)} rows, {len(export.games)} games, {export.days} days')
+
+
+if __name__ == '__main__':
+    main()
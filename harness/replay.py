@@ -0,0 +1,248 @@
+"""
+Offline replay of wagers and payouts against candidate watchdog limits.
+
+The events are (timestamp, game, wager, payout) tuples, read from JSONL or
+CSV. :class:`Replay` applies the rules of the Authorization SCORE to them
+for many limit settings at once:
+
+* an event is accumulated like an ``accumulate_daily_batch`` entry, the
+  wager before the payout, and a payout of 0 is no payout;
+* a payout is refused and the game suspended if it is above the game's
+  maximum payout, or if the game's payouts minus wagers of the day would
+  reach the maximum loss;
+* the excess of every approved game is recorded at the end of each day,
+  positive excess is reset to 0 and the developer share of it is paid.
+
+A suspended game is assumed to take no more bets, so its later events are
+dropped, and it is not settled from the day it was suspended on. Every
+game starts approved with no excess.
+
+Amounts are aggregated as float64 with NumPy, so a limit within rounding
+of an actual loss may be judged differently than on-chain.
+``--check`` replays the first candidate through the SCORE on a
+:class:`~harness.chain.LocalChain` and compares the results::
+
+    python -m harness.replay events.jsonl --max-loss 1e20 5e20 --max-payout 1e19 5e19
+"""
+import argparse
+import csv
+import itertools
+import json
+
+import numpy as np
+
+U_SECONDS_DAY = 86400000000
+FIELDS = ('timestamp', 'game', 'wager', 'payout')
+
+
+class Events:
+    """Events sorted by game then timestamp, with each game's events contiguous."""
+
+    def __init__(self, rows: list):
+        rows = sorted(rows, key=lambda row: (row[1], row[0]))
+        self.rows = rows
+        self.games = sorted({row[1] for row in rows})
+        index = {game: number for number, game in enumerate(self.games)}
+        self.game = np.array([index[row[1]] for row in rows], dtype=np.int64)
+        self.timestamp = np.array([row[0] for row in rows], dtype=np.int64)
+        self.wager = np.array([row[2] for row in rows], dtype=np.float64)
+        self.payout = np.array([row[3] for row in rows], dtype=np.float64)
+        self.starts = np.searchsorted(self.game, np.arange(len(self.games) + 1))
+        day = self.timestamp // U_SECONDS_DAY
+        self.first_day = int(day.min()) if len(rows) else 0
+        self.day = day - self.first_day
+        self.days = int(self.day.max()) + 1 if len(rows) else 0
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def load_events(path: str) -> Events:
+    """Reads events from a ``.csv`` file with a header row, or from JSONL."""
+    rows = []
+    with open(path, newline='') as file:
+        if path.endswith('.csv'):
+            records = csv.DictReader(file)
+        else:
+            records = (json.loads(line) for line in file if line.strip())
+        for record in records:
+            rows.append((int(record['timestamp']), str(record['game']),
+                         int(record['wager'] or 0), int(record['payout'] or 0)))
+    return Events(rows)
+
+
+class SweepResult:
+    def __init__(self, events: Events, max_loss, max_payouts, suspended_at, reason, daily_excess, share: int):
+        self.events = events
+        self.max_loss = max_loss
+        # Maximum payout of every game, one row per candidate.
+        self.max_payouts = max_payouts
+        # Index into the events of the payout that suspended each game, -1 if none.
+        self.suspended_at = suspended_at
+        # True where the maximum payout rather than the maximum loss was hit.
+        self.payout_limited = reason
+        # Positive excess recorded per candidate and day.
+        self.daily_excess = daily_excess
+        self.daily_share = np.floor(share * daily_excess / 100)
+        self.developer_share = self.daily_share.sum(axis=1)
+
+    def suspensions(self, candidate: int) -> list:
+        """Returns (game, timestamp, limit) of each game the candidate suspends."""
+        suspensions = []
+        for game, event in enumerate(self.suspended_at[candidate]):
+            if event >= 0:
+                limit = 'maximum_payout' if self.payout_limited[candidate, game] else 'maximum_loss'
+                suspensions.append((self.events.games[game], int(self.events.timestamp[event]), limit))
+        return sorted(suspensions, key=lambda suspension: suspension[1])
+
+
+class Replay:
+    def __init__(self, events: Events, share: int = 20):
+        self.events = events
+        self.share = share
+        game_count = len(events.games)
+        # Payouts minus wagers of the game's day up to each payout, wager
+        # of the event included. Events without a payout are never checked.
+        loss = np.zeros(len(events))
+        net = np.zeros((game_count, events.days))
+        self._loss_max = []
+        self._payout_max = []
+        for game in range(game_count):
+            start, end = events.starts[game], events.starts[game + 1]
+            day = events.day[start:end]
+            wager = events.wager[start:end]
+            payout = events.payout[start:end]
+            # Running sums restarted at each new day of the game.
+            new_day = np.flatnonzero(np.diff(day)) + 1
+            group_start = np.zeros(end - start, dtype=np.int64)
+            group_start[new_day] = new_day
+            group_start = np.maximum.accumulate(group_start)
+            balance = np.cumsum(payout - wager)
+            balance_before = np.concatenate(([0.0], balance))[group_start]
+            loss[start:end] = np.where(payout > 0, balance - balance_before, -np.inf)
+            self._loss_max.append(np.maximum.accumulate(loss[start:end]))
+            self._payout_max.append(np.maximum.accumulate(payout))
+            np.add.at(net[game], day, wager - payout)
+        self._net = net
+
+    def sweep(self, max_loss, max_payouts) -> SweepResult:
+        """
+        Replays the events for every candidate.
+        :param max_loss: Maximum loss of each candidate, shape (C,)
+        :param max_payouts: Maximum payout of each candidate, shape (C,), or
+                            of each candidate and game, shape (C, G)
+        """
+        events = self.events
+        max_loss = np.asarray(max_loss, dtype=np.float64)
+        candidates = len(max_loss)
+        game_count = len(events.games)
+        max_payouts = np.asarray(max_payouts, dtype=np.float64)
+        if max_payouts.ndim == 1:
+            max_payouts = np.repeat(max_payouts[:, None], game_count, axis=1)
+
+        suspended_at = np.full((candidates, game_count), -1, dtype=np.int64)
+        payout_limited = np.zeros((candidates, game_count), dtype=bool)
+        # Days the games stop being settled on, events.days if never.
+        suspended_day = np.full((candidates, game_count), events.days, dtype=np.int64)
+        for game in range(game_count):
+            start, end = events.starts[game], events.starts[game + 1]
+            # Both running maxima are non-decreasing, so the first event over
+            # a limit is found by bisection for all candidates at once.
+            first_loss = np.searchsorted(self._loss_max[game], max_loss, side='left')
+            first_payout = np.searchsorted(self._payout_max[game], max_payouts[:, game], side='right')
+            first = np.minimum(first_loss, first_payout)
+            hit = first < end - start
+            suspended_at[hit, game] = start + first[hit]
+            payout_limited[:, game] = hit & (first_payout <= first_loss)
+            suspended_day[hit, game] = events.day[start + first[hit]]
+
+        daily_excess = np.zeros((candidates, events.days))
+        excess = np.zeros((candidates, game_count))
+        for day in range(events.days):
+            excess += self._net[:, day]
+            settled = suspended_day > day
+            daily_excess[:, day] = np.where(settled, np.maximum(excess, 0), 0).sum(axis=1)
+            excess = np.where(settled, np.minimum(excess, 0), excess)
+        return SweepResult(events, max_loss, max_payouts, suspended_at, payout_limited, daily_excess,
+                           self.share)
+
+
+def replay_on_chain(events: Events, max_loss: int, max_payout: int, share: int = 20) -> dict:
+    """
+    Replays the events through the SCORE for one candidate, with the same
+    assumptions as :class:`Replay`. Slow, meant to check the sweep.
+    :return: Dictionary with the developer share paid each day and the
+             timestamp of each suspension by game
+    """
+    from .benchmark import ROULETTE, approve_game, expect, submit_game
+    from .chain import OWNER, LocalChain
+
+    chain = LocalChain(timestamp=events.first_day * U_SECONDS_DAY)
+    expect(chain.call('set_roulette_score', ROULETTE))
+    expect(chain.call('set_super_admin', OWNER))
+    expect(chain.call('set_game_developers_share', share))
+    expect(chain.call('set_maximum_loss', max_loss))
+    expect(chain.call('set_new_div_changing_time', chain.timestamp))
+    addresses = {}
+    for number, game in enumerate(events.games):
+        address, owner, _ = submit_game(chain, number)
+        approve_game(chain, address, owner)
+        expect(chain.call('set_maximum_payout', address, max_payout))
+        addresses[game] = address
+    expect(chain.call('toggle_apply_watch_dog_method'))
+
+    daily_share = [0] * events.days
+    suspended = {}
+    day = events.first_day
+    for timestamp, game, wager, payout in sorted(events.rows):
+        while timestamp // U_SECONDS_DAY > day:
+            day += 1
+            chain.timestamp = day * U_SECONDS_DAY
+            daily_share[day - 1 - events.first_day] = expect(chain.call('record_excess', sender=ROULETTE)).value
+        if game in suspended:
+            continue
+        chain.timestamp = timestamp
+        entries = json.dumps([[str(addresses[game]), wager, payout]])
+        if not expect(chain.call('accumulate_daily_batch', entries, sender=ROULETTE)).value[0]:
+            suspended[game] = timestamp
+    if events.days:
+        chain.timestamp = (day + 1) * U_SECONDS_DAY
+        daily_share[day - events.first_day] = expect(chain.call('record_excess', sender=ROULETTE)).value
+    return {'daily_share': daily_share, 'suspended': suspended}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('events', help='JSONL or CSV file of timestamp, game, wager, payout')
+    parser.add_argument('--max-loss', type=float, nargs='+', required=True, help='candidate maximum losses')
+    parser.add_argument('--max-payout', type=float, nargs='+', required=True,
+                        help='candidate maximum payouts, applied to every game')
+    parser.add_argument('--share', type=int, default=20, help='game developers share in percent')
+    parser.add_argument('--top', type=int, default=20, help='candidates printed, by developer share')
+    parser.add_argument('--details', action='store_true', help='print the suspensions of each candidate')
+    parser.add_argument('--check', action='store_true', help='replay the first candidate through the SCORE')
+    args = parser.parse_args(argv)
+
+    events = load_events(args.events)
+    grid = list(itertools.product(args.max_loss, args.max_payout))
+    result = Replay(events, args.share).sweep([loss for loss, _ in grid], [payout for _, payout in grid])
+    print(f'{len(events)} events, {len(events.games)} games, {events.days} days, {len(grid)} candidates')
+    print(f'{"max_loss":>12} {"max_payout":>12} {"suspended":>9} {"developer_share":>22}')
+    for candidate in np.argsort(-result.developer_share, kind='stable')[:args.top]:
+        suspensions = result.suspensions(candidate)
+        print(f'{grid[candidate][0]:>12.4g} {grid[candidate][1]:>12.4g} {len(suspensions):>9} '
+              f'{result.developer_share[candidate]:>22.0f}')
+        if args.details:
+            for game, timestamp, limit in suspensions:
+                print(f'{"":>12} {game} at {timestamp} by {limit}')
+
+    if args.check:
+        on_chain = replay_on_chain(events, int(grid[0][0]), int(grid[0][1]), args.share)
+        suspended = {game: timestamp for game, timestamp, _ in result.suspensions(0)}
+        share_error = np.abs(np.array(on_chain['daily_share']) - result.daily_share[0]).max(initial=0)
+        print(f'check: suspensions {"match" if suspended == on_chain["suspended"] else "differ"}, '
+              f'largest daily share difference {share_error:.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Stand-in JSON-RPC server answering ``icx_call`` from a :class:`LocalChain`.
+
+It speaks enough of the ICON JSON-RPC API for clients of the readonly
+methods: single and batch requests on keep-alive HTTP/1.1 connections,
+params and results converted like a node does (ints as hex strings,
+addresses as strings), and reverts returned as SCORE errors::
+
+    server = await RpcServer(chain).start()
+    client = AuthorizationClient(server.url, str(SCORE_ADDRESS))
+"""
+import asyncio
+import inspect
+import json
+
+from .chain import SCORE_ADDRESS, LocalChain
+from .standin import Address, IconScoreException
+
+SCORE_ERROR = -30000
+
+
+def to_param(value, annotation):
+    if annotation is int:
+        return int(value, 16)
+    if annotation is bool:
+        return int(value, 16) != 0
+    if annotation is Address:
+        return Address.from_string(value)
+    return value
+
+
+def to_result(value):
+    if isinstance(value, bool):
+        return hex(int(value))
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, Address):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: to_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_result(item) for item in value]
+    return value
+
+
+class RpcServer:
+    def __init__(self, chain: LocalChain, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0):
+        """
+        :param latency: Seconds each HTTP request is delayed by, to simulate
+                        the round trip to a node
+        """
+        self.chain = chain
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self._server = None
+        # Tasks serving the open connections, cancelled on close.
+        self._handlers = set()
+        # HTTP requests and icx_calls served.
+        self.requests = 0
+        self.calls = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}/api/v3'
+
+    async def start(self) -> 'RpcServer':
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        self._server.close()
+        for handler in self._handlers:
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def _serve(self, reader, writer) -> None:
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                try:
+                    await reader.readuntil(b'\r\n')
+                except asyncio.IncompleteReadError:
+                    return
+                headers = {}
+                while True:
+                    line = (await reader.readuntil(b'\r\n')).decode().strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                response = json.dumps(self.handle(json.loads(body))).encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                             b'Content-Length: %d\r\n\r\n' % len(response) + response)
+                await writer.drain()
+        except asyncio.CancelledError:
+            # Keep-alive connections still open when the server is closed.
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    def handle(self, request):
+        if isinstance(request, list):
+            return [self._handle_one(item) for item in request]
+        return self._handle_one(request)
+
+    def _handle_one(self, request: dict) -> dict:
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        if request.get('method') != 'icx_call':
+            response['error'] = {'code': -32601, 'message': 'Method not found'}
+            return response
+        self.calls += 1
+        params = request['params']
+        data = params['data']
+        if Address.from_string(params['to']) != SCORE_ADDRESS:
+            response['error'] = {'code': -32602, 'message': f'SCORE not found: {params["to"]}'}
+            return response
+        method = getattr(self.chain.score_class, data['method'], None)
+        if method is None or not getattr(method, '__readonly__', False):
+            response['error'] = {'code': SCORE_ERROR - 1, 'message': f'Invalid method: {data["method"]}'}
+            return response
+        signature = inspect.signature(method)
+        kwargs = {name: to_param(value, signature.parameters[name].annotation)
+                  for name, value in data.get('params', {}).items()}
+        try:
+            response['result'] = to_result(self.chain.query(data['method'], **kwargs))
+        except IconScoreException as e:
+            response['error'] = {'code': SCORE_ERROR - e.code, 'message': str(e.message)}
+        return response
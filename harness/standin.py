@@ -0,0 +1,466 @@
+"""
+In-memory stand-in for the parts of ``iconservice`` used by the
+Authorization SCORE.
+
+The containers mirror the storage layout of the real ``VarDB``, ``DictDB``
+and ``ArrayDB`` closely enough that the number of storage reads and writes
+issued by a SCORE method matches what the node would charge steps for.
+Every access goes through a :class:`MemoryDatabase`, which keeps the
+counters.
+
+Call :func:`install` before importing the SCORE so that
+``from iconservice import *`` resolves to this module.
+"""
+import inspect
+import json
+import sys
+from functools import wraps
+
+__all__ = [
+    'Address', 'ArrayDB', 'DictDB', 'IconScoreBase', 'IconScoreDatabase',
+    'IconScoreException', 'InterfaceScore', 'Logger', 'VarDB', 'eventlog',
+    'external', 'interface', 'json_dumps', 'json_loads', 'payable', 'revert',
+]
+
+
+class IconScoreException(BaseException):
+    """Raised by :func:`revert`. Like the real one it is a ``BaseException``."""
+
+    def __init__(self, message=None, code=32):
+        super().__init__(message, code)
+        self.message = message
+        self.code = code
+
+    def __str__(self):
+        return str(self.message)
+
+
+class InvalidParamsException(IconScoreException):
+    pass
+
+
+def revert(message=None, code=0):
+    raise IconScoreException(message, code)
+
+
+class Address:
+    def __init__(self, prefix: str, body: bytes):
+        self._prefix = prefix
+        self._body = body
+
+    @staticmethod
+    def from_string(address: str) -> 'Address':
+        if not isinstance(address, str) or len(address) != 42 or address[:2] not in ('hx', 'cx'):
+            raise InvalidParamsException(f'Invalid address: {address}')
+        try:
+            body = bytes.fromhex(address[2:])
+        except ValueError:
+            raise InvalidParamsException(f'Invalid address: {address}')
+        return Address(address[:2], body)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Address':
+        if len(data) == 20:
+            return Address('hx', data)
+        return Address('hx' if data[0] == 0 else 'cx', data[1:])
+
+    def to_bytes(self) -> bytes:
+        if self._prefix == 'hx':
+            return self._body
+        return b'\x01' + self._body
+
+    @property
+    def is_contract(self) -> bool:
+        return self._prefix == 'cx'
+
+    def __str__(self):
+        return f'{self._prefix}{self._body.hex()}'
+
+    def __repr__(self):
+        return f'Address({self})'
+
+    def __eq__(self, other):
+        return isinstance(other, Address) and str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __lt__(self, other):
+        return str(self) < str(other)
+
+
+def json_loads(data: str):
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    return json.dumps(obj, separators=(',', ':'))
+
+
+class Logger:
+    @staticmethod
+    def debug(msg, tag=''):
+        pass
+
+    @staticmethod
+    def info(msg, tag=''):
+        pass
+
+    @staticmethod
+    def warning(msg, tag=''):
+        pass
+
+    @staticmethod
+    def error(msg, tag=''):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+class OpCounter:
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.deletes = 0
+
+    def reset(self):
+        self.reads = self.writes = self.deletes = 0
+
+    def snapshot(self) -> dict:
+        return {'reads': self.reads, 'writes': self.writes, 'deletes': self.deletes}
+
+
+class MemoryDatabase:
+    """Flat key/value store shared by every container of one SCORE."""
+
+    def __init__(self):
+        self.store = {}
+        self.counter = OpCounter()
+
+    def get(self, key: bytes):
+        self.counter.reads += 1
+        return self.store.get(key)
+
+    def put(self, key: bytes, value: bytes):
+        self.counter.writes += 1
+        if value is None:
+            self.store.pop(key, None)
+        else:
+            self.store[key] = value
+
+    def delete(self, key: bytes):
+        self.counter.deletes += 1
+        self.store.pop(key, None)
+
+    def get_sub_db(self, prefix: bytes) -> 'SubDatabase':
+        return SubDatabase(self, prefix)
+
+    def key_count(self) -> int:
+        return len(self.store)
+
+
+class SubDatabase:
+    def __init__(self, root: MemoryDatabase, prefix: bytes):
+        self._root = root
+        self._prefix = prefix
+
+    def get(self, key: bytes):
+        return self._root.get(self._prefix + b'|' + key)
+
+    def put(self, key: bytes, value: bytes):
+        self._root.put(self._prefix + b'|' + key, value)
+
+    def delete(self, key: bytes):
+        self._root.delete(self._prefix + b'|' + key)
+
+    def get_sub_db(self, prefix: bytes) -> 'SubDatabase':
+        return SubDatabase(self._root, self._prefix + b'|' + prefix)
+
+
+IconScoreDatabase = MemoryDatabase
+
+
+def _encode_key(key) -> bytes:
+    if isinstance(key, Address):
+        return key.to_bytes()
+    if isinstance(key, bool):
+        raise TypeError(f'Unsupported key type: {type(key)}')
+    if isinstance(key, int):
+        return key.to_bytes((key.bit_length() + 8) // 8, 'big', signed=True)
+    if isinstance(key, str):
+        return key.encode()
+    if isinstance(key, bytes):
+        return key
+    raise TypeError(f'Unsupported key type: {type(key)}')
+
+
+def _encode_value(value) -> bytes:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return _encode_key(int(value))
+    if isinstance(value, (int, str, bytes, Address)):
+        return _encode_key(value)
+    raise TypeError(f'Unsupported value type: {type(value)}')
+
+
+def _decode_value(data, value_type):
+    if data is None:
+        if value_type is int:
+            return 0
+        if value_type is str:
+            return ''
+        if value_type is bool:
+            return False
+        return None
+    if value_type is int:
+        return int.from_bytes(data, 'big', signed=True)
+    if value_type is str:
+        return data.decode()
+    if value_type is bool:
+        return bool(int.from_bytes(data, 'big', signed=True))
+    if value_type is Address:
+        return Address.from_bytes(data)
+    if value_type is bytes:
+        return data
+    raise TypeError(f'Unsupported value type: {value_type}')
+
+
+def _check_value(value, value_type):
+    if value is None:
+        return
+    if value_type is int and (not isinstance(value, int) or isinstance(value, bool)):
+        raise TypeError(f'Expected int, got {type(value)}')
+    if value_type is not int and not isinstance(value, value_type):
+        raise TypeError(f'Expected {value_type}, got {type(value)}')
+
+
+class VarDB:
+    def __init__(self, var_key, db, value_type):
+        self._db = db.get_sub_db(b'\x02' + _encode_key(var_key))
+        self._value_type = value_type
+
+    def set(self, value):
+        _check_value(value, self._value_type)
+        self._db.put(b'', _encode_value(value))
+
+    def get(self):
+        return _decode_value(self._db.get(b''), self._value_type)
+
+    def remove(self):
+        self._db.delete(b'')
+
+
+class DictDB:
+    def __init__(self, dict_key, db, value_type, depth: int = 1):
+        if isinstance(db, SubDatabase) and isinstance(dict_key, bytes) and dict_key.startswith(b'\x01'):
+            self._db = db.get_sub_db(dict_key)
+        else:
+            self._db = db.get_sub_db(b'\x01' + _encode_key(dict_key))
+        self._value_type = value_type
+        self._depth = depth
+
+    def __getitem__(self, key):
+        if self._depth == 1:
+            return _decode_value(self._db.get(_encode_key(key)), self._value_type)
+        return DictDB(b'\x01' + _encode_key(key), self._db, self._value_type, self._depth - 1)
+
+    def __setitem__(self, key, value):
+        if self._depth != 1:
+            raise TypeError('DictDB depth mismatch')
+        _check_value(value, self._value_type)
+        self._db.put(_encode_key(key), _encode_value(value))
+
+    def __delitem__(self, key):
+        if self._depth != 1:
+            raise TypeError('DictDB depth mismatch')
+        self._db.delete(_encode_key(key))
+
+    def __contains__(self, key):
+        return self._db.get(_encode_key(key)) is not None
+
+    def __iter__(self):
+        raise TypeError('DictDB is not iterable')
+
+    def remove(self, key):
+        del self[key]
+
+
+class ArrayDB:
+    def __init__(self, array_key, db, value_type):
+        self._db = db.get_sub_db(b'\x00' + _encode_key(array_key))
+        self._value_type = value_type
+        self._size = self._read_size()
+
+    def _read_size(self) -> int:
+        return _decode_value(self._db.get(b'size'), int)
+
+    def _write_size(self, size: int):
+        self._size = size
+        self._db.put(b'size', _encode_value(size))
+
+    def put(self, value):
+        _check_value(value, self._value_type)
+        self._db.put(_encode_key(self._size), _encode_value(value))
+        self._write_size(self._size + 1)
+
+    def pop(self):
+        if self._size == 0:
+            return None
+        index = self._size - 1
+        value = _decode_value(self._db.get(_encode_key(index)), self._value_type)
+        self._db.delete(_encode_key(index))
+        self._write_size(index)
+        return value
+
+    def get(self, index: int = 0):
+        if not isinstance(index, int):
+            raise TypeError('Invalid index type')
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('ArrayDB out of index')
+        return _decode_value(self._db.get(_encode_key(index)), self._value_type)
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('ArrayDB out of index')
+        _check_value(value, self._value_type)
+        self._db.put(_encode_key(index), _encode_value(value))
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self.get(index)
+
+    def __contains__(self, item):
+        for value in self:
+            if value == item:
+                return True
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Decorators
+# ---------------------------------------------------------------------------
+
+def external(func=None, *, readonly: bool = False):
+    def decorator(f):
+        f.__external__ = True
+        f.__readonly__ = readonly
+        return f
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def payable(func):
+    func.__payable__ = True
+    return func
+
+
+def interface(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        target = self._target
+        return getattr(target, func.__name__)(*args, **kwargs)
+    return wrapper
+
+
+def eventlog(func=None, *, indexed: int = 0):
+    def decorator(f):
+        signature = inspect.signature(f)
+
+        @wraps(f)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            values = tuple(bound.arguments.values())[1:]
+            self._IconScoreBase__context.events.append((f.__name__, values))
+        wrapper.__eventlog__ = indexed
+        return wrapper
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+class InterfaceScore:
+    def __init__(self, target):
+        self._target = target
+
+
+# ---------------------------------------------------------------------------
+# SCORE base and execution context
+# ---------------------------------------------------------------------------
+
+class Message:
+    def __init__(self, sender: Address = None, value: int = 0):
+        self.sender = sender
+        self.value = value
+
+
+class Transaction:
+    def __init__(self, origin: Address = None):
+        self.origin = origin
+
+
+class ScoreContext:
+    """Execution context shared by a SCORE instance: caller, block time and peers."""
+
+    def __init__(self, owner: Address, address: Address, timestamp: int = 0):
+        self.owner = owner
+        self.address = address
+        self.timestamp = timestamp
+        self.msg = Message(owner, 0)
+        self.tx = Transaction(owner)
+        self.scores = {}
+        self.events = []
+
+
+class IconScoreBase:
+    def __init__(self, db):
+        self.__db = db
+        self.__context = db.context
+
+    def on_install(self, **kwargs) -> None:
+        pass
+
+    def on_update(self, **kwargs) -> None:
+        pass
+
+    @property
+    def msg(self) -> Message:
+        return self.__context.msg
+
+    @property
+    def tx(self) -> Transaction:
+        return self.__context.tx
+
+    @property
+    def owner(self) -> Address:
+        return self.__context.owner
+
+    @property
+    def address(self) -> Address:
+        return self.__context.address
+
+    def now(self) -> int:
+        return self.__context.timestamp
+
+    def create_interface_score(self, address: Address, interface_cls):
+        if address not in self.__context.scores:
+            revert(f'SCORE not found: {address}')
+        return interface_cls(self.__context.scores[address])
+
+
+def install() -> None:
+    """Registers this module as ``iconservice`` so the SCORE can import it."""
+    sys.modules['iconservice'] = sys.modules[__name__]
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from harness.benchmark import populate  # noqa: E402
+from harness.differential import load_revision  # noqa: E402
+
+# Revision of the SCORE before the storage layout changes.
+BASELINE = '26a5515'
+
+
+@pytest.fixture
+def populated():
+    """Chain with five approved games which all wagered today."""
+    return populate(5)
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    """SCORE class at the baseline revision."""
+    try:
+        return load_revision(BASELINE)
+    except subprocess.CalledProcessError:
+        pytest.skip(f'revision {BASELINE} is not available')
@@ -0,0 +1,63 @@
+import json
+
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate
+from harness.chain import address
+
+
+def test_batch_matches_single_calls():
+    single, games = populate(3)
+    batch, _ = populate(3)
+    entries = [(games[0], 2 * MULTIPLIER, 0), (games[1], MULTIPLIER, 3 * MULTIPLIER), (games[0], 0, MULTIPLIER)]
+    for game, wager, payout in entries:
+        if wager:
+            expect(single.call('accumulate_daily_wagers', game, wager, sender=ROULETTE))
+        if payout:
+            expect(single.call('accumulate_daily_payouts', game, payout, sender=ROULETTE))
+    entries = [[str(game), wager, payout] for game, wager, payout in entries]
+    result = expect(batch.call('accumulate_daily_batch', json.dumps(entries), sender=ROULETTE))
+    assert result.value == [True, True, True]
+    for getter in ('get_daily_wagers', 'get_daily_payouts', 'get_excess', 'get_daily_totals',
+                   'get_todays_games_excess'):
+        assert batch.query(getter) == single.query(getter)
+
+
+def test_accumulators_have_their_own_totals(populated):
+    chain, games = populated
+    accumulator = address('cx', 0xacc)
+    expect(chain.call('add_accumulator', accumulator))
+    expect(chain.call('accumulate_daily_wagers', games[0], 7 * MULTIPLIER, sender=accumulator))
+    expect(chain.call('accumulate_daily_payouts', games[1], 2 * MULTIPLIER, sender=accumulator))
+    totals = chain.query('get_daily_totals_by_source')
+    assert totals[str(accumulator)] == {'wagers': f'{7 * MULTIPLIER}', 'payouts': f'{2 * MULTIPLIER}'}
+    assert chain.query('get_daily_totals') == {'wagers': f'{57 * MULTIPLIER}', 'payouts': f'{2 * MULTIPLIER}'}
+    chain.advance_days()
+    assert str(accumulator) in chain.query('get_daily_totals_by_source', -1)
+
+
+def test_hot_paths_do_not_grow_with_the_games():
+    ops = []
+    for size in (5, 50):
+        chain, games = populate(size)
+        ops.append([
+            expect(chain.call('accumulate_daily_wagers', games[0], MULTIPLIER, sender=ROULETTE)).ops,
+            expect(chain.call('accumulate_daily_payouts', games[0], MULTIPLIER, sender=ROULETTE)).ops,
+            expect(chain.call('get_excess')).ops,
+            expect(chain.call('set_maximum_loss', 500 * MULTIPLIER)).ops,
+        ])
+    assert ops[0] == ops[1]
+
+
+def test_rolling_stats_match_the_daily_values(populated):
+    chain, games = populated
+    for day in range(40):
+        expect(chain.call('accumulate_daily_wagers', games[day % 3], (day + 1) * MULTIPLIER, sender=ROULETTE))
+        expect(chain.call('accumulate_daily_payouts', games[day % 2], MULTIPLIER, sender=ROULETTE))
+        chain.advance_days(1 if day % 5 else 2)
+    for window in (1, 7, 30):
+        stats = chain.query('get_games_rolling_stats', window)
+        for game in games:
+            wagers = sum(int(chain.query('get_daily_wagers', -day)[str(game)]) for day in range(window))
+            payouts = sum(int(chain.query('get_daily_payouts', -day)[str(game)]) for day in range(window))
+            expected = {'wagers': f'{wagers}', 'payouts': f'{payouts}', 'excess': f'{wagers - payouts}'}
+            assert chain.query('get_rolling_stats', game, window) == expected
+            assert stats[str(game)] == expected
@@ -0,0 +1,46 @@
+import json
+
+from harness.benchmark import MULTIPLIER, expect
+from harness.chain import address
+
+
+def test_bulk_status_changes(populated):
+    chain, games = populated
+    changes = json.dumps([[str(games[0]), 'gameSuspended'], [str(games[1]), 'gameApproved'],
+                          [str(games[0]), 'gameSuspended'], [str(games[0]), 'gameDeleted'],
+                          [str(games[2]), 'unknown'], [str(games[3]), 'gameSuspended']])
+    result = expect(chain.call('set_games_status', changes))
+    assert result.value == ['', 'This game cannot be approved from state gameApproved',
+                            'Only approved games may be suspended.', '', 'Invalid status', '']
+    assert [values for name, values in result.events if name == 'GameStatusChanged'] == [
+        (games[0], 'gameSuspended', 'gameApproved'), (games[0], 'gameDeleted', 'gameSuspended'),
+        (games[3], 'gameSuspended', 'gameApproved')]
+    assert [chain.query('get_game_status', game) for game in games] == [
+        'gameDeleted', 'gameApproved', 'gameApproved', 'gameSuspended', 'gameApproved']
+    assert sorted(map(str, chain.query('get_approved_games'))) == sorted(map(str, (games[1], games[2], games[4])))
+
+
+def test_bulk_maximum_payouts(populated):
+    chain, games = populated
+    unknown = address('cx', 0x2fff)
+    limits = json.dumps([[str(games[0]), 5 * MULTIPLIER], [str(games[1]), MULTIPLIER // 100],
+                         [str(games[2]), '5'], [str(unknown), MULTIPLIER], [str(games[3]), MULTIPLIER]])
+    result = expect(chain.call('set_maximum_payouts', limits))
+    assert result.value == ['', f'{MULTIPLIER // 100} is less than 0.1 ICX', '5 is not an int',
+                            'Game has not been submitted.', '']
+    assert [values[:2] for name, values in result.events if name == 'WatchdogLimitsChanged'] == [
+        (games[0], 5 * MULTIPLIER), (games[3], MULTIPLIER)]
+    assert [chain.query('get_maximum_payout', game) for game in games[:4]] == [
+        5 * MULTIPLIER, 100 * MULTIPLIER, 100 * MULTIPLIER, MULTIPLIER]
+
+
+def test_bulk_errors_revert_the_batch(populated):
+    chain, games = populated
+    stranger = address('hx', 0x2fff)
+    changes = json.dumps([[str(games[0]), 'gameSuspended']])
+    assert chain.call('set_games_status', changes, sender=stranger).error.message == 'Sender not an admin'
+    assert chain.call('set_maximum_payouts', '[]', sender=stranger).error.message == 'Sender not an admin'
+    assert chain.call('set_games_status', '{}').error.message == 'Entries must be a list.'
+    malformed = json.dumps([[str(games[0]), 'gameSuspended'], [str(games[1])]])
+    assert chain.call('set_games_status', malformed).error.message == f'Invalid entry: {[str(games[1])]}'
+    assert chain.query('get_game_status', games[0]) == 'gameApproved'
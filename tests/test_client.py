@@ -0,0 +1,78 @@
+import asyncio
+
+from authorization_client import AuthorizationClient
+from harness.benchmark import MULTIPLIER, ROULETTE, approve_game, expect, populate, submit_game
+from harness.chain import SCORE_ADDRESS
+from harness.rpc import RpcServer
+
+SCORE = str(SCORE_ADDRESS)
+
+
+def played_days(days: int):
+    chain, games = populate(4)
+    first = chain.day
+    for _ in range(days):
+        for number, game in enumerate(games):
+            expect(chain.call('accumulate_daily_wagers', game, (number + 1) * MULTIPLIER, sender=ROULETTE))
+        chain.advance_days()
+        expect(chain.call('record_excess', sender=ROULETTE))
+    chain.timestamp += 3600 * 10 ** 6
+    return chain, games, range(first, chain.day + 1)
+
+
+def status_event(values) -> dict:
+    return {'scoreAddress': SCORE, 'indexed': ['GameStatusChanged(Address,str,str)', str(values[0]), values[1]],
+            'data': [values[2]]}
+
+
+def test_batching_and_past_days_cache(caplog):
+    chain, _, days = played_days(6)
+
+    async def main():
+        server = await RpcServer(chain).start()
+        client = AuthorizationClient(server.url, SCORE, clock=lambda: chain.timestamp, cache_status=True)
+        wagers = await client.get_days('get_daily_wagers', days)
+        assert wagers == {day: chain.query('get_daily_wagers', day) for day in days}
+        assert server.requests < server.calls
+        calls = server.calls
+        # Only today is queried again, past days come from the cache.
+        await client.get_days('get_daily_wagers', days)
+        assert server.calls - calls == 1
+        calls = server.calls
+        await asyncio.gather(*(client.get_daily_wagers() for _ in range(5)))
+        assert server.calls - calls == 1
+        await client.close()
+        await server.close()
+
+    asyncio.run(main())
+    assert not [record for record in caplog.records if record.name == 'asyncio']
+
+
+def test_status_events_invalidate_cache():
+    chain, games, days = played_days(1)
+    game, owner, _ = submit_game(chain, 9)
+    day = days[0]
+
+    async def main():
+        server = await RpcServer(chain).start()
+        client = AuthorizationClient(server.url, SCORE, clock=lambda: chain.timestamp, cache_status=True)
+        assert await client.get_game_status(str(games[0])) == 'gameApproved'
+        calls = server.calls
+        assert await client.get_game_status(str(games[0])) == 'gameApproved'
+        assert server.calls == calls
+        result = expect(chain.call('set_game_status', 'gameSuspended', games[0]))
+        for name, values in result.events:
+            if name == 'GameStatusChanged':
+                client.handle_eventlog(status_event(values))
+        assert await client.get_game_status(str(games[0])) == 'gameSuspended'
+        assert server.calls == calls
+        # Past days list the approved games, so they are fetched again once
+        # a game gets approved.
+        assert str(game) not in await client.get_daily_wagers(day)
+        approve_game(chain, game, owner)
+        client.handle_eventlog(status_event((game, 'gameApproved', 'gameReady')))
+        assert str(game) in await client.get_daily_wagers(day)
+        await client.close()
+        await server.close()
+
+    asyncio.run(main())
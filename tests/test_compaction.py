@@ -0,0 +1,33 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect
+
+
+def test_compaction_folds_old_days_into_rollups(populated):
+    chain, games = populated
+    first_day = chain.day
+    for _ in range(70):
+        for number, game in enumerate(games):
+            expect(chain.call('accumulate_daily_wagers', game, (number + 1) * MULTIPLIER, sender=ROULETTE))
+        expect(chain.call('accumulate_daily_payouts', games[0], MULTIPLIER // 2, sender=ROULETTE))
+        chain.advance_days()
+        expect(chain.call('record_excess', sender=ROULETTE))
+    daily = {day: (chain.query('get_daily_wagers', day), chain.query('get_daily_payouts', day))
+             for day in range(first_day, chain.day)}
+
+    expect(chain.call('set_history_retention', 31, 'week', first_day))
+    while expect(chain.call('compact_history', 4)).value != 0:
+        pass
+
+    retention = chain.query('get_history_retention')
+    assert retention['compactedUntil'] > retention['startDay']
+    assert retention['compactedUntil'] <= chain.day - 31
+    for day in range(retention['startDay'], retention['compactedUntil'], 7):
+        rollup = chain.query('get_rollup', day)
+        assert chain.query('get_daily_wagers', day) == {'compacted': f'{rollup["startDay"]}'}
+        for game in games:
+            days = [past for past in range(rollup['startDay'], rollup['endDay'] + 1) if past in daily]
+            wagers = sum(int(daily[past][0][str(game)]) for past in days)
+            payouts = sum(int(daily[past][1][str(game)]) for past in days)
+            assert rollup['games'][str(game)]['wagers'] == f'{wagers}'
+            assert rollup['games'][str(game)]['payouts'] == f'{payouts}'
+    for day in range(retention['compactedUntil'], chain.day):
+        assert chain.query('get_daily_wagers', day) == daily[day][0]
@@ -0,0 +1,43 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect
+
+
+def check_dashboard(chain, day: int) -> None:
+    dashboard = chain.query('get_games_dashboard', day)
+    wagers = chain.query('get_daily_wagers', day)
+    payouts = chain.query('get_daily_payouts', day)
+    excess = chain.query('get_todays_games_excess')
+    assert dashboard['total'] == len(chain.query('get_approved_games'))
+    assert dashboard['maxPageSize'] == 100
+    for game in dashboard['games']:
+        address = game['scoreAddress']
+        assert game['status'] == chain.query('get_game_status', address)
+        assert game['wagers'] == wagers[str(address)]
+        assert game['payouts'] == payouts[str(address)]
+        assert game['excess'] == excess[str(address)]
+        assert game['maxPayout'] == f'{chain.query("get_maximum_payout", address)}'
+        assert game['revShareWalletAddress'] == chain.query('get_revshare_wallet_address', address)
+
+
+def test_dashboard_matches_getters(populated):
+    chain, games = populated
+    expect(chain.call('accumulate_daily_payouts', games[0], 25 * MULTIPLIER, sender=ROULETTE))
+    check_dashboard(chain, 0)
+    # The loss headroom left today is the maximum loss minus the loss of
+    # the day.
+    headroom = {game['scoreAddress']: game['lossHeadroom'] for game in chain.query('get_games_dashboard')['games']}
+    assert headroom[games[0]] == f'{985 * MULTIPLIER}'
+    assert headroom[games[1]] == f'{1010 * MULTIPLIER}'
+    chain.advance_days()
+    expect(chain.call('record_excess', sender=ROULETTE))
+    check_dashboard(chain, -1)
+    assert chain.query('get_games_dashboard')['games'][0]['lossHeadroom'] == f'{1000 * MULTIPLIER}'
+
+
+def test_dashboard_status_filter(populated):
+    chain, games = populated
+    expect(chain.call('set_game_status', 'gameSuspended', games[2]))
+    suspended = chain.query('get_games_dashboard', 0, 0, 10, 'gameSuspended')
+    assert [game['scoreAddress'] for game in suspended['games']] == [games[2]]
+    assert chain.query('get_games_dashboard', 0, 0, 10, '')['total'] == 5
+    assert chain.call('get_games_dashboard', 0, 0, 101).error.message == \
+        'Offset must not be negative and limit must be between 1 and 100'
@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+from harness.chain import load_score_class
+from harness.differential import Differential
+
+
+@pytest.mark.parametrize('upgrade', [None, 40])
+def test_baseline_and_head_are_equivalent(baseline, upgrade):
+    differential = Differential(baseline, load_score_class(), ignore=['get_yesterdays_games_excess'],
+                                allow=['get_games_excess(*)'], upgrade=upgrade)
+    for seed in range(2):
+        differential.run(differential.setup(), random.Random(seed), 120, record_ops=True)
+    assert differential.ops['accumulate_daily_wagers'][0] > 0
+
+
+def test_allowed_divergences_are_counted(baseline):
+    differential = Differential(baseline, load_score_class(), allow=['get_*games_excess(*)'], upgrade=20)
+    differential.run(differential.setup(), random.Random(0), 120)
+    assert sum(differential.allowed.values()) > 0
@@ -0,0 +1,35 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate
+
+
+def events(result) -> list:
+    return expect(result).events
+
+
+def test_events_carry_running_totals(populated):
+    chain, games = populated
+    day = chain.day
+    assert events(chain.call('accumulate_daily_wagers', games[0], 3 * MULTIPLIER, sender=ROULETTE)) == \
+        [('WagersAccumulated', (games[0], day, 13 * MULTIPLIER, 13 * MULTIPLIER))]
+    assert events(chain.call('accumulate_daily_payouts', games[0], 5 * MULTIPLIER, sender=ROULETTE)) == \
+        [('PayoutAccumulated', (games[0], day, 5 * MULTIPLIER, 8 * MULTIPLIER))]
+    assert events(chain.call('set_game_status', 'gameSuspended', games[1])) == \
+        [('GameStatusChanged', (games[1], 'gameSuspended', 'gameApproved'))]
+    assert events(chain.call('set_maximum_payout', games[0], 50 * MULTIPLIER)) == \
+        [('WatchdogLimitsChanged', (games[0], 50 * MULTIPLIER, 1000 * MULTIPLIER, False))]
+    chain.advance_days()
+    recorded = {values[0]: values[1:] for name, values in events(chain.call('record_excess', sender=ROULETTE))
+                if name == 'ExcessRecorded'}
+    assert recorded[games[0]] == (day, 8 * MULTIPLIER)
+    assert games[1] not in recorded
+    assert {str(game): f'{excess}' for game, (_, excess) in recorded.items()} == \
+        {game: excess for game, excess in chain.query('get_games_excess', day).items() if excess != '0'}
+
+
+def test_indexed_arguments(populated):
+    chain, _ = populated
+    indexed = {name: getattr(chain.score_class, name).__eventlog__ for name in (
+        'WagersAccumulated', 'PayoutAccumulated', 'ExcessRecorded', 'GameStatusChanged',
+        'WatchdogLimitsChanged', 'ExcessReset')}
+    # Games and days are indexed so indexers can filter on them.
+    assert indexed == {'WagersAccumulated': 2, 'PayoutAccumulated': 2, 'ExcessRecorded': 2,
+                       'GameStatusChanged': 2, 'WatchdogLimitsChanged': 1, 'ExcessReset': 1}
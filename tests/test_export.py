@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate  # noqa: E402
+from harness.export import LedgerExport, add_eventlog, main, to_columns, write_export  # noqa: E402
+
+EXTREMES = [0, 1, -1, 2 ** 63, 2 ** 64 - 1, 2 ** 64, -2 ** 64, 2 ** 100 + 7, -2 ** 70 + 5, 10 ** 30]
+
+
+def eventlog(name: str, values: tuple) -> dict:
+    game, day, *data = values
+    return {'scoreAddress': 'cx', 'indexed': [f'{name}(Address,int,int,int)', str(game), hex(day)],
+            'data': [hex(value) for value in data]}
+
+
+def test_hi_lo_round_trip(tmp_path):
+    columns = to_columns(EXTREMES)
+    assert [(int(hi) << 64) + int(lo) for hi, lo in columns] == EXTREMES
+    cells = {(day, 'cx1'): [value, abs(value), -value] for day, value in enumerate(EXTREMES)}
+    write_export(str(tmp_path), cells)
+    export = LedgerExport(str(tmp_path))
+    for row, value in enumerate(EXTREMES):
+        assert [export.value(column, row) for column in ('wagers', 'payouts', 'excess')] == \
+            [value, abs(value), -value]
+    assert np.array_equal(export.values('excess'), [-float(value) for value in EXTREMES])
+
+
+def test_export_matches_chain(tmp_path):
+    chain, games = populate(3)
+    chain.advance_days()
+    expect(chain.call('record_excess', sender=ROULETTE))
+    first = chain.day
+    logs = []
+    for day in range(3):
+        for number, game in enumerate(games):
+            logs += expect(chain.call('accumulate_daily_wagers', game, (day + number + 1) * MULTIPLIER,
+                                      sender=ROULETTE)).events
+            logs += expect(chain.call('accumulate_daily_payouts', game, (2 * number + 1) * MULTIPLIER,
+                                      sender=ROULETTE)).events
+        chain.advance_days()
+        logs += expect(chain.call('record_excess', sender=ROULETTE)).events
+    path = tmp_path / 'eventlogs.jsonl'
+    path.write_text(''.join(json.dumps(eventlog(name, values)) + '\n' for name, values in logs))
+    main([str(path), str(tmp_path / 'ledger')])
+    export = LedgerExport(str(tmp_path / 'ledger'))
+    assert export.first_day == first and export.days == 3
+    for column, getter in (('wagers', 'get_daily_wagers'), ('payouts', 'get_daily_payouts'),
+                           ('excess', 'get_games_excess')):
+        expected = np.array([[float(chain.query(getter, day)[game]) for game in export.games]
+                             for day in range(first, first + 3)])
+        assert np.array_equal(export.matrix(column), expected)
+    for row in range(len(export)):
+        day, game = int(export.day[row]), export.games[export.game[row]]
+        assert f'{export.value("excess", row)}' == chain.query('get_games_excess', day)[game]
+
+
+def test_add_eventlog_keeps_the_day_totals():
+    cells = {}
+    for wagers in (5, 3, 9):
+        add_eventlog(cells, eventlog('WagersAccumulated', ('cx1', 7, wagers, 0)))
+    add_eventlog(cells, eventlog('GameStatusChanged', ('cx1', 7)))
+    assert cells == {(7, 'cx1'): [9, 0, 0]}
@@ -0,0 +1,53 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate, submit_game
+from harness.chain import OWNER, address
+
+
+def status_index(chain, status: str) -> list:
+    return [game['scoreAddress'] for game in chain.query('get_score_list_page', 0, 100, status)['games']]
+
+
+def check_status_index(chain, games: list) -> None:
+    for status in chain.score.STATUS_TYPE:
+        listed = status_index(chain, status)
+        assert sorted(listed, key=str) == sorted((game for game in games
+                                                  if chain.query('get_game_status', game) == status), key=str)
+
+
+def test_status_index_follows_status_changes():
+    chain, games = populate(5)
+    waiting, _, _ = submit_game(chain, 5)
+    games.append(waiting)
+    check_status_index(chain, games)
+    expect(chain.call('set_game_status', 'gameSuspended', games[1]))
+    assert status_index(chain, 'gameApproved') == [games[0], games[4], games[2], games[3]]
+    expect(chain.call('set_game_status', 'gameSuspended', games[4]))
+    expect(chain.call('set_game_status', 'gameDeleted', games[1]))
+    expect(chain.call('set_game_status', 'gameApproved', games[4]))
+    expect(chain.call('set_game_status', 'proposalApproved', waiting))
+    check_status_index(chain, games)
+    # The watchdog suspends a game paying out more than its maximum payout.
+    expect(chain.call('toggle_apply_watch_dog_method'))
+    expect(chain.call('accumulate_daily_payouts', games[0], 101 * MULTIPLIER, sender=ROULETTE))
+    assert chain.query('get_game_status', games[0]) == 'gameSuspended'
+    check_status_index(chain, games)
+    assert chain.query('get_approved_games') == status_index(chain, 'gameApproved')
+
+
+def test_admin_index_after_remove_admin():
+    chain, games = populate(2)
+    admins = [address('hx', 0x3000 + number) for number in range(3)]
+    for admin in admins:
+        expect(chain.call('set_admin', admin))
+    expect(chain.call('set_admin', admins[0]))
+    assert chain.query('get_admin') == [OWNER] + admins
+    expect(chain.call('remove_admin', admins[0]))
+    # The last admin takes the place of the removed one.
+    assert chain.query('get_admin') == [OWNER, admins[2], admins[1]]
+    assert chain.call('remove_admin', admins[0]).error.message == 'Invalid address: not in list'
+    assert chain.call('set_game_status', 'gameSuspended', games[0], sender=admins[0]).error.message == \
+        'Sender not an admin'
+    expect(chain.call('set_game_status', 'gameSuspended', games[0], sender=admins[2]))
+    expect(chain.call('remove_admin', admins[1]))
+    expect(chain.call('set_admin', admins[0]))
+    assert chain.query('get_admin') == [OWNER, admins[2], admins[0]]
+    expect(chain.call('set_game_status', 'gameApproved', games[0], sender=admins[0]))
@@ -0,0 +1,34 @@
+from harness.benchmark import expect, populate
+
+
+def addresses(page: dict) -> list:
+    return [game['scoreAddress'] for game in page['games']]
+
+
+def test_pages_follow_submission_order():
+    chain, games = populate(5)
+    first = chain.query('get_score_list_page', 0, 2)
+    second = chain.query('get_score_list_page', 2, 2)
+    last = chain.query('get_score_list_page', 4, 2)
+    assert first['total'] == 5
+    assert addresses(first) + addresses(second) + addresses(last) == games
+    assert chain.query('get_score_list_page', 5, 2) == {'total': 5, 'games': []}
+    assert chain.call('get_score_list_page', 0, 101).error.message == \
+        'Offset must not be negative and limit must be between 1 and 100'
+    assert chain.call('get_score_list_page', 0, 10, 'unknown').error.message == 'Invalid status'
+
+
+def test_status_pages_after_status_change():
+    chain, games = populate(4)
+    expect(chain.call('set_game_status', 'gameSuspended', games[0]))
+    # The last approved game takes the place of the suspended one.
+    approved = chain.query('get_approved_games_page', 0, 10)
+    assert approved['total'] == 3
+    assert addresses(approved) == [games[3], games[1], games[2]]
+    suspended = chain.query('get_score_list_page', 0, 10, 'gameSuspended')
+    assert addresses(suspended) == [games[0]]
+    assert suspended['games'][0]['status'] == 'gameSuspended'
+    assert addresses(chain.query('get_score_list_page', 0, 10)) == games
+    dashboard = chain.query('get_games_dashboard', 0, 1, 2)
+    assert dashboard['total'] == 3
+    assert [game['scoreAddress'] for game in dashboard['games']] == [games[1], games[2]]
@@ -0,0 +1,39 @@
+import inspect
+import re
+
+from harness.benchmark import MULTIPLIER, ROULETTE, approve_game, expect, submit_game
+from harness.chain import load_score_class
+
+
+def test_every_recorded_method_is_listed():
+    score_class = load_score_class()
+    recorded = set(re.findall(r"_record_perf\('(\w+)'", inspect.getsource(score_class)))
+    # settle_excess and record_excess record through _settle_excess.
+    assert recorded | {'settle_excess', 'record_excess'} == set(score_class.PERF_METHODS)
+
+
+def test_counters_count_calls_and_iterations(populated):
+    chain, games = populated
+    expect(chain.call('toggle_perf_counters'))
+    expect(chain.call('accumulate_daily_wagers', games[0], MULTIPLIER, sender=ROULETTE))
+    expect(chain.call('set_maximum_loss', 500 * MULTIPLIER))
+    expect(chain.call('set_game_maximum_loss', games[0], 50 * MULTIPLIER))
+    expect(chain.call('set_maximum_payout', games[1], 50 * MULTIPLIER))
+    game, owner, _ = submit_game(chain, 10)
+    approve_game(chain, game, owner)
+    chain.advance_days()
+    expect(chain.call('record_excess', sender=ROULETTE))
+
+    counters = chain.query('get_perf_counters')
+    assert counters['accumulate_daily_wagers'] == {'calls': 1, 'iterations': 1}
+    assert counters['set_maximum_loss'] == {'calls': 1, 'iterations': 0}
+    assert counters['set_game_maximum_loss'] == {'calls': 1, 'iterations': 1}
+    assert counters['set_maximum_payout'] == {'calls': 2, 'iterations': 2}
+    assert counters['submit_game_proposal'] == {'calls': 1, 'iterations': 0}
+    assert counters['set_game_ready'] == {'calls': 1, 'iterations': 1}
+    assert counters['set_game_status'] == {'calls': 2, 'iterations': 2}
+    assert counters['record_excess'] == {'calls': 1, 'iterations': 6}
+
+    expect(chain.call('toggle_perf_counters'))
+    expect(chain.call('set_maximum_loss', 500 * MULTIPLIER))
+    assert chain.query('get_perf_counters')['set_maximum_loss']['calls'] == 1
@@ -0,0 +1,57 @@
+import json
+
+from harness.benchmark import MULTIPLIER, expect, game_data
+from harness.chain import OWNER, LocalChain, address
+
+
+def submit(chain: LocalChain, number: int, **fields):
+    game = address('cx', 0x2000 + number)
+    owner = address('hx', 0x2000 + number)
+    chain.register_game(game, owner)
+    data = dict(json.loads(game_data(game, owner)), **fields)
+    return game, chain.call('submit_game_proposal', json.dumps(data), sender=owner, value=50 * MULTIPLIER)
+
+
+def test_bet_limits_are_stored_as_ints():
+    chain = LocalChain()
+    expect(chain.call('set_super_admin', OWNER))
+    game, result = submit(chain, 0, minBet=1.5e17, maxBet='200000000000000000000')
+    expect(result)
+    assert chain.score._min_bets[game] == 15 * MULTIPLIER // 100
+    assert chain.score._max_bets[game] == 200 * MULTIPLIER
+    # Limits which are not numbers are still accepted, like before the typed
+    # fields, but not stored.
+    game, result = submit(chain, 1, maxBet='unlimited')
+    expect(result)
+    assert chain.score._min_bets[game] == MULTIPLIER // 10
+    assert chain.score._max_bets[game] == 0
+    assert json.loads(chain.query('get_proposal_data', game))['maxBet'] == 'unlimited'
+    _, result = submit(chain, 2, minBet=MULTIPLIER // 100)
+    assert result.error.message == f'{MULTIPLIER // 100} is less than 0.1 ICX'
+
+
+def test_registry_and_duplicate_submission():
+    chain = LocalChain()
+    expect(chain.call('set_super_admin', OWNER))
+    games = [submit(chain, number)[0] for number in range(3)]
+    chain.timestamp += 10 ** 6
+    late, result = submit(chain, 3)
+    expect(result)
+    assert chain.query('get_proposal_submission', games[1]) == {'index': 1, 'timestamp': chain.timestamp - 10 ** 6}
+    assert chain.query('get_proposal_submission', late) == {'index': 3, 'timestamp': chain.timestamp}
+    unknown = address('cx', 0x2fff)
+    for method in ('get_proposal_submission', 'get_maximum_payout'):
+        assert chain.call(method, unknown).error.message == 'Game has not been submitted.'
+    assert chain.call('set_maximum_payout', unknown, MULTIPLIER).error.message == 'Game has not been submitted.'
+
+    # Duplicates are refused before the owner of the game is looked up, at
+    # a cost which doesn't grow with the number of proposals.
+    duplicate = submit(chain, 0)[1]
+    assert duplicate.error.message == 'Already listed scoreAddress in the proposal list.'
+    data = game_data(games[0], address('hx', 0x2001))
+    assert chain.call('submit_game_proposal', data, sender=address('hx', 0x2001),
+                      value=50 * MULTIPLIER).error.message == 'Already listed scoreAddress in the proposal list.'
+    for number in range(4, 30):
+        expect(submit(chain, number)[1])
+    assert submit(chain, 0)[1].ops == duplicate.ops
+    assert len(chain.query('get_score_list')) == 30
@@ -0,0 +1,29 @@
+import json
+
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate
+
+
+def test_range_caps():
+    chain, games = populate(2)
+    assert chain.call('get_daily_wagers_range', -31, 0).error.message == \
+        'At most 31 days can be queried at once'
+    assert chain.call('get_daily_payouts_range', 0, -1).error.message == \
+        'end_day must not be before start_day'
+    many = json.dumps([f'cx{number:040x}' for number in range(101)])
+    assert chain.call('get_games_excess_range', -1, 0, many).error.message == \
+        'At most 100 games can be queried at once'
+    assert chain.query('get_daily_wagers_range', 0, 0, json.dumps([str(games[0])])) == \
+        {str(chain.day): {str(games[0]): f'{10 * MULTIPLIER}'}}
+
+
+def test_excess_range_reads_snapshots():
+    chain, games = populate(3)
+    expect(chain.call('accumulate_daily_payouts', games[1], 30 * MULTIPLIER, sender=ROULETTE))
+    chain.advance_days()
+    expect(chain.call('record_excess', sender=ROULETTE))
+    expect(chain.call('accumulate_daily_wagers', games[0], 5 * MULTIPLIER, sender=ROULETTE))
+    excess = chain.query('get_games_excess_range', -1, 0)
+    settled = chain.query('get_excess_snapshot', -1)['games']
+    assert excess[str(chain.day - 1)] == settled
+    assert settled[str(games[1])] == f'{-20 * MULTIPLIER}'
+    assert excess[str(chain.day)] == chain.query('get_todays_games_excess')
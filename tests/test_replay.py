@@ -0,0 +1,46 @@
+import json
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from harness.replay import U_SECONDS_DAY, Events, Replay, main, replay_on_chain  # noqa: E402
+
+MULTIPLIER = 10 ** 18
+FIRST_DAY = 19000
+
+
+def random_rows(seed: int) -> list:
+    generator = random.Random(seed)
+    rows = []
+    for _ in range(150):
+        timestamp = (FIRST_DAY + generator.randrange(4)) * U_SECONDS_DAY + generator.randrange(U_SECONDS_DAY)
+        wager = generator.randrange(1, 10) * MULTIPLIER
+        payout = generator.choice((0, 0, generator.randrange(1, 30))) * MULTIPLIER
+        rows.append((timestamp, f'game{generator.randrange(4)}', wager, payout))
+    return rows
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+def test_sweep_matches_chain(seed):
+    events = Events(random_rows(seed))
+    candidates = [(30 * MULTIPLIER, 25 * MULTIPLIER), (60 * MULTIPLIER, 20 * MULTIPLIER),
+                  (1000 * MULTIPLIER, 1000 * MULTIPLIER)]
+    result = Replay(events).sweep([loss for loss, _ in candidates], [payout for _, payout in candidates])
+    for candidate, (max_loss, max_payout) in enumerate(candidates):
+        on_chain = replay_on_chain(events, max_loss, max_payout)
+        assert {game: timestamp for game, timestamp, _ in result.suspensions(candidate)} == on_chain['suspended']
+        assert np.array_equal(result.daily_share[candidate], on_chain['daily_share'])
+    assert result.suspensions(0)
+    assert not result.suspensions(2)
+
+
+def test_check_option(tmp_path, capsys):
+    path = tmp_path / 'events.jsonl'
+    path.write_text(''.join(json.dumps(dict(zip(('timestamp', 'game', 'wager', 'payout'), row))) + '\n'
+                            for row in random_rows(3)))
+    main([str(path), '--max-loss', '3e19', '1e21', '--max-payout', '2.5e19', '--check'])
+    output = capsys.readouterr().out
+    assert '150 events, 4 games, 4 days, 2 candidates' in output
+    assert 'check: suspensions match, largest daily share difference 0' in output
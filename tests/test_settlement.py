@@ -0,0 +1,38 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect, populate
+
+
+def test_chunked_settlement_matches_record_excess():
+    chunked, games = populate(7)
+    recorded, _ = populate(7)
+    for chain in (chunked, recorded):
+        expect(chain.call('accumulate_daily_payouts', games[2], 4 * MULTIPLIER, sender=ROULETTE))
+        chain.advance_days()
+    amounts = []
+    while True:
+        amounts.append(expect(chunked.call('settle_excess', 3, sender=ROULETTE)).value)
+        if amounts[-1] != -1:
+            break
+    assert amounts[:-1] == [-1, -1]
+    assert amounts[-1] == expect(recorded.call('record_excess', sender=ROULETTE)).value
+    assert chunked.query('get_excess_snapshot', -1) == recorded.query('get_excess_snapshot', -1)
+    assert chunked.query('get_excess_settlement')['day'] == 0
+
+
+def test_accumulation_during_settlement():
+    chunked, games = populate(6)
+    recorded, _ = populate(6)
+    chunked.advance_days()
+    recorded.advance_days()
+    # Games are settled from the last one down, so games[0] is still to be
+    # settled and games[-1] is settled when the accumulations come in.
+    assert expect(chunked.call('settle_excess', 2, sender=ROULETTE)).value == -1
+    assert chunked.query('get_excess_settlement')['remaining'] == 4
+    expect(recorded.call('record_excess', sender=ROULETTE))
+    for chain in (chunked, recorded):
+        expect(chain.call('accumulate_daily_wagers', games[0], 3 * MULTIPLIER, sender=ROULETTE))
+        expect(chain.call('accumulate_daily_payouts', games[-1], MULTIPLIER, sender=ROULETTE))
+    amount = expect(chunked.call('settle_excess', 10, sender=ROULETTE)).value
+    assert amount == 6 * 10 * MULTIPLIER * 20 // 100
+    assert chunked.query('get_excess_snapshot', -1) == recorded.query('get_excess_snapshot', -1)
+    for getter in ('get_excess', 'get_todays_games_excess', 'get_daily_wagers', 'get_daily_payouts'):
+        assert chunked.query(getter) == recorded.query(getter)
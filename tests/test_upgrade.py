@@ -0,0 +1,96 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, approve_game, expect, submit_game
+from harness.chain import OWNER, LocalChain, load_score_class
+
+
+def play(chain: LocalChain, games: int, days: int) -> list:
+    """Approves the games and has them wager and pay out for a few days."""
+    expect(chain.call('set_roulette_score', ROULETTE))
+    expect(chain.call('set_super_admin', OWNER))
+    expect(chain.call('set_game_developers_share', 20))
+    expect(chain.call('set_maximum_loss', 1000 * MULTIPLIER))
+    expect(chain.call('set_new_div_changing_time', chain.timestamp))
+    addresses = []
+    for number in range(games):
+        game, owner, _ = submit_game(chain, number)
+        approve_game(chain, game, owner)
+        addresses.append(game)
+    for day in range(days):
+        for number, game in enumerate(addresses):
+            # The second game is idle on the day of the upgrade.
+            if number == 1 and day == days - 1:
+                continue
+            expect(chain.call('accumulate_daily_wagers', game, (number + 1) * MULTIPLIER, sender=ROULETTE))
+            expect(chain.call('accumulate_daily_payouts', game, MULTIPLIER // 2, sender=ROULETTE))
+        if day < days - 1:
+            chain.advance_days()
+            expect(chain.call('record_excess', sender=ROULETTE))
+    return addresses
+
+
+def test_upgrade_from_baseline(baseline):
+    chain = LocalChain(baseline)
+    games = play(chain, 4, 10)
+    getters = {getter: chain.query(getter) for getter in
+               ('get_approved_games', 'get_excess', 'get_daily_wagers', 'get_daily_payouts',
+                'get_todays_games_excess')}
+    daily = [(chain.query('get_daily_wagers', -day), chain.query('get_daily_payouts', -day)) for day in range(7)]
+
+    expect(chain.update(load_score_class()))
+    assert chain.query('get_migration_status')['schemaVersion'] == chain.score.SCHEMA_VERSION
+    for getter, value in getters.items():
+        assert chain.query(getter) == value
+    for game in games:
+        wagers = sum(int(day[0][str(game)]) for day in daily)
+        payouts = sum(int(day[1][str(game)]) for day in daily)
+        stats = chain.query('get_rolling_stats', game, 7)
+        assert (stats['wagers'], stats['payouts']) == (f'{wagers}', f'{payouts}')
+    assert chain.query('get_proposal_submission', games[-1])['index'] == len(games) - 1
+
+
+def test_upgrade_migrating_in_chunks(baseline, monkeypatch):
+    score_class = load_score_class()
+    monkeypatch.setattr(score_class, 'MIGRATION_CHUNK', 2)
+    chain = LocalChain(baseline)
+    games = play(chain, 5, 3)
+    approved = chain.query('get_approved_games')
+    excess = chain.query('get_excess')
+
+    expect(chain.update(score_class))
+    assert chain.query('get_migration_status')['migratedGames'] == 2
+    assert chain.call('get_games_dashboard').error.message == 'Storage migration in progress.'
+    # A wager and payout of the same amount leave the excess as it is.
+    expect(chain.call('accumulate_daily_wagers', games[-1], MULTIPLIER, sender=ROULETTE))
+    expect(chain.call('accumulate_daily_payouts', games[-1], MULTIPLIER, sender=ROULETTE))
+    assert chain.query('get_excess') == excess
+
+    chain.advance_days()
+    amount = -1
+    while amount == -1:
+        amount = expect(chain.call('settle_excess', 2, sender=ROULETTE)).value
+    # The game migrated ahead of the others moved up in the status index.
+    assert sorted(map(str, chain.query('get_approved_games'))) == sorted(map(str, approved))
+    assert amount == excess
+    assert chain.query('get_excess') == 0
+
+
+def test_baseline_reads_during_migration(baseline, monkeypatch):
+    score_class = load_score_class()
+    monkeypatch.setattr(score_class, 'MIGRATION_CHUNK', 2)
+    chain = LocalChain(baseline)
+    games = play(chain, 5, 3)
+    calls = [('get_approved_games', ()), ('get_excess', ()), ('get_daily_wagers', ()), ('get_daily_payouts', ()),
+             ('get_daily_wagers', (-1,)), ('get_games_excess', (-1,)), ('get_todays_games_excess', ())]
+    calls += [(getter, (game,)) for getter in ('get_revshare_wallet_address', 'get_maximum_payout')
+              for game in games]
+    before = [chain.query(getter, *args) for getter, args in calls]
+
+    expect(chain.update(score_class))
+    assert [chain.query(getter, *args) for getter, args in calls] == before
+
+    # The rollover migrates a chunk per call before settling every game.
+    chain.advance_days()
+    amounts = []
+    while not amounts or amounts[-1] == -1:
+        amounts.append(expect(chain.call('record_excess', sender=ROULETTE)).value)
+    assert amounts[:-1] == [-1]
+    assert amounts[-1] == before[1]
@@ -0,0 +1,33 @@
+from harness.benchmark import MULTIPLIER, ROULETTE, expect
+
+
+def test_game_maximum_loss_overrides_the_global_one(populated):
+    chain, games = populated
+    expect(chain.call('toggle_apply_watch_dog_method'))
+    expect(chain.call('set_game_maximum_loss', games[0], 5 * MULTIPLIER))
+    assert chain.query('get_game_maximum_loss', games[0]) == 5 * MULTIPLIER
+    assert chain.query('get_game_maximum_loss', games[1]) == 1000 * MULTIPLIER
+
+    # Each game wagered 10 ICX today, so a payout of 15 ICX loses 5 ICX.
+    result = expect(chain.call('accumulate_daily_payouts', games[0], 15 * MULTIPLIER, sender=ROULETTE))
+    assert result.value is False
+    assert chain.query('get_game_status', games[0]) == 'gameSuspended'
+    assert 'GameSuspended' in [name for name, _ in result.events]
+    assert expect(chain.call('accumulate_daily_payouts', games[1], 15 * MULTIPLIER, sender=ROULETTE)).value
+    assert chain.query('get_game_status', games[1]) == 'gameApproved'
+
+
+def test_global_maximum_loss_keeps_game_overrides(populated):
+    chain, games = populated
+    expect(chain.call('toggle_apply_watch_dog_method'))
+    expect(chain.call('set_game_maximum_loss', games[0], 50 * MULTIPLIER))
+    expect(chain.call('set_maximum_loss', 2 * MULTIPLIER))
+    assert chain.query('get_game_maximum_loss', games[0]) == 50 * MULTIPLIER
+    assert chain.query('get_game_maximum_loss', games[1]) == 2 * MULTIPLIER
+    assert expect(chain.call('accumulate_daily_payouts', games[0], 40 * MULTIPLIER, sender=ROULETTE)).value
+    assert not expect(chain.call('accumulate_daily_payouts', games[1], 12 * MULTIPLIER, sender=ROULETTE)).value
+
+    # Back to the global maximum loss, of which games[0] has used 30 ICX.
+    expect(chain.call('set_game_maximum_loss', games[0], 0))
+    assert chain.query('get_game_maximum_loss', games[0]) == 2 * MULTIPLIER
+    assert not expect(chain.call('accumulate_daily_payouts', games[0], MULTIPLIER, sender=ROULETTE)).value